@@ -0,0 +1,33 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+import pygame
+from modules.audio_manager import MIXER_BUFFER, AudioManager
+
+def measure(buffer, trials):
+    """Open the mixer with this buffer size and return the AudioManager's latency samples in ms."""
+    audio = AudioManager(buffer=buffer)
+    audio.init()
+    try:
+        return np.asarray(audio.measure_latency(trials)) * 1000.0
+    finally:
+        audio.shutdown()
+        pygame.mixer.quit()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure SFX trigger-to-output latency for several mixer buffer sizes.")
+    parser.add_argument("--buffers", type=int, nargs="+", default=[256, MIXER_BUFFER, 1024, 4096], help="mixer buffer sizes in samples")
+    parser.add_argument("--trials", type=int, default=20, help="clicks per buffer size (default: 20)")
+    args = parser.parse_args()
+
+    pygame.init()
+    for buffer in args.buffers:
+        latencies = measure(buffer, args.trials)
+        p50, p95 = np.percentile(latencies, [50, 95])
+        marker = "  <- game default" if buffer == MIXER_BUFFER else ""
+        print(f"buffer {buffer:5d}: p50 {p50:6.1f} ms, p95 {p95:6.1f} ms{marker}")
+    pygame.quit()
@@ -0,0 +1,131 @@
+import argparse
+import copy
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import cv2
+import numpy as np
+from bgImage_Processing import draw_bounding_boxes_and_save
+from levels.level_data import (DESIGN_HEIGHT, DESIGN_WIDTH, assets_dir, level_files, levels_dir, load_level_file,
+                               normalize_coords, save_level_file)
+
+# Proposals are only a starting point: review the overlays and fix the boxes in the level files
+BACKGROUND_SIGMA = 20  # Blur (px at 800x600) that gives the local ground colour a zone stands out from
+DARK_THRESHOLD = 12  # L* below the local ground: stone shadows and crater floors
+GLOW_THRESHOLD = 8  # a* (red) above the local ground: lava-filled pitholes
+GROUND_TOP = 0.2  # Fraction of the image height treated as sky and ignored
+STONE_AREA = (0.0008, 0.04)  # Min / max blob area as a fraction of the image (smaller ones are pebbles)
+STONE_ASPECT = (0.4, 4.0)
+PITHOLE_MIN_BOX = 0.01  # Pitholes are wide, flat, well-filled blobs covering at least this much of the image
+PITHOLE_ASPECT = (2.0, 8.0)
+PITHOLE_FILL = 0.45  # Blob area / box area (an ellipse is ~0.79, a thin horizon strip is far less)
+MAX_STONES = 10
+MAX_PITHOLES = 4
+
+def find_regions(mask, contrast, ground_top):
+    """(x1, y1, x2, y2, area, score) for each blob in a mask, dropping ones in the sky or cut off by the frame."""
+    height, width = mask.shape
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, np.ones((3, 3), np.uint8))
+    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (9, 9)))
+    count, labels, stats, _ = cv2.connectedComponentsWithStats(mask)
+    sums = np.bincount(labels.ravel(), weights=contrast.ravel(), minlength=count)  # Contrast summed per blob
+    regions = []
+    for i in range(1, count):
+        x, y, w, h, area = stats[i]
+        if x == 0 or y <= ground_top or x + w >= width or y + h >= height:
+            continue
+        regions.append((x, y, x + w, y + h, int(area), float(sums[i])))
+    return regions
+
+def propose_zones(image):
+    """Stone and pithole boxes (pixels of this image) from a segmentation of dark and lava-red blobs."""
+    height, width = image.shape[:2]
+    image_area = width * height
+    lab = cv2.GaussianBlur(cv2.cvtColor(image, cv2.COLOR_BGR2LAB).astype(np.float32), (0, 0), 1.5)
+    ground = cv2.GaussianBlur(lab, (0, 0), BACKGROUND_SIGMA * width / DESIGN_WIDTH)
+    dark = ground[..., 0] - lab[..., 0]
+    glow = lab[..., 1] - ground[..., 1]
+    ground_top = int(height * GROUND_TOP)
+
+    stones, pitholes = [], []
+    for contrast, threshold in ((dark, DARK_THRESHOLD), (glow, GLOW_THRESHOLD)):
+        mask = np.where(contrast > threshold, 255, 0).astype(np.uint8)
+        for x1, y1, x2, y2, area, score in find_regions(mask, contrast, ground_top):
+            box_area = (x2 - x1) * (y2 - y1)
+            aspect = (x2 - x1) / (y2 - y1)
+            if (box_area >= PITHOLE_MIN_BOX * image_area and PITHOLE_ASPECT[0] <= aspect <= PITHOLE_ASPECT[1]
+                    and area >= PITHOLE_FILL * box_area):
+                pitholes.append((score, (x1, y1, x2, y2)))
+            elif (STONE_AREA[0] * image_area <= area <= STONE_AREA[1] * image_area
+                    and STONE_ASPECT[0] <= aspect <= STONE_ASPECT[1]):
+                stones.append((score, (x1, y1, x2, y2)))
+
+    # Keep the most contrasting blobs: a level only needs a handful of zones
+    stones = [box for _, box in sorted(stones, reverse=True)[:MAX_STONES]]
+    pitholes = [box for _, box in sorted(pitholes, reverse=True)[:MAX_PITHOLES]]
+    return stones, pitholes
+
+def annotate(path, preview_dir):
+    """Worker: propose zones for one background and save its review overlay; returns normalized boxes."""
+    start = time.perf_counter()
+    image = cv2.imread(path)
+    if image is None:
+        return {"path": path, "error": "could not read image"}
+    image = cv2.resize(image, (DESIGN_WIDTH, DESIGN_HEIGHT), interpolation=cv2.INTER_AREA)  # Same size the zones were hand-drawn at
+    stones, pitholes = propose_zones(image)
+    preview_path = os.path.join(preview_dir, os.path.splitext(os.path.basename(path))[0] + "_proposed.jpg")
+    draw_bounding_boxes_and_save(image, stones, pitholes, output_path=preview_path, show=False)
+    return {"path": path, "stone": normalize_coords(stones) if stones else [],
+            "pithole": normalize_coords(pitholes) if pitholes else [], "seconds": time.perf_counter() - start}
+
+def _init_worker():
+    cv2.setNumThreads(1)  # One image per process already uses every core
+
+def build_level(result, template):
+    """Level file contents for a background, with the rover, logo, sounds and facts taken from the template."""
+    stem = os.path.splitext(os.path.basename(result["path"]))[0]
+    level = copy.deepcopy(template)
+    level["name"] = stem.replace("_", " ").title()
+    level["background"] = os.path.relpath(os.path.abspath(result["path"]), assets_dir).replace(os.sep, "/")
+    level["zones"] = {"stone": result["stone"], "pithole": result["pithole"]}
+    return level
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Propose stone and pithole zones for a directory of Mars backgrounds.")
+    parser.add_argument("directory", help="directory of background images")
+    parser.add_argument("--pattern", default="*.png", help="background file pattern (default: *.png)")
+    parser.add_argument("--out", default=os.path.join(levels_dir, "proposed"), help="where to write level_<image>.json (default: levels/proposed)")
+    parser.add_argument("--previews", help="where to write the review overlays (default: <out>/previews)")
+    parser.add_argument("--template", help="level file to copy rover, logo, sounds and facts from (default: the first level)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes (default: one per core)")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.directory, args.pattern)))
+    if not paths:
+        sys.exit(f"No images matching {args.pattern} in {args.directory}")
+    template = load_level_file(args.template or level_files()[0])
+    preview_dir = args.previews or os.path.join(args.out, "previews")
+    os.makedirs(args.out, exist_ok=True)
+    os.makedirs(preview_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    written, busy = 0, 0.0
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        for result in pool.map(annotate, paths, [preview_dir] * len(paths)):
+            name = os.path.basename(result["path"])
+            if "error" in result:
+                print(f"{name}: skipped, {result['error']}")
+                continue
+            busy += result["seconds"]
+            level_path = os.path.join(args.out, f"level_{os.path.splitext(name)[0]}.json")
+            save_level_file(level_path, build_level(result, template))
+            written += 1
+            print(f"{name}: {len(result['stone'])} stones, {len(result['pithole'])} pitholes -> {level_path}")
+    elapsed = time.perf_counter() - start
+    print(f"Annotated {written}/{len(paths)} backgrounds in {elapsed:.2f}s with {args.workers} workers "
+          f"({written / elapsed:.1f} images/s, {busy / max(written, 1) * 1000:.0f} ms each)")
@@ -0,0 +1,108 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")  # Baking needs no window
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pygame
+from modules.asset_pack import PACK_FORMAT, UI_IMAGES, base_dir, pack_dir, pack_key
+from levels.level_data import load_levels
+
+ALIGNMENT = 64  # Start every image on a cache-line boundary in pack.bin
+BAKE_VERSION = 1  # Bump when baking changes (scaling, layout) so existing packs are rebuilt
+
+def collect_images():
+    """(path, width, height, alpha) for every image the game scales at runtime."""
+    images = []
+    for level in load_levels():  # Only asset paths are needed, so the unscaled definitions will do
+        images.append((level["background"], None, None, False))  # Scaled to the target resolution
+        images.append((level["rover"], 120, 120, True))
+        images.append((level["logo"], 120, 120, True))
+    for name, width, height in UI_IMAGES:
+        images.append((os.path.join(base_dir, 'assets', name), width, height, True))
+    return images
+
+def inputs_digest(width, height, images):
+    """Hash of everything a pack is built from: the baker version, target size and each image's bytes and size."""
+    digest = hashlib.sha256(json.dumps([BAKE_VERSION, PACK_FORMAT, width, height]).encode())
+    file_digests = {}
+    for path, image_width, image_height, alpha in images:
+        if path not in file_digests:
+            with open(path, "rb") as f:
+                file_digests[path] = hashlib.sha256(f.read()).hexdigest()
+        rel_path = os.path.relpath(path, base_dir).replace(os.sep, "/")
+        digest.update(json.dumps([rel_path, file_digests[path], image_width, image_height, alpha]).encode())
+    return digest.hexdigest()
+
+def is_up_to_date(width, height, digest):
+    """Whether baked/<width>x<height> was built from exactly these inputs."""
+    try:
+        with open(os.path.join(pack_dir(width, height), "index.json")) as f:
+            return json.load(f).get("inputs") == digest
+    except (OSError, ValueError):
+        return False
+
+def bake(width, height, images=None, digest=None):
+    """Write baked/<width>x<height>/pack.bin and index.json; returns the pack size in bytes."""
+    output_dir = pack_dir(width, height)
+    os.makedirs(output_dir, exist_ok=True)
+    if images is None:
+        images = collect_images()
+
+    entries = {}
+    offset = 0
+    with open(os.path.join(output_dir, "pack.bin"), "wb") as pack:
+        for path, image_width, image_height, alpha in images:
+            if image_width is None:
+                image_width, image_height = width, height
+            key = pack_key(path, image_width, image_height, alpha)
+            if key in entries:
+                continue  # Levels share rovers and logos
+
+            # Same load -> convert -> smoothscale steps as AssetManager.load_image()
+            surface = pygame.image.load(path)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            surface = pygame.transform.smoothscale(surface, (image_width, image_height))
+            pixels = pygame.image.tobytes(surface, PACK_FORMAT)
+
+            padding = -offset % ALIGNMENT
+            pack.write(b"\0" * padding)
+            offset += padding
+            pack.write(pixels)
+            entries[key] = {"offset": offset, "nbytes": len(pixels), "size": [image_width, image_height]}
+            offset += len(pixels)
+
+    index = {"resolution": [width, height], "format": PACK_FORMAT, "entries": entries,
+             "inputs": digest or inputs_digest(width, height, images)}
+    with open(os.path.join(output_dir, "index.json"), "w") as f:
+        json.dump(index, f, indent=2)
+    return offset
+
+def parse_resolution(text):
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bake pre-scaled, display-format asset packs for the Mars game.")
+    parser.add_argument("resolutions", nargs="+", type=parse_resolution, help="Target resolutions, e.g. 1920x1080 3840x2160")
+    parser.add_argument("--force", action="store_true", help="rebake packs even if their inputs are unchanged")
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((1, 1), 0, 32)  # 32-bit display so convert() matches PACK_FORMAT
+
+    images = collect_images()
+    for width, height in args.resolutions:
+        start = time.perf_counter()
+        digest = inputs_digest(width, height, images)
+        if not args.force and is_up_to_date(width, height, digest):
+            print(f"{width}x{height} is up to date -> {pack_dir(width, height)}")
+            continue
+        size = bake(width, height, images, digest)
+        print(f"Baked {width}x{height}: {size / (1024 * 1024):.1f} MB in {time.perf_counter() - start:.2f}s -> {pack_dir(width, height)}")
+
+    pygame.quit()
@@ -0,0 +1,155 @@
+import argparse
+import contextlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+# Headless: no window and no sound card needed
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")  # Keep stdout pure JSON
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))  # Shared hand_tracking and frame_timing packages
+
+import numpy as np
+import pygame
+import main as game
+from frame_timing import StageLog, StageTimer, trace
+from modules.frame_source import FileFrameSource
+from modules.startup_profile import StartupProfiler
+
+def decode_to_npy(video_path, npy_path, max_frames=None):
+    """Decode a video once into an (N, H, W, 3) uint8 .npy so benchmarks can skip decoding."""
+    import cv2
+    video = cv2.VideoCapture(video_path)
+    frames = []
+    while max_frames is None or len(frames) < max_frames:
+        ret, frame = video.read()
+        if not ret:
+            break
+        frames.append(frame)
+    video.release()
+    if not frames:
+        raise ValueError(f"{video_path}: no frames could be decoded")
+    np.save(npy_path, np.stack(frames))
+    return len(frames)
+
+def git_commit():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(args):
+    source = FileFrameSource(args.source, fps=args.source_fps, loop=True)
+    display_size = tuple(args.resolution)
+
+    profiler = StartupProfiler()
+    game.init_game(profiler, frame_source=source, display_size=display_size, replay_path=args.replay, adaptive_inference=args.adaptive_inference, hand_roi=args.hand_roi)
+    startup_time = time.perf_counter() - profiler.start
+    game.webcam_enabled = args.preview  # The button toggles this in the real game
+    game.PREVIEW_REFRESH_HZ = args.preview_hz or None
+    game.timing_hud_enabled = args.hud
+
+    timing_log = StageLog(args.timing_log) if args.timing_log else None
+    frame_timer = StageTimer(history=args.frames, log=timing_log)
+    game.hand_tracker.timer = StageTimer(history=args.frames)
+
+    if args.trace:
+        trace.start_trace(args.trace)
+    game.hand_tracker.start(game.frame_bus)
+    wall_start = time.perf_counter()
+    simulated_time = game.main_game(max_frames=args.frames, uncapped=True, timer=frame_timer, frame_time=args.frame_time,
+                                   dirty_rects=args.dirty_rects)
+    wall_time = time.perf_counter() - wall_start
+    game.hand_tracker.stop()
+    trace_events = trace.stop_trace()
+    game.level_prefetcher.shutdown()
+    game.audio.shutdown()
+    if timing_log is not None:
+        timing_log.close()
+
+    frames = frame_timer.frame_count()
+    report = {
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "config": {
+            "source": os.path.basename(args.source),
+            "source_fps": args.source_fps,
+            "replay": os.path.basename(args.replay) if args.replay else None,
+            "frames": args.frames,
+            "resolution": list(display_size),
+            "preview": args.preview,
+            "preview_hz": args.preview_hz,
+            "dirty_rects": args.dirty_rects,
+            "adaptive_inference": args.adaptive_inference,
+            "hand_roi": args.hand_roi,
+            "frame_time": args.frame_time,
+            "hud": args.hud,
+            "timing_log": os.path.basename(args.timing_log) if args.timing_log else None,
+            "trace": os.path.basename(args.trace) if args.trace else None,
+        },
+        "startup_ms": round(startup_time * 1000, 1),
+        "frames": frames,
+        "wall_time_s": round(wall_time, 3),
+        "fps": round(frames / wall_time, 1) if wall_time > 0 else 0.0,
+        "simulated_s": round(simulated_time, 3),
+        "simulation_speed": round(simulated_time / wall_time, 2) if wall_time > 0 else 0.0,
+        "stages_ms": frame_timer.summary(),
+        "instrumentation_overhead": round(frame_timer.overhead(), 4),
+        "instrumentation_ms_per_frame": round(frame_timer.overhead() * frame_timer.total_frame_time * 1000 / max(frame_timer.frames_ended, 1), 4),
+        "tracker_stages_ms": game.hand_tracker.timer.summary(),
+        "camera_reads_per_frame": round(game.frame_bus.reads_per_rendered_frame(), 3),
+        "inferences": game.hand_tracker.inferences,
+        "extrapolation_rate": round(game.hand_tracker.extrapolation_rate(), 3),
+        "roi_inferences": game.hand_tracker.roi_inferences,
+        "roi_misses": game.hand_tracker.roi_misses,
+        "trace_events": trace_events,
+        "asset_cache": game.assets.stats(),
+    }
+
+    game.cap.release()
+    game.close_tracker()
+    pygame.quit()
+    return report
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Mars game loop headless on recorded frames and report per-stage frame times as JSON.")
+    parser.add_argument("source", help="recorded video file, or a .npy of pre-decoded (N, H, W, 3) BGR frames")
+    parser.add_argument("--frames", type=int, default=600, help="game frames to render (default: 600)")
+    parser.add_argument("--resolution", type=int, nargs=2, default=(1280, 720), metavar=("WIDTH", "HEIGHT"), help="window size (default: 1280 720)")
+    parser.add_argument("--source-fps", type=float, default=30.0, help="camera rate to replay at; 0 reads as fast as possible (default: 30)")
+    parser.add_argument("--replay", metavar="PATH", help="replay recorded hand landmarks (.npz) instead of running MediaPipe")
+    parser.add_argument("--preview", action="store_true", help="draw the webcam preview, as with 'Enable Webcam Feed'")
+    parser.add_argument("--preview-hz", type=float, default=15, help="preview refresh rate; 0 refreshes on every camera frame (default: 15)")
+    parser.add_argument("--hand-roi", action="store_true", help="run MediaPipe on a native-resolution crop around the hands found in the previous frame; "
+                        "costs a second MediaPipe graph (memory, startup time) for the crops, and a hand entering outside the crop is "
+                        "only picked up by the full-frame pass every 15 frames (~0.5 s)")
+    parser.add_argument("--adaptive-inference", action="store_true", help="run MediaPipe every few frames and predict landmarks in between")
+    parser.add_argument("--frame-time", type=float, metavar="SECONDS", help="game time simulated per rendered frame instead of wall-clock time (e.g. 0.0167 to simulate 60 Hz as fast as possible)")
+    parser.add_argument("--dirty-rects", action="store_true", help="use the dirty-rectangle renderer")
+    parser.add_argument("--hud", action="store_true", help="draw the frame timing overlay")
+    parser.add_argument("--timing-log", metavar="PATH", help="stream per-frame stage timings to this .csv or .bin")
+    parser.add_argument("--trace", metavar="PATH", help="write a Chrome trace of the measured frames to this .json")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--save-npy", metavar="PATH", help="only decode the video source to this .npy and exit")
+    args = parser.parse_args()
+
+    if args.save_npy:
+        count = decode_to_npy(args.source, args.save_npy)
+        print(f"Decoded {count} frames -> {args.save_npy}")
+        sys.exit(0)
+
+    with contextlib.redirect_stdout(sys.stderr):  # Keep the game's log lines out of the JSON
+        report = run(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
@@ -1,7 +1,27 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
 import cv2
+import pygame
+from bake_assets import bake, collect_images, inputs_digest, is_up_to_date
+from modules.asset_pack import pack_dir
+from levels.level_data import DESIGN_HEIGHT, DESIGN_WIDTH, base_dir, level_files, load_levels, scale_levels
+
+# Display sizes the game is deployed at; each gets a baked asset pack (see bake_assets.py) that
+# AssetManager and LevelPrefetcher load backgrounds from instead of scaling the PNGs at runtime
+DISPLAY_SIZES = {"1080p": (1920, 1080), "1440p": (2560, 1440), "4k": (3840, 2160)}
+PREVIEW_VERSION = 1  # Bump when previews would change for the same inputs (drawing, format)
+preview_root = os.path.join(base_dir, 'baked', 'previews')
 
 # Function to draw bounding boxes around the selected objects and save the image
-def draw_bounding_boxes_and_save(image, stone_coords, pithole_coords, output_path="processed_image.jpg"):
+def draw_bounding_boxes_and_save(image, stone_coords, pithole_coords, output_path="processed_image.jpg", show=False):
     # Draw bounding boxes for stones
     for idx, (start_x, start_y, end_x, end_y) in enumerate(stone_coords, 1):
         # Draw rectangle for each stone
@@ -16,30 +36,108 @@ def draw_bounding_boxes_and_save(image, stone_coords, pithole_coords, output_pat
     cv2.imwrite(output_path, image)
     print(f"Processed image saved at {output_path}")
 
-    # Display the processed image with bounding boxes
+    # Display the processed image with bounding boxes (only when asked: the pipeline runs headless)
+    if not show:
+        return
     cv2.imshow("Processed Image", image)
     cv2.waitKey(0)
     cv2.destroyAllWindows()
 
-# Example usage
-# Replace these with the coordinates you picked manually
-# stone_coords = [
-#     (54, 180, 112, 202),  # Stone 1: top-left (100, 150), bottom-right (200, 250)
-#     (115, 239, 173, 266),  # Stone 2: top-left (300, 350), bottom-right (400, 450)
-#     (193, 344, 241, 368),
-#     (38, 387, 83, 410),
-#     (111, 507, 177, 538)
-# ]
-
-# pithole_coords = [
-#     (468, 279, 717, 333),  # Pithole 1: top-left (500, 550), bottom-right (600, 650)
-#     (437, 398, 720, 463)
-# ]
-stone_coords = [(483, 379, 582, 439), (63, 348, 149, 427), (445, 203, 623, 339), (624, 501, 706, 555)]
-pithole_coords = [(97, 488, 254, 545), (204, 426, 264, 442)]
-# Load the image
-image = cv2.imread('background2.png')
-image = cv2.resize(image, (800, 600))
-
-# Call the function to draw bounding boxes and save the image
-draw_bounding_boxes_and_save(image, stone_coords, pithole_coords, output_path="processed_mars_image_level2.jpg")
+def file_digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def plan_jobs(sizes, preview_dir):
+    """One asset-pack job per display size plus one annotated preview per level, each with an input hash."""
+    images = collect_images()
+    jobs = [{"kind": "pack", "size": (width, height), "images": images, "output": pack_dir(width, height),
+             "digest": inputs_digest(width, height, images)} for width, height in sizes]
+
+    # Previews show each level's zones at the 800x600 size they were annotated at
+    levels = load_levels()
+    source_digests = {}
+    for path, level in zip(level_files(), scale_levels(levels, DESIGN_WIDTH, DESIGN_HEIGHT)):
+        background = level["background"]
+        if background not in source_digests:
+            source_digests[background] = file_digest(background)
+        key = [PREVIEW_VERSION, source_digests[background], level["stone_coords"], level["pithole_coords"]]
+        jobs.append({"kind": "preview", "source": background, "size": (DESIGN_WIDTH, DESIGN_HEIGHT),
+                     "stone_coords": level["stone_coords"], "pithole_coords": level["pithole_coords"],
+                     "output": os.path.join(preview_dir, os.path.splitext(os.path.basename(path))[0] + ".jpg"),
+                     "digest": hashlib.sha256(json.dumps(key).encode()).hexdigest()})
+    return jobs
+
+def run_job(job):
+    """Worker: bake one asset pack or write one preview; returns (job kind, output, digest, seconds, images, pixels)."""
+    start = time.perf_counter()
+    width, height = job["size"]
+    if job["kind"] == "pack":
+        bake(width, height, job["images"], job["digest"])
+        sizes = [(w or width, h or height) for _, w, h, _ in job["images"]]
+        return job["kind"], job["output"], job["digest"], time.perf_counter() - start, len(sizes), sum(w * h for w, h in sizes)
+
+    image = cv2.resize(cv2.imread(job["source"]), (width, height), interpolation=cv2.INTER_AREA)
+    os.makedirs(os.path.dirname(job["output"]), exist_ok=True)
+    draw_bounding_boxes_and_save(image, job["stone_coords"], job["pithole_coords"], output_path=job["output"])
+    return job["kind"], job["output"], job["digest"], time.perf_counter() - start, 1, width * height
+
+def _init_worker():
+    cv2.setNumThreads(1)  # One job per process already uses every core
+    pygame.init()
+    pygame.display.set_mode((1, 1), 0, 32)  # Baking converts to a 32-bit display format, like bake_assets.py
+
+def parse_size(text):
+    if text.lower() in DISPLAY_SIZES:
+        return DISPLAY_SIZES[text.lower()]
+    width, height = text.lower().split("x")
+    return int(width), int(height)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bake asset packs for the deployed display sizes and render level zone previews.")
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=list(DISPLAY_SIZES.values()),
+                        help="display sizes as 1080p, 1440p, 4k or WIDTHxHEIGHT (default: all three)")
+    parser.add_argument("--previews", default=preview_root, help="preview directory (default: baked/previews)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes (default: one per core)")
+    parser.add_argument("--force", action="store_true", help="rebuild outputs even if they are up to date")
+    args = parser.parse_args()
+
+    manifest_path = os.path.join(args.previews, "manifest.json")
+    try:
+        with open(manifest_path) as f:
+            manifest = json.load(f)  # preview file name -> input hash it was built from
+    except (OSError, ValueError):
+        manifest = {}
+
+    def up_to_date(job):
+        if job["kind"] == "pack":
+            return is_up_to_date(*job["size"], job["digest"])  # Packs record their input hash in index.json
+        return os.path.exists(job["output"]) and manifest.get(os.path.basename(job["output"])) == job["digest"]
+
+    start = time.perf_counter()
+    jobs = plan_jobs(args.sizes, args.previews)
+    stale = [job for job in jobs if args.force or not up_to_date(job)]
+    plan_time = time.perf_counter() - start
+
+    busy, images, pixels = 0.0, 0, 0
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+            for kind, output, digest, seconds, job_images, job_pixels in pool.map(run_job, stale):
+                if kind == "preview":
+                    manifest[os.path.basename(output)] = digest
+                else:
+                    print(f"Baked {output}")
+                busy += seconds
+                images += job_images
+                pixels += job_pixels
+    finally:
+        os.makedirs(args.previews, exist_ok=True)
+        with open(manifest_path, "w") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)  # Keep what finished even if a job failed
+
+    elapsed = time.perf_counter() - start
+    packs = sum(job["kind"] == "pack" for job in stale)
+    print(f"{packs} packs and {len(stale) - packs} previews built, {len(jobs) - len(stale)} up to date "
+          f"in {elapsed:.2f}s with {args.workers} workers; hashing and planning took {plan_time * 1000:.0f} ms")
+    if stale:
+        print(f"Throughput: {images / elapsed:.1f} images/s, {pixels / 1e6 / elapsed:.1f} output MP/s "
+              f"({busy / len(stale) * 1000:.0f} ms of worker time per job)")
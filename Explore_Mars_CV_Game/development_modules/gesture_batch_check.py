@@ -0,0 +1,137 @@
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))  # Shared hand_tracking package
+
+import numpy as np
+import hand_tracking.gestures as hand_gestures
+from hand_tracking import (GESTURE_LABELS, GestureTracker, GestureTrackers, HandFrame, HandTracker, LandmarkRecorder,
+                           classify_gesture_codes, detect_hand_gesture)
+from hand_tracking.recording import ReplayHands, ReplayLandmarkList
+
+def synthetic_session(frames, seed=0):
+    """Random hand poses at ~30 fps with jitter, fist holds of varying length and repeated timestamps."""
+    rng = np.random.default_rng(seed)
+    landmarks = rng.random((frames, 21, 3)).astype(np.float32)
+
+    # Close the hand (thumb tip onto index tip) in random runs so fist holds start, fire and release
+    closed = np.zeros(frames, dtype=bool)
+    i = 0
+    while i < frames:
+        run = int(rng.integers(1, 120))
+        closed[i:i + run] = rng.random() < 0.4
+        i += run
+    landmarks[closed, hand_gestures.THUMB_TIP] = landmarks[closed, hand_gestures.INDEX_FINGER_TIP]
+
+    steps = rng.choice([0.0, 0.2, 1 / 30, 1 / 15, 2.0], size=frames, p=[0.05, 0.05, 0.7, 0.15, 0.05])
+    timestamps = 1000.0 + np.cumsum(steps)
+    return landmarks, timestamps
+
+def recorded_session(path):
+    """First hand of every frame in a landmark recording that has one."""
+    replay = ReplayHands(path)
+    has_hand = replay.hand_counts > 0
+    first_hand = replay.offsets[:-1][has_hand]
+    return replay.landmarks[first_hand], replay.timestamps[has_hand]
+
+def scalar_codes(landmarks, timestamps, smoothing_window=5, mirror_x=True, mirror_y=True):
+    """detect_hand_gesture() frame by frame, from a fresh state."""
+    hand_gestures.fist_held = False
+    hand_gestures.last_fist_time = 0
+    prev_gestures = []
+    codes = np.zeros(len(landmarks), dtype=np.int8)
+    for i, (points, now) in enumerate(zip(landmarks, timestamps)):
+        gesture = detect_hand_gesture(ReplayLandmarkList(points), prev_gestures, smoothing_window, mirror_x, mirror_y, now=float(now))
+        codes[i] = GESTURE_LABELS.index(gesture)
+    return codes
+
+def tracker_codes(landmarks, timestamps, smoothing_window=5, mirror_x=True, mirror_y=True):
+    """GestureTracker.update() frame by frame on the landmark arrays, from a fresh tracker."""
+    tracker = GestureTracker(smoothing_window, mirror_x, mirror_y)
+    return np.array([GESTURE_LABELS.index(tracker.update(points, now=float(now)))
+                     for points, now in zip(landmarks, timestamps)], dtype=np.int8)
+
+def write_recording(path, landmarks, timestamps):
+    """Save a one-hand session as a landmark recording, as --record would."""
+    recorder = LandmarkRecorder(path)
+    for points, now in zip(landmarks, timestamps):
+        recorder.record(HandFrame(points[None], ("Right",), np.ones(1, dtype=np.float32), float(now)))
+    recorder.close()
+
+def replay_codes(path, pace):
+    """Replay a recording through HandTracker and GestureTrackers with live capture times `pace` seconds apart."""
+    tracker = HandTracker(ReplayHands(path, loop=False), resize=None, flip=False, rotate=False)
+    trackers = GestureTrackers(smoothing_window=5, mirror_x=True, mirror_y=True)
+    frame = np.zeros((4, 4, 3), dtype=np.uint8)  # Ignored by the replay backend
+    codes = np.full(len(tracker.backend), -1, dtype=np.int8)
+    for i in range(len(codes)):
+        gestures = trackers.update(tracker.process(frame, capture_time=i * pace))
+        if gestures:
+            codes[i] = GESTURE_LABELS.index(gestures[0][2])
+    return codes
+
+def check_replay(landmarks, timestamps):
+    """Replaying one recording fast and slow must give the recorded session's gestures both times; True if so."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "session.npz")
+        write_recording(path, landmarks, timestamps)
+        expected = tracker_codes(landmarks, timestamps)
+        for pace in (1 / 240, 1 / 5):
+            mismatches = np.flatnonzero(replay_codes(path, pace) != expected)
+            if len(mismatches):
+                print(f"MISMATCH replay at {1 / pace:.0f} fps: {len(mismatches)} frames, first at {mismatches[0]}")
+                return False
+    return True
+
+def check(landmarks, timestamps):
+    """Compare batch and GestureTracker results with the scalar ones for every option combination; True if all match."""
+    ok = True
+    for smoothing_window in (1, 3, 5):
+        for mirror_x in (True, False):
+            for mirror_y in (True, False):
+                expected = scalar_codes(landmarks, timestamps, smoothing_window, mirror_x, mirror_y)
+                for name, classify in (("batch", classify_gesture_codes), ("tracker", tracker_codes)):
+                    actual = classify(landmarks, timestamps, smoothing_window, mirror_x, mirror_y)
+                    mismatches = np.flatnonzero(expected != actual)
+                    if len(mismatches):
+                        ok = False
+                        first = mismatches[0]
+                        print(f"MISMATCH {name} window={smoothing_window} mirror_x={mirror_x} mirror_y={mirror_y}: "
+                              f"{len(mismatches)} frames, first at {first} "
+                              f"(scalar {GESTURE_LABELS[expected[first]]}, {name} {GESTURE_LABELS[actual[first]]})")
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check classify_gesture_codes() and GestureTracker against detect_hand_gesture() frame for frame.")
+    parser.add_argument("--recording", help="landmark recording (.npz) to check instead of synthetic data")
+    parser.add_argument("--frames", type=int, default=20000, help="synthetic frames per seed (default: 20000)")
+    parser.add_argument("--seeds", type=int, default=3, help="synthetic sessions to check (default: 3)")
+    args = parser.parse_args()
+
+    if args.recording:
+        sessions = [recorded_session(args.recording)]
+    else:
+        sessions = [synthetic_session(args.frames, seed) for seed in range(args.seeds)]
+
+    all_ok = True
+    for landmarks, timestamps in sessions:
+        all_ok = check(landmarks, timestamps) and all_ok
+        all_ok = check_replay(landmarks, timestamps) and all_ok
+
+        start = time.perf_counter()
+        codes = classify_gesture_codes(landmarks, timestamps)
+        batch_time = time.perf_counter() - start
+        start = time.perf_counter()
+        scalar_codes(landmarks, timestamps)
+        scalar_time = time.perf_counter() - start
+
+        counts = Counter(GESTURE_LABELS[code] for code in codes)
+        print(f"{len(landmarks)} frames: batch {batch_time * 1000:.1f} ms, scalar {scalar_time * 1000:.1f} ms "
+              f"({scalar_time / max(batch_time, 1e-9):.0f}x), gestures {dict(counts)}")
+
+    print("OK: batch, tracker and replay match scalar" if all_ok else "FAILED")
+    sys.exit(0 if all_ok else 1)
@@ -0,0 +1,49 @@
+import argparse
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))  # Shared frame_timing package
+
+import numpy as np
+from modules.collision_check import ZoneIndex
+
+def random_zones(rng, count, width, height):
+    """count random (x1, y1, x2, y2) boxes on a width x height screen, some of them overlapping."""
+    x1 = rng.integers(0, width - 8, count)
+    y1 = rng.integers(0, height - 8, count)
+    x2 = np.minimum(x1 + rng.integers(4, 300, count), width)
+    y2 = np.minimum(y1 + rng.integers(4, 200, count), height)
+    return [tuple(int(v) for v in box) for box in zip(x1, y1, x2, y2)]
+
+def brute_force(index, point, analyzed_stones, analyzed_pitholes):
+    """Closest unanalyzed zone by scanning every zone (lowest id on ties)."""
+    analyzed = {"stone": analyzed_stones, "pithole": analyzed_pitholes}
+    candidates = [(ZoneIndex._distance_sq(zone.rect, *point), zone.zone_id)
+                  for zone in index.zones if zone.coords not in analyzed[zone.zone_type]]
+    return index.zones[min(candidates)[1]] if candidates else None
+
+def check(levels, queries, seed=0):
+    rng = np.random.default_rng(seed)
+    for _ in range(levels):
+        width, height = int(rng.integers(320, 3840)), int(rng.integers(240, 2160))
+        stones = random_zones(rng, int(rng.integers(0, 300)), width, height)
+        pitholes = random_zones(rng, int(rng.integers(0, 100)), width, height)
+        index = ZoneIndex(stones, pitholes)
+        for _ in range(queries):
+            fraction = rng.random()  # From nothing analyzed to everything analyzed
+            analyzed_stones = {box for box in stones if rng.random() < fraction}
+            analyzed_pitholes = {box for box in pitholes if rng.random() < fraction}
+            # Points on and off screen: the rover can be anywhere, zones can be far away
+            point = (int(rng.integers(-width // 2, width * 3 // 2)), int(rng.integers(-height // 2, height * 3 // 2)))
+            expected = brute_force(index, point, analyzed_stones, analyzed_pitholes)
+            found = index.nearest_unanalyzed(point, analyzed_stones, analyzed_pitholes)
+            assert found == expected, f"{point}: grid search found {found}, brute force {expected}"
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check ZoneIndex.nearest_unanalyzed() against a brute-force scan.")
+    parser.add_argument("--levels", type=int, default=200, help="random levels to build (default: 200)")
+    parser.add_argument("--queries", type=int, default=50, help="queries per level (default: 50)")
+    args = parser.parse_args()
+    check(args.levels, args.queries)
+    print(f"OK: nearest_unanalyzed matches brute force on {args.levels * args.queries} queries")
@@ -1,165 +1,201 @@
+import glob
+import hashlib
+import json
 import os
-from screeninfo import get_monitors
-
-# Detect screen size
-monitors = get_monitors()
-main_screen = monitors[0]
-screen_width, screen_height = main_screen.width, main_screen.height
+import pickle
+import re
+
+import numpy as np
+
+# Levels are levels/level_*.json, played in file name order. Zones are (x1, y1, x2, y2) boxes
+# normalized to 0..1 of the background, so one file works at every render resolution:
+#
+#   {"name": "Level 1", "background": "explore_mars_background.png", "rover": "rover1.png",
+#    "logo": "Logo.png", "sounds": {"bgm": "bgm.mp3", "success": "success.mp3", "miss": "miss.mp3"},
+#    "zones": {"stone": [[0.0675, 0.3, 0.14, 0.336666667], ...], "pithole": [...]},
+#    "facts": {"stone": ["..."], "pithole": ["..."]}}
+#
+# Asset names are relative to assets/. Scaled levels are cached in a __cache__/ next to the files.
+
+# Zones used to be annotated on an 800x600 copy of each background
+DESIGN_WIDTH, DESIGN_HEIGHT = 800, 600
+
+ZONE_TYPES = ("stone", "pithole")
+SOUND_NAMES = ("bgm", "success", "miss")
+CACHE_VERSION = 1  # Bump when the compiled level layout changes
+COORD_DECIMALS = 9  # Enough that rounding moves a box by well under SNAP_EPSILON even at 8K
+SNAP_EPSILON = 1e-4  # Pixels: absorbs that rounding so boxes land exactly where int() put them
 
 # Get base asset directory
-base_dir = os.path.dirname(os.path.abspath(__file__))
-base_dir = os.path.dirname(base_dir)  # One level up
+levels_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(levels_dir)  # One level up
 assets_dir = os.path.join(base_dir, 'assets')
 
-level_configs = [
-    {
-        "background": os.path.join(assets_dir, "explore_mars_background.png"),
-        "rover": os.path.join(assets_dir, "rover1.png"),
-        "logo": os.path.join(assets_dir, "Logo.png"),
-
-        "stone_coords": [
-            (int(54 * screen_width / 800), int(180 * screen_height / 600), int(112 * screen_width / 800), int(202 * screen_height / 600)),
-            (int(115 * screen_width / 800), int(239 * screen_height / 600), int(173 * screen_width / 800), int(266 * screen_height / 600)),
-            (int(193 * screen_width / 800), int(344 * screen_height / 600), int(241 * screen_width / 800), int(368 * screen_height / 600)),
-            (int(38 * screen_width / 800), int(387 * screen_height / 600), int(83 * screen_width / 800), int(410 * screen_height / 600)),
-            (int(111 * screen_width / 800), int(507 * screen_height / 600), int(177 * screen_width / 800), int(538 * screen_height / 600))
-        ],
-
-        "pithole_coords": [
-            (int(468 * screen_width / 800), int(279 * screen_height / 600), int(717 * screen_width / 800), int(333 * screen_height / 600)),
-            (int(437 * screen_width / 800), int(398 * screen_height / 600), int(720 * screen_width / 800), int(463 * screen_height / 600))
-        ],
-
-        "stone_facts": [
-            "Mars' rocks show evidence of volcanic activity, revealing the planet's active past.",
-            "Some Martian rocks are rich in silica, indicating potential for ancient microbial life.",
-            "Mars' rocks reveal traces of wind erosion, hinting at a once thicker atmosphere.",
-            "Clay and sulfate minerals found in rocks suggest past water on Mars.",
-            "Mars' basalt rocks formed from ancient lava flows, similar to Earth's oceanic crust.",
-            "Martian rocks show signs of radiation exposure, distinct from Earth's geology.",
-            "Some Martian stones contain minerals that formed in water, suggesting past habitable conditions.",
-            "Perseverance Rover is collecting Martian rock samples for future study on climate history.",
-            "Mars' Valles Marineris canyon was likely carved by ancient water flows, revealed by rock analysis.",
-            "Mars' surface shows rock formations shaped by wind, similar to Earth’s deserts."
-        ],
-
-        "pithole_facts": [
-            "Pitholes on Mars are created by volcanic activity and gas pockets beneath the surface.",
-            "Martian pitholes might have formed from collapsing lava tubes, creating depressions.",
-            "Some pitholes are shaped by ancient underground water erosion beneath Mars' surface.",
-            "Mars' pitholes can offer insights into the planet’s volcanic and atmospheric history.",
-            "Certain Martian pitholes were likely formed by meteorite impacts millions of years ago.",
-            "Mars' low gravity and lack of atmosphere led to unique pithole formations.",
-            "Pitholes near volcanoes indicate Mars’ volcanic history and changing surface.",
-            "Martian pitholes preserve clues about the planet’s early atmosphere and water.",
-            "Gas release from Mars’ surface created pitholes, helping shape the landscape.",
-            "Pitholes on Mars help scientists study its past climate and geological activity."
-        ],
-
-        "sounds": {
-            "bgm": os.path.join(assets_dir, "bgm.mp3"),
-            "success": os.path.join(assets_dir, "success.mp3"),
-            "miss": os.path.join(assets_dir, "miss.mp3")
-        }
-    },
-    {   
-        # level 2 setup
-        "background": os.path.join(assets_dir, "background2.png"),
-        "rover": os.path.join(assets_dir, "rover3.png"),
-        "logo": os.path.join(assets_dir, "Logo.png"),
-
-        "stone_coords": [
-            (int(483 * screen_width / 800), int(379 * screen_height / 600), int(582 * screen_width / 800), int(439 * screen_height / 600)),
-            (int(63 * screen_width / 800), int(348 * screen_height / 600), int(149 * screen_width / 800), int(427 * screen_height / 600)),
-            (int(445 * screen_width / 800), int(203 * screen_height / 600), int(623 * screen_width / 800), int(339 * screen_height / 600)),
-            (int(624 * screen_width / 800), int(501 * screen_height / 600), int(706 * screen_width / 800), int(555 * screen_height / 600)),
-        ],
-
-        "pithole_coords": [
-            (int(97 * screen_width / 800), int(488 * screen_height / 600), int(254 * screen_width / 800), int(545 * screen_height / 600)),
-            (int(204 * screen_width / 800), int(426 * screen_height / 600), int(264 * screen_width / 800), int(442 * screen_height / 600))
-        ],
-
-        "stone_facts": [
-            "Mars rocks are rich in iron, giving the planet its red color.",
-            "Some rocks on Mars were formed billions of years ago.",
-            "Mars may have had water long ago, according to some rocks.",
-            "Mars' volcanoes are giant, like Olympus Mons, the biggest volcano in the solar system.",
-            "Curiosity rover found signs of life in some Martian rocks.",
-            "Mars has rocks that look like Earth’s, formed by wind and water.",
-            "Mars has huge dust storms that can cover the entire planet.",
-            "Some rocks on Mars show signs of past underground water.",
-            "NASA’s Perseverance rover is collecting Martian rock samples.",
-            "Valles Marineris, a giant canyon on Mars, is the largest in the solar system."
-        ],
-
-        "pithole_facts": [
-            "Pitholes are holes in Mars' surface, made by old volcanic activity.",
-            "Some pitholes formed from gas bubbles deep underground.",
-            "Pitholes on Mars might have come from collapsing lava tubes.",
-            "Martian pitholes show where the planet's volcanoes once erupted.",
-            "Gas release from Mars' surface could have caused pitholes.",
-            "Pitholes are formed by the low gravity and no atmosphere on Mars.",
-            "Some pitholes on Mars may have been caused by meteorite impacts.",
-            "Pitholes give scientists clues about Mars’ past weather and atmosphere.",
-            "Many pitholes are near old volcanoes, showing Mars’ volcanic history.",
-            "Pitholes may help us understand how Mars changed over time."
-        ],
-
-        "sounds": {
-            "bgm": os.path.join(assets_dir, "bgm.mp3"),
-            "success": os.path.join(assets_dir, "success.mp3"),
-            "miss": os.path.join(assets_dir, "miss.mp3")
-        }
-    },
-    {   
-        # level 3 setup
-        "background": os.path.join(assets_dir, "background3.png"),
-        "rover": os.path.join(assets_dir, "rover3.png"),
-        "logo": os.path.join(assets_dir, "Logo.png"),
-
-        "stone_coords": [
-            (int(425 * screen_width / 800), int(333 * screen_height / 600), int(486 * screen_width / 800), int(394 * screen_height / 600)),
-            (int(667 * screen_width / 800), int(264 * screen_height / 600), int(713 * screen_width / 800), int(325 * screen_height / 600)),
-            (int(622 * screen_width / 800), int(466 * screen_height / 600), int(704 * screen_width / 800), int(519 * screen_height / 600)),
-            (int(590 * screen_width / 800), int(214 * screen_height / 600), int(629 * screen_width / 800), int(260 * screen_height / 600)),
-            (int(160 * screen_width / 800), int(260 * screen_height / 600), int(298 * screen_width / 800), int(315 * screen_height / 600)),
-            (int(143 * screen_width / 800), int(439 * screen_height / 600), int(185 * screen_width / 800), int(522 * screen_height / 600)),
-            (int(88 * screen_width / 800), int(140 * screen_height / 600), int(129 * screen_width / 800), int(196 * screen_height / 600)),
-            (int(132 * screen_width / 800), int(324 * screen_height / 600), int(159 * screen_width / 800), int(377 * screen_height / 600))
-        ],
-
-        "pithole_coords": [],
-
-        "stone_facts": [
-            "Olympus Mons is the tallest volcano in the solar system at 13.6 miles high.",
-            "Mars' atmosphere is mostly carbon dioxide, making it uninhabitable without protection.",
-            "Massive dust storms on Mars can last months and cover the entire planet.",
-            "Mars has polar ice caps of carbon dioxide and water ice that change with seasons.",
-            "Mars' gravity is 38% of Earth's, making you weigh less there.",
-            "Liquid water once flowed on Mars, evidenced by riverbeds and valleys.",
-            "Mars has seasons, but they last about twice as long as Earth's.",
-            "Temperatures on Mars range from -195°F to 70°F (-125°C to 20°C).",
-            "Mars' red color comes from iron oxide (rust) in the soil and rocks.",
-            "Mars has two moons, Phobos and Deimos, likely captured asteroids.",
-            "Mars once had a magnetic field, but it disappeared long ago.",
-            "Mars’ thin atmosphere can’t support life as we know it, but past life is possible.",
-            "Underground water may still exist in aquifers on Mars.",
-            "Mars’ equator gets more solar radiation, causing extreme temperatures.",
-            "Curiosity rover found organic molecules, hinting at ancient life on Mars.",
-            "Valles Marineris is the largest canyon in the solar system, 2,500 miles long.",
-            "Mars once had a thick atmosphere, but it was stripped by solar winds.",
-            "Winds on Mars can reach speeds of over 60 mph, shaping the landscape.",
-            "Mars is half the size of Earth, with a surface area similar to Earth's landmass.",
-            "A day on Mars is 24.6 hours, similar to Earth’s day."
-        ],
-
-        "pithole_facts": [],
-
-        "sounds": {
-            "bgm": os.path.join(assets_dir, "bgm.mp3"),
-            "success": os.path.join(assets_dir, "success.mp3"),
-            "miss": os.path.join(assets_dir, "miss.mp3")
+# Raised for a level file that does not match the format above
+class LevelFormatError(ValueError):
+    pass
+
+def level_files(directory=levels_dir):
+    """Level files in play order."""
+    return sorted(glob.glob(os.path.join(directory, "level_*.json")))
+
+def normalize_coords(coords, width=DESIGN_WIDTH, height=DESIGN_HEIGHT):
+    """Pixel (x1, y1, x2, y2) boxes on a width x height image -> the file format's 0..1 boxes."""
+    boxes = np.asarray(coords, dtype=np.float64).reshape(-1, 4) / (width, height, width, height)
+    return np.round(boxes, COORD_DECIMALS).tolist()
+
+def validate_level(data, path="<level>"):
+    """Check a parsed level file, raising LevelFormatError that names the file and field."""
+    name = os.path.basename(path)
+
+    def fail(message):
+        raise LevelFormatError(f"{name}: {message}")
+
+    if not isinstance(data, dict):
+        fail("expected a JSON object")
+    for key in ("background", "rover", "logo"):
+        if not isinstance(data.get(key), str):
+            fail(f"'{key}' must be an asset file name")
+        if not os.path.exists(os.path.join(assets_dir, data[key])):
+            fail(f"'{key}' asset {data[key]} not found in assets/")
+    sounds = data.get("sounds")
+    if not isinstance(sounds, dict):
+        fail("'sounds' must be an object")
+    for key in SOUND_NAMES:
+        if not isinstance(sounds.get(key), str):
+            fail(f"'sounds.{key}' must be an asset file name")
+        if not os.path.exists(os.path.join(assets_dir, sounds[key])):
+            fail(f"'sounds.{key}' asset {sounds[key]} not found in assets/")
+
+    zones, facts = data.get("zones"), data.get("facts")
+    if not isinstance(zones, dict) or not isinstance(facts, dict):
+        fail("'zones' and 'facts' must be objects")
+    for zone_type in ZONE_TYPES:
+        boxes = zones.get(zone_type, [])
+        if not isinstance(boxes, list):
+            fail(f"'zones.{zone_type}' must be a list of boxes")
+        for i, box in enumerate(boxes):
+            if (not isinstance(box, list) or len(box) != 4
+                    or not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in box)):
+                fail(f"'zones.{zone_type}[{i}]' must be [x1, y1, x2, y2]")
+            x1, y1, x2, y2 = box
+            if not (0 <= x1 < x2 <= 1 and 0 <= y1 < y2 <= 1):
+                fail(f"'zones.{zone_type}[{i}]' {box} is not a normalized box (0 <= x1 < x2 <= 1, same for y)")
+        zone_facts = facts.get(zone_type, [])
+        if not isinstance(zone_facts, list) or not all(isinstance(fact, str) for fact in zone_facts):
+            fail(f"'facts.{zone_type}' must be a list of strings")
+        if boxes and not zone_facts:
+            fail(f"'facts.{zone_type}' is empty but the level has {zone_type} zones")
+
+def load_level_file(path):
+    """Parse and validate one level file; zones stay normalized (see scale_levels())."""
+    with open(path, encoding="utf-8") as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise LevelFormatError(f"{os.path.basename(path)}: {e}") from None
+    validate_level(data, path)
+    return data
+
+def save_level_file(path, data):
+    """Validate a level and write it in the same layout as the checked-in files (one box per line)."""
+    validate_level(data, path)
+    text = json.dumps(data, indent=4, ensure_ascii=False)
+    text = re.sub(r"\[\s+([^\[\]\s,]+),\s+([^\[\]\s,]+),\s+([^\[\]\s,]+),\s+([^\[\]\s,]+)\s+\]", r"[\1, \2, \3, \4]", text)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text + "\n")
+
+def load_levels(directory=levels_dir):
+    """Every level file, parsed and validated, with asset paths made absolute and zones left normalized."""
+    return [_resolve_assets(load_level_file(path)) for path in level_files(directory)]
+
+def scale_levels(levels, screen_width, screen_height):
+    """
+    Turn parsed levels into the configs main.py plays, with zones in screen pixels.
+
+    Every zone of every level is scaled in one NumPy operation; boxes are truncated to
+    whole pixels the way the old int(x * screen_width / 800) was.
+    """
+    boxes, counts = [], []
+    for level in levels:
+        for zone_type in ZONE_TYPES:
+            zone_boxes = level["zones"].get(zone_type, [])
+            boxes.extend(zone_boxes)
+            counts.append(len(zone_boxes))
+    scale = np.array([screen_width, screen_height, screen_width, screen_height], dtype=np.float64)
+    pixels = np.floor(np.asarray(boxes, dtype=np.float64).reshape(-1, 4) * scale + SNAP_EPSILON).astype(np.int64)
+    pixels = [tuple(box) for box in pixels.tolist()]
+
+    level_configs = []
+    counts = iter(counts)
+    start = 0
+    for level in levels:
+        config = {
+            "name": level.get("name", ""),
+            "background": level["background"],
+            "rover": level["rover"],
+            "logo": level["logo"],
+            "sounds": dict(level["sounds"]),
         }
-    }
-]
+        for zone_type in ZONE_TYPES:
+            count = next(counts)
+            config[f"{zone_type}_coords"] = pixels[start:start + count]
+            config[f"{zone_type}_facts"] = list(level["facts"].get(zone_type, []))
+            start += count
+        level_configs.append(config)
+    return level_configs
+
+def build_level_configs(screen_width, screen_height, directory=levels_dir, use_cache=True):
+    """
+    Return the level configs with zone coordinates scaled to the given screen size.
+
+    Compiled levels are cached per resolution under each file's content hash, so only new or
+    edited level files are parsed, validated and scaled again.
+    """
+    paths = level_files(directory)
+    if not paths:
+        raise LevelFormatError(f"No level_*.json files in {directory}")
+    hashes = []
+    for path in paths:
+        with open(path, "rb") as f:
+            hashes.append(hashlib.sha256(f.read()).hexdigest())
+
+    cache_path = os.path.join(directory, '__cache__', f"{screen_width}x{screen_height}.pkl")
+    cached = _read_cache(cache_path) if use_cache else {}
+    missing = [(path, digest) for path, digest in zip(paths, hashes) if digest not in cached]
+    if missing:
+        compiled = scale_levels([load_level_file(path) for path, _ in missing], screen_width, screen_height)
+        fresh = {digest: level for (_, digest), level in zip(missing, compiled)}
+        if use_cache:
+            _write_cache(cache_path, {digest: cached.get(digest) or fresh[digest] for digest in hashes})
+        cached = {**cached, **fresh}
+    return [_resolve_assets(cached[digest]) for digest in hashes]
+
+def _resolve_assets(level):
+    """Copy of a level with its asset names turned into paths under assets/."""
+    level = dict(level)
+    for key in ("background", "rover", "logo"):
+        level[key] = os.path.join(assets_dir, level[key])
+    level["sounds"] = {name: os.path.join(assets_dir, file) for name, file in level["sounds"].items()}
+    return level
+
+def _read_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            cache = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache["levels"]
+
+def _write_cache(cache_path, compiled):
+    """Replace the resolution's cache file (only the current level files are kept)."""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump({"version": CACHE_VERSION, "levels": compiled}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)  # Atomic, so a crash never leaves half a cache
+    except OSError as e:
+        print(f"Warning: Could not write level cache {cache_path}: {e}")
@@ -1,41 +1,57 @@
+import time
+startup_start = time.perf_counter()  # Startup time includes the imports below
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 import pygame
-import cv2
-import mediapipe as mp
 import numpy as np
 import random
-import time
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Shared hand_tracking and frame_timing packages
 from modules.configs import *
-from modules.rover_movement_animation import Particle
+from modules.rover_movement_animation import ParticleSystem
 from modules.button import Button
-from modules.collision_check import check_for_collision
+from modules.asset_manager import AssetManager
+from modules.asset_pack import AssetPack
+from modules.audio_manager import AudioManager
+from modules.collision_check import ZoneIndex
+from modules.dirty_renderer import DirtyRectRenderer
+from modules.fixed_timestep import FixedStepClock, RoverBody
+from modules.frame_bus import FrameBus
+from modules.level_prefetch import LevelPrefetcher
 from modules.text_configs import *
-from levels.level_data import level_configs
-
-# Initialize pygame
-pygame.init()
-
-# Initialize the Pygame mixer for sound
-pygame.mixer.init()
+from modules.text_cache import get_font, render_text, text_cache
+from modules.startup_profile import StartupProfiler
+from modules.webcam_preview import WebcamPreview
+from levels.level_data import build_level_configs
+from frame_timing import StageLog, StageTimer, TimingHud, trace
+from hand_tracking import BlankFrameSource, GestureTrackers, HandRoi, InferenceScheduler, LandmarkRecorder, close_tracker, get_tracker
+imports_done = time.perf_counter()
 
 current_level_index = 0  # Track current level
 
 def load_level(current_level_index):
     global background_image, rover_image, logo_img
     global stone_coords, pithole_coords, stone_facts, pithole_facts
-    global total_zones, analyzed_stones, analyzed_pitholes
-    global success_sound, miss_sound
-    global bgm_path
+    global total_zones, analyzed_stones, analyzed_pitholes, zone_index
 
+    load_start = time.perf_counter()
     level = level_configs[current_level_index]
 
-    background_image = pygame.image.load(level["background"]).convert()
-    background_image = pygame.transform.smoothscale(background_image, (screen_width, screen_height))
-
-    rover_image = pygame.image.load(level["rover"]).convert_alpha()
-    rover_image = pygame.transform.smoothscale(rover_image, (120, 120))
+    # Use the copy decoded in the background while the previous level was played
+    prefetched = level_prefetcher.take(current_level_index)
+    if prefetched is not None:
+        background_image, rover_image, logo_img = prefetched.background, prefetched.rover, prefetched.logo
+    else:
+        background_image = assets.load_image(level["background"], screen_width, screen_height, alpha=False)
+        rover_image = assets.load_image(level["rover"], 120, 120)
+        logo_img = assets.load_image(level["logo"], 120, 120)
 
-    logo_img = pygame.image.load(level["logo"]).convert_alpha()
-    logo_img = pygame.transform.smoothscale(logo_img, (120, 120))
+    # Warm the cache with everything the start screen and frame loop draw
+    assets.preload([
+        (os.path.join(assets_dir, "chimpu.png"), 100, 100, True),
+        (os.path.join(assets_dir, "start_chimpu.png"), 150, 150, True),
+    ])
 
     stone_coords = level["stone_coords"]
     pithole_coords = level["pithole_coords"]
@@ -44,17 +60,23 @@ def load_level(current_level_index):
     analyzed_stones = set()
     analyzed_pitholes = set()
     total_zones = len(stone_coords) + len(pithole_coords)
+    zone_index = ZoneIndex(stone_coords, pithole_coords)  # Prebuilt rects for collision queries
+    particles.clear()  # No dust left over from the previous level
 
-    # Load sounds
-    pygame.mixer.music.load(level["sounds"]["bgm"])
-    pygame.mixer.music.set_volume(1.0)
-    pygame.mixer.music.play(-1)
+    # Load sounds: music crossfades in once decoded, SFX come from the decoded-sound cache
+    audio.play_music(level["sounds"]["bgm"])
+    audio.register("success", level["sounds"]["success"])
+    audio.register("miss", level["sounds"]["miss"])
 
-    success_sound = pygame.mixer.Sound(level["sounds"]["success"])
-    success_sound.set_volume(1.0)
+    # Start decoding the next level while this one is played
+    level_prefetcher.evict(current_level_index)
+    level_prefetcher.prefetch(current_level_index + 1)
 
-    miss_sound = pygame.mixer.Sound(level["sounds"]["miss"])
-    miss_sound.set_volume(1.0)
+    if prefetched is not None:
+        source = "prefetched"
+    else:
+        source = f"asset pack {asset_pack.name}" if asset_pack is not None else "PNG files"
+    print(f"Level {current_level_index + 1} loaded in {(time.perf_counter() - load_start) * 1000:.0f} ms ({source})")
 
 # Get the base directory of the project
 base_dir = os.path.dirname(os.path.abspath(__file__))  # Get current script directory
@@ -66,136 +88,10 @@ assets_dir = os.path.join(base_dir, 'assets')  # Path to the assets folder
 def load_image(image_name, width, height):
     """Helper function to load and scale images"""
     img_path = os.path.join(assets_dir, image_name)  # Build the full image path
-    image = pygame.image.load(img_path).convert_alpha()  # Load the image with transparency support
-    return pygame.transform.smoothscale(image, (width, height))  # Resize and return the image
-
-# Initialize MediaPipe Hands
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
-mp_draw = mp.solutions.drawing_utils
-
-# Variables for hand gesture recognition
-fist_held = False
-last_fist_time = 0
-prev_gestures = []
-
-# Time variables for managing the sound cooldown
-last_success_time = 0
-last_miss_time = 0
-
-# Cooldown duration for playing sounds (in seconds)
-sound_cooldown = 1.0  # Allow sound to play again after 1 second
-
-# Function to play the success sound
-def play_success_sound():
-    global last_success_time  # Keep track of the last time the success sound was played
-    current_time = time.time()
-    
-    # Only play the sound if the cooldown period has passed
-    if current_time - last_success_time >= sound_cooldown:
-        success_sound.play()
-        last_success_time = current_time  # Update the last play time
-
-# Function to play the miss sound
-def play_miss_sound():
-    global last_miss_time  # Keep track of the last time the miss sound was played
-    current_time = time.time()
-    
-    # Only play the sound if the cooldown period has passed
-    if current_time - last_miss_time >= sound_cooldown:
-        miss_sound.play()
-        last_miss_time = current_time  # Update the last play time
-
-# Hand gesture detection logic
-def detect_hand_gesture(hand_landmarks, prev_gestures, smoothing_window=5, mirror_x=True, mirror_y=True):
-    """
-    Detect hand gestures (left, right, up, down, fist) using MediaPipe hand landmarks.
-    
-    Args:
-        hand_landmarks: MediaPipe hand landmarks object.
-        prev_gestures: List of previous gestures for smoothing.
-        smoothing_window: Number of frames to average for smoothing (default: 5).
-        mirror_x: If True, flip x-axis for mirrored webcam (default: True).
-        mirror_y: If True, flip y-axis for mirrored webcam (default: True).
-    
-    Returns:
-        Gesture ("fist", "left", "right", "up", "down", None) or None if no clear gesture.
-    """
-    global fist_held, last_fist_time
-    
-    # Extract key landmarks
-    wrist = hand_landmarks.landmark[mp_hands.HandLandmark.WRIST]
-    index_tip = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_TIP]
-    thumb_tip = hand_landmarks.landmark[mp_hands.HandLandmark.THUMB_TIP]
-    index_mcp = hand_landmarks.landmark[mp_hands.HandLandmark.INDEX_FINGER_MCP]
-    
-    # Fist detection with adaptive threshold
-    hand_size = ((wrist.x - index_mcp.x) ** 2 + (wrist.y - index_mcp.y) ** 2) ** 0.5
-    fist_threshold = hand_size * 0.3  # Adaptive based on hand size
-    distance_thumb_index = ((thumb_tip.x - index_tip.x) ** 2 + (thumb_tip.y - index_tip.y) ** 2) ** 0.5
-    if distance_thumb_index < fist_threshold:
-        if not fist_held:
-            fist_held = True
-            last_fist_time = time.time()
-        elif time.time() - last_fist_time >= 2:
-            return "fist"
-        return None
-    else:
-        if fist_held and time.time() - last_fist_time < 0.2:  # 200ms buffer
-            return None
-        fist_held = False
-    
-    # Compute vector from wrist to index finger tip
-    wrist_x, wrist_y = wrist.x, wrist.y
-    index_x, index_y = index_tip.x, index_tip.y
-    
-    # Handle mirroring
-    if mirror_x:
-        wrist_x = 1.0 - wrist_x
-        index_x = 1.0 - index_x
-    if mirror_y:
-        wrist_y = 1.0 - wrist_y
-        index_y = 1.0 - index_y
-    
-    # Calculate direction vector
-    dx = index_x - wrist_x
-    dy = index_y - wrist_y
-    
-    # Compute angle and magnitude
-    angle = np.arctan2(dy, dx) * 180 / np.pi
-    magnitude = (dx ** 2 + dy ** 2) ** 0.5
-    
-    # Adaptive threshold for direction
-    threshold = hand_size * 0.5
-    if magnitude < threshold:
-        return None  # Ignore small movements
-    
-    # Define angle ranges for directions (corrected)
-    if -45 <= angle < 45:
-        gesture = "left"
-    elif 45 <= angle < 135:
-        gesture = "up"
-    elif 135 <= angle or angle < -135:
-        gesture = "right"
-    elif -135 <= angle < -45:
-        gesture = "down"
-    else:
-        gesture = None
-    
-    # Temporal smoothing
-    prev_gestures.append(gesture)
-    if len(prev_gestures) > smoothing_window:
-        prev_gestures.pop(0)
-    
-    valid_gestures = [g for g in prev_gestures if g is not None]
-    if not valid_gestures:
-        return None
-    return max(set(valid_gestures), key=valid_gestures.count, default=None)
+    return assets.load_image(img_path, width, height)  # Cached after the first load
 
-# Create a button at the bottom right of the screen
-button_width, button_height = 250, 50
-button_x = screen_width - button_width - 20  # 20px padding from right edge
-button_y = screen_height - button_height - 20  # 20px padding from bottom edge
+# Gesture smoothing and fist hold state, one tracker per hand
+gesture_trackers = GestureTrackers(smoothing_window=5, mirror_x=True, mirror_y=True)
 
 # Function to toggle webcam feed (or any other action)
 def toggle_webcam():
@@ -210,10 +106,6 @@ def toggle_webcam():
         webcam_button.text = "Enable Webcam Feed"  # Change text to 'Enable Camera'
         print("Webcam disabled")
 
-# Load the speaker and mute icons
-speaker_icon = load_image("speaker.png", 50, 50)  # Unmuted speaker icon
-mute_icon = load_image("mute.png", 50, 50)  # Muted speaker icon
-
 def display_audio_control_icon(surface, x, y, muted):
     """Display the audio control icon (speaker or mute) at the bottom left."""
     if muted:
@@ -233,11 +125,7 @@ def toggle_mute(mouse_pos):
     # Check if the click is within the icon boundaries
     if icon_x <= mouse_pos[0] <= icon_x + icon_width and icon_y <= mouse_pos[1] <= icon_y + icon_height:
         muted = not muted  # Toggle mute state
-
-        if muted:
-            pygame.mixer.music.set_volume(0)  # Mute the music
-        else:
-            pygame.mixer.music.set_volume(1)  # Unmute the music
+        audio.set_muted(muted)  # Pauses or resumes the music, only on this transition
 
 # Define some kid-friendly colors
 TUTORIAL_BG_COLOR = (0, 0, 0, 100)  # Semi-transparent black for background overlay
@@ -245,11 +133,6 @@ COLOR_TEXT = (255, 176, 0)  # Gold for titles
 COLOR_SUBTEXT = (0, 194, 203)   
 COLOR_EMOJI = (241, 213, 128) 
 
-# Initialize font
-font_main = pygame.font.SysFont("Impact", 70)  # Larger and bold for main title
-font_sub = pygame.font.SysFont("Impact", 40)  # Smaller for subtext
-font_instructions = pygame.font.SysFont("Impact", 35)  # Standard for instructions and gestures
-
 def display_text_with_image(surface, text, image, x, y, font, color):
     # Render the text
     text_surface = font.render(text, True, color)
@@ -264,29 +147,11 @@ def display_text_with_image(surface, text, image, x, y, font, color):
     surface.blit(image, (start_x, y))
     surface.blit(text_surface, (start_x + image_width + 10, y))  # Text to the right of image
 
-# Load gesture images using the function
-gesture_fist_img = load_image("fist.png", 50, 50)  # Fist gesture image
-gesture_left_img = load_image("left.png", 50, 50)  # Left arrow image
-gesture_right_img = load_image("right.png", 50, 50)  # Right arrow image
-gesture_up_img = load_image("up.png", 50, 50)  # Up arrow image
-gesture_down_img = load_image("down.png", 50, 50)  # Down arrow image
-
-# Modified tutorial_text to split the complex gesture line into separate entries
-tutorial_text = [
-    ("Welcome to Mars Rover Exploration!", COLOR_TEXT, font_main),  # Main title
-    ("Explore the Martian landscape and uncover educational facts.", COLOR_TEXT, font_sub),
-    ("Use hand gestures to control the rover.", COLOR_EMOJI, font_instructions),
-    (gesture_fist_img, "Fist gesture: Analyze the zone", WHITE, font_instructions),
-    # Split the complex gesture line into individual entries for clarity
-    (gesture_left_img, "Left: Move left", WHITE, font_instructions),
-    (gesture_right_img, "Right: Move right", WHITE, font_instructions),
-    (gesture_up_img, "Up: Move up", WHITE, font_instructions),
-    (gesture_down_img, "Down: Move down", WHITE, font_instructions),
-    ("Press Space or Enter to start the game.", COLOR_EMOJI, font_sub)
-]
-
-
 def start_screen():
+    # Semi-transparent black overlay, the same every iteration
+    overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+    overlay.fill(TUTORIAL_BG_COLOR)
+
     running = True
     while running:
         # Event handling
@@ -298,13 +163,13 @@ def start_screen():
                 if event.button == 1:  # Left mouse click
                     toggle_mute(pygame.mouse.get_pos())
 
+        audio.update()  # Level music starts here once decoded
+
         # Fill screen with the background
         screen.fill(WHITE)
         screen.blit(background_image, (0, 0))
 
-        # Create overlay with semi-transparent black background
-        overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
-        overlay.fill(TUTORIAL_BG_COLOR)  # Semi-transparent black overlay
+        # Darken the background with the overlay
         screen.blit(overlay, (0, 0))
 
         # Set the initial position for the title (font_main)
@@ -328,7 +193,7 @@ def start_screen():
 
         # **Place image between the main title and subtext**
         # Load and display the image
-        image = load_image("start_chimpu.png", 150, 150)  # Replace with actual image name and size
+        image = load_image("start_chimpu.png", 150, 150)  # Served from the asset cache
         image_width, image_height = image.get_size()
         image_x = (screen_width // 2) - (image_width // 2)  # Center image
         screen.blit(image, (image_x, y_position))  # Place the image
@@ -398,27 +263,17 @@ def start_screen():
 # Initialize webcam toggle state
 webcam_enabled = False  # Initially, the webcam is disabled
 
-# Create a button instance
-webcam_button = Button(button_x, button_y, button_width, button_height, "Enable Webcam Feed", BUTTON_COLOR_ENABLED, TEXT_COLOR, toggle_webcam)
-
-# Initialize webcam
-cap = cv2.VideoCapture(0)
-if not cap.isOpened():
-    print("Error: Could not open webcam.")
-    pygame.quit()
-    exit()
+# Frame timing overlay, toggled with F3
+timing_hud_enabled = False
 
 # Rover Animation Variable
-particles = []
+particles = ParticleSystem(capacity=256, spawn_budget=5)  # Per-step spawn budget caps bursts, capacity caps CPU use
 hover_offset = 0
 
 # Track analyzed regions
 analyzed_stones = set()
 analyzed_pitholes = set()
 
-# Define total zones
-total_zones = len(stone_coords) + len(pithole_coords)
-
 # Function to check if the region has already been analyzed
 def has_analyzed_region(region_coords, region_type):
     if region_type == "stone":
@@ -454,8 +309,8 @@ def draw_zones():
 
 def show_game_complete_screen():
     # Set up fonts and assets
-    font = pygame.font.SysFont("Impact", 60)
-    sub_font = pygame.font.SysFont("Impact", 30)
+    font = get_font("Impact", 60)
+    sub_font = get_font("Impact", 30)
     title_text = font.render("Mission Complete!", True, (255, 215, 0))  # Gold
     sub_text = sub_font.render("Great job, explorer! Get ready for your next journey...", True, (200, 200, 200))
 
@@ -470,7 +325,7 @@ def show_game_complete_screen():
     ]
 
     # Play celebration sound once
-    # play_success_sound()
+    # audio.play("success")
     
     # Animation timer
     start_time = pygame.time.get_ticks()
@@ -494,8 +349,8 @@ def show_game_complete_screen():
 def show_game_end_screen():
     """Displays the final game end screen when there are no more levels."""
     # Set up fonts and assets
-    font = pygame.font.SysFont("Impact", 60)
-    sub_font = pygame.font.SysFont("Impact", 30)
+    font = get_font("Impact", 60)
+    sub_font = get_font("Impact", 30)
     title_text = font.render("Game Over!", True, (255, 215, 0))  # Gold for the main title
     sub_text = sub_font.render("Thank you for playing!", True, (200, 200, 200))  # Gray for subtext
 
@@ -510,7 +365,7 @@ def show_game_end_screen():
     ]
 
     # Play celebration sound once (optional)
-    # play_success_sound()
+    # audio.play("success")
 
     # Animation timer
     start_time = pygame.time.get_ticks()
@@ -535,7 +390,7 @@ def show_game_end_screen():
     pygame.time.wait(1000)  # Wait for an additional second if you need before closing or transitioning
 
 def handle_level_complete():
-    global current_level_index, running, state, rover_x, rover_y, rover_speed
+    global current_level_index, running, state
 
     # Once player has interacted, move to the next level
     current_level_index += 1
@@ -556,32 +411,96 @@ def handle_level_complete():
         running = False
         return "end_game"  # Indicate that the game has ended
 
-# Game loop
-def main_game():
+# Draw the parts of the game scene that only change on level, mute or preview toggles
+def draw_static_hud(surface):
+    surface.blit(background_image, (0, 0))
+
+    # Draw the audio control icon
+    display_audio_control_icon(surface, 20, screen_height - 70, muted)
+
+    # Draw the webcam toggle button
+    webcam_button.draw(surface)
+
+    # Display guideline text at the top
+    image = load_image("chimpu.png", 100, 100)  # Preloaded in load_level()
+    display_text_with_logo_image(surface, "Explore and analyze all the distinct objects.", image, font_size=40)
+
+    # Draw the logo
+    draw_logo(surface, logo_img)
+
+    # Display the exit tutorial message
+    exit_message = "Press ESC or Q to exit the game."
+    exit_message_surface = render_text(exit_message, "Impact", 40, WHITE)  # Same font as font_sub, rendered once
+    exit_message_width, exit_message_height = exit_message_surface.get_size()
+
+    exit_message_x = (screen_width - exit_message_width) // 2
+    exit_message_y = screen_height - exit_message_height - 20
+
+    surface.blit(exit_message_surface, (exit_message_x, exit_message_y))
+
+# Pre-composed static HUD that the dirty-rect renderer restores regions from
+def build_static_layer():
+    layer = pygame.Surface((screen_width, screen_height)).convert()
+    draw_static_hud(layer)
+    return layer
+
+# Gesture -> rover heading on screen (the camera is mounted rotated, so the axes are swapped)
+GESTURE_DIRECTIONS = {
+    "right": (0, 1),
+    "left": (0, -1),
+    "down": (-1, 0),
+    "up": (1, 0),
+}
+SIMULATION_STEP = 1 / 60  # Seconds of game time per fixed simulation step
+DUST_RATE = 150  # Dust particles per second behind a moving rover
+PREVIEW_REFRESH_HZ = 15  # Webcam preview updates per second (None follows the camera)
+STEER_STALL_FRAMES = 3  # Brake when no new hand frame arrived for this many capture intervals
+
+# Game loop: gameplay advances in fixed simulation steps, rendering runs at whatever rate the display allows
+# (max_frames, uncapped, timer and frame_time are used by development_modules/benchmark_game.py;
+# dirty_rects only redraws the changed regions of the game scene, see modules/dirty_renderer.py)
+def main_game(max_frames=None, uncapped=False, timer=None, frame_time=None, dirty_rects=False):
+    global timing_hud_enabled
     running = True
     clock = pygame.time.Clock()
-    last_gesture_time = 0
-    gesture_cooldown = 0.1  # seconds
+    sim_clock = FixedStepClock(step=SIMULATION_STEP)  # frame_time=None banks wall-clock time, else a fixed amount per frame
 
-    # Variables for display timing and state
-    state = "idle"  # idle, analyzing, showing_fact
-    analyzing_start_time = 0
-    fact_display_time = 0
+    # Variables for display timing and state (times are simulated seconds)
+    state = "idle"  # idle, analyzing, showing_fact, already_analyzed
+    analyzing_start_time = 0.0
+    fact_display_time = 0.0
     current_fact = ""
-    fact_display_duration = 5000  # 5 seconds
-    analyzing_duration = 1000  # 1 seconds
+    fact_display_duration = 5.0  # 5 seconds
+    analyzing_duration = 1.0  # 1 second
 
-    # Initial rover position
-    rover_x, rover_y = screen_width // 2, screen_height // 2
-    rover_speed = 5
+    # Initial rover position; the rover accelerates toward the held gesture direction
+    rover = RoverBody(screen_width // 2, screen_height // 2, max_speed=50.0,  # Pixels per second
+                      bounds=(screen_width - rover_image.get_width(), screen_height - rover_image.get_height()))
+    steer = None  # Direction of the latest movement gesture, None to brake
 
     last_collided_zone = None
     collision_type = None
+    last_capture_time = 0  # Capture timestamp of the last processed tracking result
+    last_hand_frame_at = time.perf_counter()  # When that result arrived
+    capture_interval = 1 / 30  # Smoothed time between new results, for the steering stall timeout
+
+    # Persistent preview surface, refreshed in place from the camera frame
+    webcam_preview = WebcamPreview((200, 150), refresh_hz=PREVIEW_REFRESH_HZ)
+
+    # Dirty-rect renderer (only used with dirty_rects)
+    renderer = DirtyRectRenderer(screen)
+    last_static_key = None  # Inputs the static layer was last built from
 
-    current_level_index = 0
+    if timer is None:
+        timer = StageTimer()  # Per-stage frame times of the last few seconds
+    timing_hud = TimingHud(timer, position=(screen_width - 360, 160))  # Below the logo
+    frames = 0
 
-    is_moving = False
     while running:
+        if max_frames is not None and frames >= max_frames:
+            break
+        timer.begin_frame()
+
         # Handle events
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
@@ -589,204 +508,139 @@ def main_game():
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left mouse click
                     toggle_mute(pygame.mouse.get_pos())
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                timing_hud_enabled = not timing_hud_enabled  # Show or hide the frame timing overlay
 
-        # Draw game visuals
-        screen.fill(WHITE)
-        screen.blit(background_image, (0, 0))
-
-        # Handle sound/muted state (e.g., for background music, sound effects)
-        if not muted:
-            pygame.mixer.music.unpause()  # Resume music if unmuted
-        else:
-            pygame.mixer.music.pause()  # Pause music if muted
-
-        # Draw the audio control icon
-        display_audio_control_icon(screen, 20, screen_height - 70, muted)
-
-        # Draw the zones with visual color indications
-        # draw_zones()
+        # Start the next level's music once it has been decoded in the background
+        audio.update()
 
         # Get mouse position and click state
         mouse_pos = pygame.mouse.get_pos()
         mouse_click = pygame.mouse.get_pressed()
 
-        # Draw and handle button click
-        webcam_button.draw(screen)
+        # Handle button click
         webcam_button.check_click(mouse_pos, mouse_click)
+        timer.lap("events")
 
-        # Display guideline text at the top
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        assets_dir = os.path.join(base_dir, 'assets')
-        img_path = os.path.join(assets_dir, 'chimpu.png')
-        image = pygame.image.load(img_path).convert_alpha()  # Load the image
-        image = pygame.transform.smoothscale(image, (100, 100))  # Resize image if needed
-        display_text_with_logo_image(screen, "Explore and analyze all the distinct objects.", image, font_size=40)
-        
-        if is_moving:
-            hover_offset = 0  # Prevent hovering when moving
-        else:
-            time_ms = pygame.time.get_ticks()
-            hover_offset = 6 * np.sin(time_ms / 300)  # Smooth hover while idle
-        screen.blit(rover_image, (rover_x, rover_y + hover_offset))
+        # Pick up the newest tracking result without waiting on the camera
+        if hand_tracker.failed:
+            break
+        hand_frame = None
+        tracked = hand_tracker.latest()
+        now = time.perf_counter()
+        if tracked is not None and tracked.capture_time > last_capture_time:
+            last_capture_time = tracked.capture_time
+            capture_interval += 0.1 * (now - last_hand_frame_at - capture_interval)
+            last_hand_frame_at = now
+            hand_frame = tracked
+        elif steer is not None and now - last_hand_frame_at > STEER_STALL_FRAMES * capture_interval:
+            steer = None  # The camera or tracker stalled: don't keep driving on the last gesture
+
+        # Read gestures (once per new camera frame); they only set the rover's input
+        if hand_frame is not None:
+            steer = None  # Brake unless a hand still points somewhere
+            for _, _, gesture in gesture_trackers.update(hand_frame):
+                if gesture == "fist":
+                    rover_rect = pygame.Rect(int(rover.x), int(rover.y), rover_image.get_width(), rover_image.get_height())
+                    zone = zone_index.query(rover_rect)
+                    collision_type = zone.zone_type if zone is not None else None
+                    if zone is not None:
+                        # If the zone has not been analyzed yet
+                        if not has_analyzed_region(zone.coords, zone.zone_type):
+                            facts = stone_facts if zone.zone_type == "stone" else pithole_facts
+                            current_fact = random.choice(facts)
+                            state = "analyzing"
+                            analyzing_start_time = sim_clock.time
+                            last_collided_zone = zone.coords  # Marked as analyzed once analysis finishes
+                        else:
+                            current_fact = "Already analyzed zone!"
+                            state = "already_analyzed"
+                            fact_display_time = sim_clock.time
+                    else:
+                        current_fact = "Keep exploring for more beneficial results!"
+                        state = "analyzing"
+                        analyzing_start_time = sim_clock.time
 
-        # Draw the logo
-        draw_logo(screen, logo_img)
+                if gesture in GESTURE_DIRECTIONS:
+                    steer = GESTURE_DIRECTIONS[gesture]
+        timer.lap("gestures")
 
-        # **New Section**: Display the exit tutorial message
-        exit_message = "Press ESC or Q to exit the game."
-        exit_message_surface = font_sub.render(exit_message, True, WHITE)
-        exit_message_width, exit_message_height = exit_message_surface.get_size()
+        # Fixed-step simulation: rover kinematics, dust and the analyzing/showing_fact timers
+        for _ in range(sim_clock.advance(frame_time)):
+            sim_time = sim_clock.tick()
+            rover.step(sim_clock.step, steer)
+            if steer is not None:
+                particles.emit_for(rover.x + 40, rover.y + 90, DUST_RATE, sim_clock.step)  # behind the rover
+            particles.update(sim_clock.step)
 
-        exit_message_x = (screen_width - exit_message_width) // 2
-        exit_message_y = screen_height - exit_message_height - 20
+            if state == "analyzing" and sim_time - analyzing_start_time >= analyzing_duration:
+                state = "showing_fact"
+                fact_display_time = sim_time
+                if collision_type in ("stone", "pithole"):
+                    mark_region_as_analyzed(last_collided_zone, collision_type)
+                    audio.play("success")  # Play success sound after analyzing (1 s cooldown)
+                else:
+                    audio.play("miss")  # Play miss sound after analyzing
+            elif state in ("showing_fact", "already_analyzed") and sim_time - fact_display_time > fact_display_duration:
+                state = "idle"
+        timer.lap("simulation")
 
-        screen.blit(exit_message_surface, (exit_message_x, exit_message_y))
+        # Draw game visuals
+        frame_rects = []  # Regions drawn on top of the static HUD this frame
+        if dirty_rects:
+            # Rebuild the static layer (full redraw) when level, mute or preview state changes
+            static_key = (background_image, muted, webcam_enabled)
+            if static_key != last_static_key:
+                last_static_key = static_key
+                renderer.set_static_layer(build_static_layer())
+            renderer.begin_frame()
+        else:
+            screen.fill(WHITE)
+            draw_static_hud(screen)
+        timer.lap("static")
+
+        # Draw the rover between the last two simulated positions
+        rover_x, rover_y = rover.position(sim_clock.alpha())
+        if steer is not None or rover.moving():
+            hover_offset = 0  # Prevent hovering when moving
+        else:
+            hover_offset = 6 * np.sin(sim_clock.time * 1000 / 300)  # Smooth hover while idle
+        frame_rects.append(screen.blit(rover_image, (rover_x, rover_y + hover_offset)))
 
         # Calculate analyzed zones
         analyzed_zones = len(analyzed_stones) + len(analyzed_pitholes)
 
         # Display the analyzed zones progress (e.g., "Analyzed: 0/7 zones")
         progress_text = f"Analyzed: {analyzed_zones}/{total_zones} zones"
-        progress_surface = font_sub.render(progress_text, True, WHITE)
+        progress_surface = render_text(progress_text, "Impact", 40, WHITE)  # Re-rendered only when the count changes
         progress_x = 20
         progress_y = 180  # Place it near the top
-        screen.blit(progress_surface, (progress_x, progress_y))
+        frame_rects.append(screen.blit(progress_surface, (progress_x, progress_y)))
+        timer.lap("sprites")
 
-        # Process webcam frame
-        ret, frame = cap.read()
-        if not ret:
-            print("Error: Failed to capture frame.")
-            break
-        frame = cv2.resize(frame, (320, 240))  # Resize for performance
-        frame = cv2.flip(frame, 1)  # Flip horizontally for mirroring
-        frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)  # Fix 90-degree rotation
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        results = hands.process(frame_rgb)
-
-        # Draw landmarks and process gestures
-        if results.multi_hand_landmarks:
-            for landmarks in results.multi_hand_landmarks:
-                mp_draw.draw_landmarks(frame_rgb, landmarks, mp_hands.HAND_CONNECTIONS)
-                gesture = detect_hand_gesture(landmarks, prev_gestures, mirror_x=True, mirror_y=True)
+        # Draw particles every rendered frame, even between simulation steps
+        frame_rects.extend(particles.draw(screen))
+        timer.lap("particles")
 
-                if gesture == "fist":
-                    rover_rect = pygame.Rect(rover_x, rover_y, rover_image.get_width(), rover_image.get_height())
-                    collision_type = check_for_collision(rover_rect, stone_coords, pithole_coords)
-                    if collision_type == "stone":
-                        for stone in stone_coords:
-                            x1, y1, x2, y2 = stone
-                            width = x2 - x1  # Calculate the width
-                            height = y2 - y1  # Calculate the height
-                            if rover_rect.colliderect(pygame.Rect(x1, y1, width, height)):
-                                # If stone has not been analyzed yet
-                                if not has_analyzed_region(stone, "stone"):
-                                    current_fact = random.choice(stone_facts)
-                                    state = "analyzing"
-                                    analyzing_start_time = pygame.time.get_ticks()
-                                    last_collided_zone = stone  # Mark as analyzed
-                                    sound_played = False  # Reset flag to play success sound
-                                else:
-                                    current_fact = "Already analyzed zone!"
-                                    state = "already_analyzed"
-                                    fact_display_time = pygame.time.get_ticks()
-                                    sound_played = False
-                    elif collision_type == "pithole":
-                        for pithole in pithole_coords:
-                            x1, y1, x2, y2 = pithole
-                            width = x2 - x1  # Calculate the width
-                            height = y2 - y1  # Calculate the height
-                            if rover_rect.colliderect(pygame.Rect(x1, y1, width, height)):
-                                # If pithole has not been analyzed yet
-                                if not has_analyzed_region(pithole, "pithole"):
-                                    current_fact = random.choice(pithole_facts)
-                                    state = "analyzing"
-                                    analyzing_start_time = pygame.time.get_ticks()
-                                    last_collided_zone = pithole
-                                    sound_played = False  # Reset flag to play success sound
-                                else:
-                                    current_fact = "Already analyzed zone!"
-                                    state = "already_analyzed"
-                                    fact_display_time = pygame.time.get_ticks()
-                                    sound_played = False
-
-                    else:
-                        current_fact = "Keep exploring for more beneficial results!"
-                        state = "analyzing"
-                        analyzing_start_time = pygame.time.get_ticks()
-                        sound_played = False  # Reset the flag to play sound after analysis
-               
-
-                if gesture in ["left", "right", "up", "down"]:
-                    now = time.time()
-                    is_moving = True
-                    if now - last_gesture_time > gesture_cooldown:
-                        if gesture == "right":
-                            rover_y += rover_speed
-                        elif gesture == "left":
-                            rover_y -= rover_speed
-                        elif gesture == "down":
-                            rover_x -= rover_speed
-                        elif gesture == "up":
-                            rover_x += rover_speed
-                        last_gesture_time = now
-                    # Boundary check
-                    rover_x = max(0, min(rover_x, screen_width - rover_image.get_width()))
-                    rover_y = max(0, min(rover_y, screen_height - rover_image.get_height()))
-                else:
-                    is_moving = False
-                if is_moving:
-                    for _ in range(5):  # Spawn 3 particles per frame
-                        particles.append(Particle(rover_x + 40, rover_y + 90))  # behind the rover
-
-                for p in particles[:]:
-                    p.update()
-                    p.draw(screen)
-                    if p.life <= 0:
-                        particles.remove(p)
-
-        # Handle text display logic (analyzing, showing_fact)
+        # Text for the analyzing / showing_fact states (their timers run in the simulation above)
         if state == "analyzing":
-            elapsed_time = pygame.time.get_ticks() - analyzing_start_time
-            if elapsed_time < analyzing_duration:
-                display_text_with_background(screen, "Analyzing...", 40)
-            else:
-                state = "showing_fact"
-                fact_display_time = pygame.time.get_ticks()
-                if collision_type == "stone":
-                    mark_region_as_analyzed(last_collided_zone, "stone")
-                    if not sound_played:
-                        play_success_sound()  # Play success sound after analyzing
-                        sound_played = True  # Ensure it's only played once
-                elif collision_type == "pithole":
-                    mark_region_as_analyzed(last_collided_zone, "pithole")
-                    if not sound_played:
-                        play_success_sound()  # Play success sound after analyzing
-                        sound_played = True  # Ensure it's only played once
-                else:
-                    if not sound_played:
-                        play_miss_sound()  # Play miss sound after analyzing
-                        sound_played = True  # Ensure it's only played once
+            frame_rects.append(display_text_with_background(screen, "Analyzing...", 40))
+        elif state in ("showing_fact", "already_analyzed"):
+            frame_rects.append(display_text_with_background(screen, current_fact, 40))
+        timer.lap("text")
 
-        elif state == "showing_fact":
-            if pygame.time.get_ticks() - fact_display_time <= fact_display_duration:
-                display_text_with_background(screen, current_fact, 40)
-            else:
-                state = "idle"
-        elif state == "already_analyzed":
-            if pygame.time.get_ticks() - fact_display_time <= fact_display_duration:
-                display_text_with_background(screen, current_fact, 40)
-            else:
-                state = "idle"
         # If webcam is enabled, display the webcam feed
         if webcam_enabled:
-            ret, frame = cap.read()
-            if ret:
-                frame = cv2.flip(frame, 1)  # Flip horizontally for mirroring
-                frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame_surface = pygame.surfarray.make_surface(frame_rgb)
-                frame_surface = pygame.transform.scale(frame_surface, (200, 150))
-                screen.blit(frame_surface, (0, 0))  # Display the webcam feed
+            frame, capture_time = frame_bus.latest()  # Same decoded frame the tracker used, no second read
+            webcam_preview.update(frame, capture_time)  # At most PREVIEW_REFRESH_HZ times a second
+            if webcam_preview.refreshes:
+                frame_rects.append(webcam_preview.draw(screen, (0, 0)))  # Display the webcam feed
+        timer.lap("preview")
+
+        # Frame timing overlay (F3)
+        if timing_hud_enabled:
+            frame_rects.append(timing_hud.draw(screen))
+            timer.lap("hud")
 
         if analyzed_zones == total_zones and state != 'analyzing' and state != 'showing_fact':
             # Call handle_level_complete to process the level complete state
@@ -796,8 +650,11 @@ def main_game():
                 # Proceed to the next level
                 state = "idle"  # Reset game state
                 # Reset rover or any local gameplay variables here
-                rover_x, rover_y = screen_width // 2, screen_height // 2  # example reset
-                rover_speed = 7
+                rover.place(screen_width // 2, screen_height // 2)
+                rover.max_speed = 70.0  # Faster rover on later levels
+                steer = None
+                sim_clock.reset()  # Don't simulate the time spent on the completion screen
+                renderer.invalidate()  # The completion screen covered everything
                 continue  # Proceed with the next iteration (next level)
             elif result == "end_game":
                 # End the game after completing all levels
@@ -806,21 +663,191 @@ def main_game():
             
         keys = pygame.key.get_pressed()
         if keys[pygame.K_ESCAPE] or keys[pygame.K_q]:
-            pygame.quit()  # Exit the game if ESC or Q is pressed
-            exit()
+            running = False  # Exit the game if ESC or Q is pressed
+            break  # Fall through to the cleanup below
 
         # Update display
-        pygame.display.flip()
-        clock.tick(60)
-
-load_level(current_level_index)
-
-start_screen()
-
-main_game()
-
-# Cleanup
-cap.release()
-cv2.destroyAllWindows()
-hands.close()
-pygame.quit()
\ No newline at end of file
+        if dirty_rects:
+            renderer.present(frame_rects)  # Only the regions that changed
+        else:
+            pygame.display.flip()
+        frame_bus.mark_rendered()
+        timer.lap("present")
+        timer.end_frame()
+        frames += 1
+        if not uncapped:
+            clock.tick(60)
+
+    return sim_clock.time  # Simulated seconds, reported by the benchmark
+
+# Startup phase: open the webcam (cv2 is imported here, off the main thread)
+def open_camera(frame_source=None, replay_path=None):
+    global cap
+    import cv2
+    if frame_source is None and replay_path:
+        frame_source = BlankFrameSource()  # The recording supplies the hands, so the webcam is not needed
+    cap = frame_source if frame_source is not None else cv2.VideoCapture(0)  # Any object with read()/isOpened()/release()
+
+# Startup phase: build the process-wide hand tracker (mediapipe is imported here, off the main thread)
+def init_tracker(replay_path=None, record_path=None, adaptive_inference=False, hand_roi=False):
+    global hand_tracker, landmark_recorder
+    landmark_recorder = LandmarkRecorder(record_path) if record_path else None
+    hand_tracker = get_tracker(
+        "replay" if replay_path else "mediapipe",  # Recorded landmarks replace inference when replaying
+        backend_options={"path": replay_path} if replay_path else None,
+        recorder=landmark_recorder,
+        scheduler=InferenceScheduler(target_fps=30) if adaptive_inference else None,  # Predict landmarks between runs
+        roi=HandRoi() if hand_roi and replay_path is None else None,  # Replayed landmarks are already full-frame
+        timer=StageTimer(),  # Capture / preprocess / inference times
+    )
+
+# Explicit init phase: nothing is created at import time, and independent phases run in parallel
+def init_game(profiler, frame_source=None, display_size=None, replay_path=None, record_path=None, adaptive_inference=False, hand_roi=False):
+    global screen, screen_width, screen_height, level_configs
+    global asset_pack, assets, level_prefetcher, audio
+    global speaker_icon, mute_icon, font_main, font_sub, font_instructions
+    global gesture_fist_img, gesture_left_img, gesture_right_img, gesture_up_img, gesture_down_img
+    global tutorial_text, webcam_button, frame_bus
+
+    def timed(name, func):
+        with profiler.phase(name):
+            return func()
+
+    with ThreadPoolExecutor(max_workers=3, thread_name_prefix="Startup") as pool:
+        audio = AudioManager(sfx_channels=4, crossfade_ms=1000, cooldown=1.0)
+        audio_future = pool.submit(timed, "audio", audio.init)
+        camera_future = pool.submit(timed, "camera", lambda: open_camera(frame_source, replay_path))
+        tracker_future = pool.submit(timed, "tracker", lambda: init_tracker(replay_path, record_path, adaptive_inference, hand_roi))
+
+        # The window has to be created on the main thread
+        with profiler.phase("display"):
+            screen, screen_width, screen_height = init_display(display_size)
+
+        with profiler.phase("assets"):
+            level_configs = build_level_configs(screen_width, screen_height)
+
+            # Pre-scaled pixels baked by development_modules/bake_assets.py (None -> decode the PNGs)
+            asset_pack = AssetPack.open(screen_width, screen_height)
+
+            # Cache of converted, scaled surfaces shared by every loader
+            assets = AssetManager(pack=asset_pack)
+
+            # Decodes the next level on a worker thread so level changes don't stall
+            level_prefetcher = LevelPrefetcher(level_configs, (screen_width, screen_height), pack=asset_pack, audio=audio)
+
+            # Load the speaker and mute icons
+            speaker_icon = load_image("speaker.png", 50, 50)  # Unmuted speaker icon
+            mute_icon = load_image("mute.png", 50, 50)  # Muted speaker icon
+
+            # Initialize font
+            font_main = get_font("Impact", 70)  # Larger and bold for main title
+            font_sub = get_font("Impact", 40)  # Smaller for subtext
+            font_instructions = get_font("Impact", 35)  # Standard for instructions and gestures
+
+            # Load gesture images using the function
+            gesture_fist_img = load_image("fist.png", 50, 50)  # Fist gesture image
+            gesture_left_img = load_image("left.png", 50, 50)  # Left arrow image
+            gesture_right_img = load_image("right.png", 50, 50)  # Right arrow image
+            gesture_up_img = load_image("up.png", 50, 50)  # Up arrow image
+            gesture_down_img = load_image("down.png", 50, 50)  # Down arrow image
+
+            # Modified tutorial_text to split the complex gesture line into separate entries
+            tutorial_text = [
+                ("Welcome to Mars Rover Exploration!", COLOR_TEXT, font_main),  # Main title
+                ("Explore the Martian landscape and uncover educational facts.", COLOR_TEXT, font_sub),
+                ("Use hand gestures to control the rover.", COLOR_EMOJI, font_instructions),
+                (gesture_fist_img, "Fist gesture: Analyze the zone", WHITE, font_instructions),
+                # Split the complex gesture line into individual entries for clarity
+                (gesture_left_img, "Left: Move left", WHITE, font_instructions),
+                (gesture_right_img, "Right: Move right", WHITE, font_instructions),
+                (gesture_up_img, "Up: Move up", WHITE, font_instructions),
+                (gesture_down_img, "Down: Move down", WHITE, font_instructions),
+                ("Press Space or Enter to start the game.", COLOR_EMOJI, font_sub)
+            ]
+
+            # Create a button at the bottom right of the screen
+            button_width, button_height = 250, 50
+            button_x = screen_width - button_width - 20  # 20px padding from right edge
+            button_y = screen_height - button_height - 20  # 20px padding from bottom edge
+            webcam_button = Button(button_x, button_y, button_width, button_height, "Enable Webcam Feed", BUTTON_COLOR_ENABLED, TEXT_COLOR, toggle_webcam)
+
+        audio_future.result()  # load_level() needs the mixer
+        with profiler.phase("level"):
+            load_level(current_level_index)
+
+        camera_future.result()
+        tracker_future.result()
+
+    # Initialize webcam
+    if not cap.isOpened():
+        print("Error: Could not open webcam.")
+        pygame.quit()
+        exit()
+
+    # One camera read per captured frame, shared by the tracker and the preview
+    frame_bus = FrameBus(cap)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Mars Rover Exploration")
+    parser.add_argument("--profile-startup", action="store_true", help="print how long each startup phase took")
+    parser.add_argument("--record", metavar="PATH", help="save every frame's hand landmarks to this .npz (streamed to PATH.part until exit, which --replay also reads)")
+    parser.add_argument("--replay", metavar="PATH", help="use hand landmarks from a recording instead of running MediaPipe")
+    parser.add_argument("--hand-roi", action="store_true", help="run MediaPipe on a native-resolution crop around the hands found in the previous frame; "
+                        "costs a second MediaPipe graph (memory, startup time) for the crops, and a hand entering outside the crop is "
+                        "only picked up by the full-frame pass every 15 frames (~0.5 s)")
+    parser.add_argument("--timing-hud", action="store_true", help="start with the frame timing overlay shown (F3 toggles it)")
+    parser.add_argument("--trace", metavar="PATH", help="write a Chrome trace (open in Perfetto) of the session to this .json; CV_GAMES_TRACE does the same")
+    parser.add_argument("--timing-log", metavar="PATH", help="write every frame's stage timings to this .csv (or packed binary for a .bin path)")
+    parser.add_argument("--dirty-rects", action="store_true", help="only redraw the regions of the game scene that changed each frame")
+    parser.add_argument("--adaptive-inference", action="store_true", help="run MediaPipe every few frames (picked from its latency) and predict landmarks in between")
+    args = parser.parse_args()
+
+    if args.trace:
+        trace.start_trace(args.trace)
+    else:
+        trace.start_from_env()
+
+    profiler = StartupProfiler(start=startup_start)
+    profiler.record("imports", startup_start, imports_done)
+    init_game(profiler, replay_path=args.replay, record_path=args.record, adaptive_inference=args.adaptive_inference, hand_roi=args.hand_roi)
+
+    print(f"Startup took {(time.perf_counter() - startup_start) * 1000:.0f} ms")
+    if args.profile_startup:
+        print(profiler.report())
+
+    start_screen()
+
+    hand_tracker.start(frame_bus)  # Background tracker that drives the frame bus
+
+    timing_hud_enabled = args.timing_hud
+    timing_log = StageLog(args.timing_log) if args.timing_log else None
+    frame_timer = StageTimer(log=timing_log)
+    main_game(timer=frame_timer, dirty_rects=args.dirty_rects)
+
+    # Cleanup
+    hand_tracker.stop()  # Stop the tracker before releasing what it owns
+    if landmark_recorder is not None:
+        print(f"Recorded {landmark_recorder.close()} frames of landmarks to {args.record}")
+    level_prefetcher.shutdown()
+    audio.shutdown()
+    print(f"Camera reads per rendered frame: {frame_bus.reads_per_rendered_frame():.2f}")
+    if hand_tracker.roi is not None:
+        print(f"Hand ROI: {hand_tracker.roi_inferences}/{hand_tracker.inferences} inferences on a crop, {hand_tracker.roi_misses} fell back to the full frame")
+    if hand_tracker.scheduler is not None:
+        print(f"Landmarks extrapolated on {hand_tracker.extrapolation_rate():.0%} of tracked frames (inference every {hand_tracker.scheduler.interval} frames)")
+    if timing_log is not None:
+        print(f"Logged stage timings of {timing_log.close()} frames to {args.timing_log}")
+    print(f"Frame timing overhead: {frame_timer.overhead():.2%} of frame time")
+    tracer = trace.active()
+    if tracer is not None:
+        dropped = tracer.dropped()
+        print(f"Wrote {trace.stop_trace()} trace events to {tracer.path}" + (f" ({dropped} oldest dropped)" if dropped else ""))
+    sfx_dispatch = audio.dispatch_stats()
+    if sfx_dispatch is not None:
+        print(f"SFX trigger to channel start: p50 {sfx_dispatch[0]:.3f} ms, p95 {sfx_dispatch[1]:.3f} ms (mixer buffer {audio.buffer} samples)")
+    asset_stats = assets.stats()
+    print(f"Asset cache: {asset_stats['hits']} hits, {asset_stats['misses']} misses, {asset_stats['bytes'] / 2**20:.1f} MB in {asset_stats['entries']} surfaces")
+    print(f"Text cache: {text_cache.hits} hits, {text_cache.misses} misses")
+    cap.release()
+    close_tracker()  # Releases the MediaPipe graph
+    pygame.quit()
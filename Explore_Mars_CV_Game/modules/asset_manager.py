@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+import pygame
+
+def surface_bytes(surface):
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+# Memoizes converted and scaled surfaces so the frame loop never touches the disk
+class AssetManager:
+    def __init__(self, max_bytes=192 * 1024 * 1024, pack=None):
+        self.max_bytes = max_bytes  # LRU bound on cached heap pixels (a 4K background alone is ~33 MB)
+        self.pack = pack  # Optional baked AssetPack, tried before decoding PNGs
+        self.hits = 0
+        self.misses = 0
+        self.cached_bytes = 0  # Heap pixels only: surfaces mapped from the pack count as 0
+        self._cache = OrderedDict()  # (path, size, alpha) -> (Surface, bytes), oldest first
+
+    def load_image(self, path, width=None, height=None, alpha=True):
+        """Return the image at path converted for the display and scaled to (width, height)."""
+        key = (path, (width, height), alpha)
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)  # Mark as most recently used
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        surface = None
+        if self.pack is not None and width is not None and height is not None:
+            surface = self.pack.get(path, width, height, alpha)  # Already scaled, no decode
+        if surface is not None:
+            nbytes = 0 if self.pack.is_mapped(alpha) else surface_bytes(surface)
+        else:
+            surface = pygame.image.load(path)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+            if width is not None and height is not None:
+                surface = pygame.transform.smoothscale(surface, (width, height))
+            nbytes = surface_bytes(surface)
+
+        self._cache[key] = (surface, nbytes)
+        self.cached_bytes += nbytes
+        while self.cached_bytes > self.max_bytes and len(self._cache) > 1:
+            _, (_, evicted_bytes) = self._cache.popitem(last=False)  # Evict the least recently used surface
+            self.cached_bytes -= evicted_bytes
+        return surface
+
+    def preload(self, images):
+        """Warm the cache from (path, width, height, alpha) tuples."""
+        for path, width, height, alpha in images:
+            self.load_image(path, width, height, alpha)
+
+    def stats(self):
+        """Hit/miss counters for reporting."""
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._cache), "bytes": self.cached_bytes}
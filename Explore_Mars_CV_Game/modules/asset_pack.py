@@ -0,0 +1,70 @@
+import json
+import os
+
+import numpy as np
+import pygame
+
+base_dir = os.path.dirname(os.path.abspath(__file__))
+base_dir = os.path.dirname(base_dir)  # Go one level up
+baked_dir = os.path.join(base_dir, 'baked')  # Output of development_modules/bake_assets.py
+
+PACK_FORMAT = "BGRA"  # Byte order of ARGB8888, the usual 32-bit display format
+
+# UI images main.py loads through load_image(), baked alongside the level assets
+UI_IMAGES = [
+    ("speaker.png", 50, 50),
+    ("mute.png", 50, 50),
+    ("fist.png", 50, 50),
+    ("left.png", 50, 50),
+    ("right.png", 50, 50),
+    ("up.png", 50, 50),
+    ("down.png", 50, 50),
+    ("chimpu.png", 100, 100),
+    ("start_chimpu.png", 150, 150),
+]
+
+def pack_dir(width, height):
+    """Directory holding the baked pack for one display resolution."""
+    return os.path.join(baked_dir, f"{width}x{height}")
+
+def pack_key(path, width, height, alpha):
+    """Index key for an image, with the path made relative to the game directory."""
+    rel_path = os.path.relpath(os.path.abspath(path), base_dir).replace(os.sep, "/")
+    return f"{rel_path}|{width}x{height}|{'alpha' if alpha else 'opaque'}"
+
+# Pre-scaled, display-format pixels memory-mapped from baked/<w>x<h>/pack.bin
+class AssetPack:
+    def __init__(self, directory):
+        with open(os.path.join(directory, "index.json")) as f:
+            index = json.load(f)
+        self.name = os.path.basename(directory)
+        self.entries = index["entries"]
+        self._data = np.memmap(os.path.join(directory, "pack.bin"), dtype=np.uint8, mode="r")
+
+    @classmethod
+    def open(cls, width, height):
+        """Return the pack baked for this resolution, or None so callers fall back to the PNGs."""
+        directory = pack_dir(width, height)
+        if not os.path.exists(os.path.join(directory, "index.json")):
+            return None
+        try:
+            return cls(directory)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Warning: Ignoring asset pack {directory}: {e}")
+            return None
+
+    def get(self, path, width, height, alpha=True):
+        """Surface for a baked image, or None if it was not baked at this size."""
+        entry = self.entries.get(pack_key(path, width, height, alpha))
+        if entry is None:
+            return None
+        offset, nbytes = entry["offset"], entry["nbytes"]
+        pixels = self._data[offset:offset + nbytes]  # Still backed by the mapped file
+        surface = pygame.image.frombuffer(pixels, tuple(entry["size"]), PACK_FORMAT)
+        # Opaque images are converted once so blits skip the per-pixel alpha path
+        return surface if alpha else surface.convert()
+
+    @staticmethod
+    def is_mapped(alpha):
+        """Whether get() returns a view of the mapped file (pages the OS can drop) rather than a heap copy."""
+        return alpha  # Opaque images are converted, which copies them
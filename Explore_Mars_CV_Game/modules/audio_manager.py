@@ -0,0 +1,185 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pygame
+
+MIXER_FREQUENCY = 44100
+MIXER_BUFFER = 512  # Samples per mixer callback: smaller means lower SFX latency (512 is ~12 ms at 44.1 kHz)
+MUSIC_CHANNELS = 2  # Reserved channels the level music crossfades between
+SOUND_CACHE_BYTES = 128 * 1024 * 1024  # Decoded PCM kept around: a few levels' music tracks at ~30 MB each
+
+def sound_bytes(sound):
+    """PCM bytes a decoded Sound holds at the mixer's format."""
+    frequency, size, channels = pygame.mixer.get_init()
+    return int(sound.get_length() * frequency * channels * abs(size) // 8)
+
+# Game audio: sounds are decoded once into PCM Sounds kept in a byte-bounded LRU, SFX play on reserved channels,
+# level music is decoded off the frame loop and crossfaded in, and mute only touches the mixer on a change
+class AudioManager:
+    def __init__(self, sfx_channels=4, crossfade_ms=1000, cooldown=1.0, buffer=MIXER_BUFFER, cache_bytes=SOUND_CACHE_BYTES):
+        self.sfx_channel_count = sfx_channels  # Reserved for SFX so music never steals them
+        self.crossfade_ms = crossfade_ms  # Old and new level music overlap this long
+        self.cooldown = cooldown  # Seconds before the same SFX can play again
+        self.buffer = buffer
+        self.muted = False  # Mutes the music (SFX keep playing, as before)
+        self.dispatch_times = deque(maxlen=256)  # Seconds from play() being asked for to the channel starting
+        self.music_path = None  # Music playing (or being crossfaded in)
+        self.cache_bytes = cache_bytes  # LRU bound on decoded sounds (ones in use are never evicted)
+        self.cached_bytes = 0
+        self._sounds = OrderedDict()  # path -> (decoded Sound, bytes), least recently used first
+        self._sounds_lock = threading.Lock()
+        self._named = {}  # SFX name -> Sound for the current level
+        self._last_played = {}  # SFX name -> perf_counter time of its last trigger
+        self._pending_music = None  # (path, Future[Sound]) decoding in the background
+        self._music_channels = ()
+        self._sfx_channels = ()
+        self._music_index = 0  # Music channel currently playing
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AudioDecode")
+
+    def init(self):
+        """Open the mixer with a small buffer and reserve the music and SFX channels (fine on a startup worker)."""
+        pygame.mixer.init(frequency=MIXER_FREQUENCY, size=-16, channels=2, buffer=self.buffer)
+        reserved = MUSIC_CHANNELS + self.sfx_channel_count
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved))
+        pygame.mixer.set_reserved(reserved)  # Sound.play() and find_channel() never take these
+        self._music_channels = tuple(pygame.mixer.Channel(i) for i in range(MUSIC_CHANNELS))
+        self._sfx_channels = tuple(pygame.mixer.Channel(i) for i in range(MUSIC_CHANNELS, reserved))
+
+    def sound(self, path):
+        """Decoded Sound for a file, decoding it only if it is not cached (thread-safe)."""
+        with self._sounds_lock:
+            sound = self._cached(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)  # MP3 -> PCM, outside the lock
+            with self._sounds_lock:
+                cached = self._cached(path)
+                if cached is not None:
+                    return cached  # Another thread decoded it first
+                nbytes = sound_bytes(sound)
+                self._sounds[path] = (sound, nbytes)
+                self.cached_bytes += nbytes
+                self._trim()
+        return sound
+
+    def release(self, path):
+        """Drop a file's decoded Sound (e.g. for a level the prefetcher evicted) unless it is playing or registered."""
+        with self._sounds_lock:
+            entry = self._sounds.get(path)
+            if entry is not None and not self._in_use(path, entry[0]):
+                del self._sounds[path]
+                self.cached_bytes -= entry[1]
+
+    def register(self, name, path):
+        """Make a file playable as play(name), e.g. register("success", level["sounds"]["success"])."""
+        self._named[name] = self.sound(path)
+
+    def play(self, name):
+        """Play a registered SFX on a reserved channel unless it is still cooling down; returns whether it played."""
+        triggered = time.perf_counter()
+        if triggered - self._last_played.get(name, -float("inf")) < self.cooldown:
+            return False
+        self._last_played[name] = triggered
+        channel = next((c for c in self._sfx_channels if not c.get_busy()), self._sfx_channels[0])
+        channel.play(self._named[name])
+        self.dispatch_times.append(time.perf_counter() - triggered)
+        return True
+
+    def play_music(self, path, wait=False):
+        """Switch the looping music; an uncached file is decoded on a worker and crossfaded in by update()."""
+        if path == self.music_path:
+            return  # Same track as the last level: keep it playing
+        self.music_path = path
+        with self._sounds_lock:
+            cached = self._cached(path)
+        if cached is not None or wait:
+            self._pending_music = None
+            self._crossfade(cached if cached is not None else self.sound(path))
+        else:
+            self._pending_music = (path, self._executor.submit(self.sound, path))
+
+    def update(self):
+        """Once per frame: start a crossfade when background-decoded music is ready."""
+        if self._pending_music is None or not self._pending_music[1].done():
+            return
+        path, future = self._pending_music
+        self._pending_music = None
+        try:
+            self._crossfade(future.result())
+        except (pygame.error, OSError) as e:
+            print(f"Error: Failed to load music {path}: {e}")
+
+    def set_muted(self, muted):
+        """Pause or resume the music; does nothing unless the mute state actually changes."""
+        if muted == self.muted:
+            return
+        self.muted = muted
+        for channel in self._music_channels:
+            if muted:
+                channel.pause()
+            else:
+                channel.unpause()
+
+    def measure_latency(self, trials=10, click_ms=20):
+        """
+        Measure SFX trigger-to-output latency, in seconds per trial.
+
+        Each trial plays a short silent click on an SFX channel and times how long after play() the
+        mixer finishes it, minus the click's length: the wait until the mixer picks the sound up.
+        One buffer of device queue (buffer / frequency) is added on top, since that is how long the
+        mixed samples sit before the sound card plays them.
+        """
+        frequency, size, channels = pygame.mixer.get_init()
+        samples = int(frequency * click_ms / 1000)
+        click = pygame.mixer.Sound(buffer=bytes(samples * channels * abs(size) // 8))
+        channel = self._sfx_channels[-1]
+        queue = self.buffer / frequency
+        latencies = []
+        for _ in range(trials):
+            channel.stop()
+            start = time.perf_counter()
+            channel.play(click)
+            while channel.get_busy():
+                time.sleep(0.0005)
+            latencies.append(max(time.perf_counter() - start - click.get_length(), 0.0) + queue)
+        return latencies
+
+    def dispatch_stats(self):
+        """(p50, p95) milliseconds from an SFX trigger to its channel starting, or None before any SFX."""
+        if not self.dispatch_times:
+            return None
+        p50, p95 = np.percentile(np.asarray(self.dispatch_times) * 1000.0, [50, 95])
+        return float(p50), float(p95)
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _cached(self, path):
+        entry = self._sounds.get(path)
+        if entry is None:
+            return None
+        self._sounds.move_to_end(path)  # Most recently used
+        return entry[0]
+
+    def _in_use(self, path, sound):
+        return path == self.music_path or any(named is sound for named in self._named.values())
+
+    def _trim(self):
+        """Evict least recently used sounds while over budget, skipping the music and registered SFX."""
+        for path, (sound, nbytes) in list(self._sounds.items()):
+            if self.cached_bytes <= self.cache_bytes:
+                break
+            if not self._in_use(path, sound):
+                del self._sounds[path]
+                self.cached_bytes -= nbytes
+
+    def _crossfade(self, sound):
+        old = self._music_channels[self._music_index]
+        self._music_index = (self._music_index + 1) % len(self._music_channels)
+        new = self._music_channels[self._music_index]
+        old.fadeout(self.crossfade_ms)
+        new.play(sound, loops=-1, fade_ms=self.crossfade_ms)
+        if self.muted:
+            new.pause()
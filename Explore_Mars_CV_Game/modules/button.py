@@ -1,10 +1,8 @@
 import pygame, time
+from modules.text_cache import render_text
 
-# Initialize pygame
-pygame.init()
-
-# Font for the button text
-font = pygame.font.SysFont(None, 30)
+# Font size for the button text
+font_size = 30
 
 # Button class to create customized buttons
 class Button:
@@ -20,7 +18,7 @@ class Button:
     def draw(self, surface):
         # Draw the button (color and text)
         pygame.draw.rect(surface, self.color, self.rect)
-        text_surface = font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.text, None, font_size, self.text_color)  # Re-rendered only when the label changes
         text_rect = text_surface.get_rect(center=self.rect.center)
         surface.blit(text_surface, text_rect)  # Draw text centered on the button
 
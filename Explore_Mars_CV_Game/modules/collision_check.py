@@ -1,6 +1,11 @@
+from collections import namedtuple
+
 import pygame
 
+from frame_timing.trace import traced
+
 # Function to check for collision with bounding boxes
+@traced()
 def check_for_collision(rover_rect, stone_coords, pithole_coords):
     for (start_x, start_y, end_x, end_y) in stone_coords:
         object_rect = pygame.Rect(start_x, start_y, end_x - start_x, end_y - start_y)
@@ -10,4 +15,115 @@ def check_for_collision(rover_rect, stone_coords, pithole_coords):
         object_rect = pygame.Rect(start_x, start_y, end_x - start_x, end_y - start_y)
         if rover_rect.colliderect(object_rect):
             return "pithole"
-    return None
\ No newline at end of file
+    return None
+
+# One annotated zone: id is its position in the index (stones first, then pitholes)
+Zone = namedtuple("Zone", ["zone_id", "zone_type", "coords", "rect"])
+
+# Per-level zone index built once in load_level(), with a uniform-grid spatial hash
+class ZoneIndex:
+    def __init__(self, stone_coords, pithole_coords, cell_size=128):
+        self.cell_size = cell_size
+        self.zones = []
+        for zone_type, coords_list in (("stone", stone_coords), ("pithole", pithole_coords)):
+            for coords in coords_list:
+                start_x, start_y, end_x, end_y = coords
+                rect = pygame.Rect(start_x, start_y, end_x - start_x, end_y - start_y)
+                self.zones.append(Zone(len(self.zones), zone_type, tuple(coords), rect))
+
+        # Grid cell -> ids of the zones overlapping it
+        self._grid = {}
+        for zone in self.zones:
+            for cell in self._cells(zone.rect):
+                self._grid.setdefault(cell, []).append(zone.zone_id)
+
+        # First and last occupied column and row, where nearest-zone searches stop growing
+        if self._grid:
+            cols = [col for col, _ in self._grid]
+            rows = [row for _, row in self._grid]
+            self._extent = (min(cols), min(rows), max(cols), max(rows))
+
+    def _cells(self, rect):
+        first_col, first_row = rect.left // self.cell_size, rect.top // self.cell_size
+        last_col, last_row = (rect.right - 1) // self.cell_size, (rect.bottom - 1) // self.cell_size
+        for row in range(first_row, last_row + 1):
+            for col in range(first_col, last_col + 1):
+                yield (col, row)
+
+    def query_all(self, rect):
+        """Return every zone colliding with rect, stones before pitholes as listed."""
+        candidates = set()
+        for cell in self._cells(rect):
+            candidates.update(self._grid.get(cell, ()))
+        return [self.zones[zone_id] for zone_id in sorted(candidates) if rect.colliderect(self.zones[zone_id].rect)]
+
+    @traced("ZoneIndex.query")
+    def query(self, rect):
+        """
+        Return the colliding zone main_game() used to act on, or None.
+
+        That was the type check_for_collision() reports (stones before pitholes), then the last
+        colliding zone of that type, since the old loop over the coordinates let later zones win.
+        """
+        hits = self.query_all(rect)
+        if not hits:
+            return None
+        return [zone for zone in hits if zone.zone_type == hits[0].zone_type][-1]
+
+    def nearest_unanalyzed(self, point, analyzed_stones, analyzed_pitholes):
+        """
+        Return the unanalyzed zone closest to point (distance to its rect, 0 inside it), or None.
+
+        Searches the grid ring by ring outward from point's cell and stops once no zone outside
+        the rings searched so far can be closer; ties go to the lower zone id.
+        """
+        x, y = point
+        analyzed = {"stone": analyzed_stones, "pithole": analyzed_pitholes}
+        col, row = int(x // self.cell_size), int(y // self.cell_size)
+        best, best_key = None, None
+        seen = set()
+        radius = 0
+        while self._grid:
+            for cell in self._ring(col, row, radius):
+                for zone_id in self._grid.get(cell, ()):
+                    if zone_id in seen:
+                        continue
+                    seen.add(zone_id)
+                    zone = self.zones[zone_id]
+                    if zone.coords in analyzed[zone.zone_type]:
+                        continue
+                    key = (self._distance_sq(zone.rect, x, y), zone_id)
+                    if best_key is None or key < best_key:
+                        best, best_key = zone, key
+
+            # Every zone not seen yet lies outside the searched block of cells
+            left, top = (col - radius) * self.cell_size, (row - radius) * self.cell_size
+            right, bottom = (col + radius + 1) * self.cell_size, (row + radius + 1) * self.cell_size
+            margin = min(x - left, right - x, y - top, bottom - y)
+            if best_key is not None and best_key[0] < margin * margin:
+                break
+            if self._covers_grid(col - radius, row - radius, col + radius, row + radius):
+                break
+            radius += 1
+        return best
+
+    def _ring(self, col, row, radius):
+        if radius == 0:
+            yield (col, row)
+            return
+        for c in range(col - radius, col + radius + 1):
+            yield (c, row - radius)
+            yield (c, row + radius)
+        for r in range(row - radius + 1, row + radius):
+            yield (col - radius, r)
+            yield (col + radius, r)
+
+    def _covers_grid(self, first_col, first_row, last_col, last_row):
+        min_col, min_row, max_col, max_row = self._extent
+        return first_col <= min_col and first_row <= min_row and last_col >= max_col and last_row >= max_row
+
+    @staticmethod
+    def _distance_sq(rect, x, y):
+        dx = max(rect.left - x, 0, x - rect.right)
+        dy = max(rect.top - y, 0, y - rect.bottom)
+        return dx * dx + dy * dy
@@ -0,0 +1,36 @@
+import pygame
+
+# Redraws only the screen regions that changed since the previous frame
+class DirtyRectRenderer:
+    def __init__(self, screen):
+        self.screen = screen
+        self.static_layer = None  # Background plus HUD that rarely changes
+        self.full_redraw = True  # Next frame repaints and flips the whole screen
+        self._previous_rects = []  # Regions drawn last frame, restored before drawing again
+
+    def set_static_layer(self, layer):
+        """Replace the cached background layer and force a full redraw."""
+        self.static_layer = layer
+        self.invalidate()
+
+    def invalidate(self):
+        """Fall back to a full redraw on the next frame (level change, preview toggle, ...)."""
+        self.full_redraw = True
+
+    def begin_frame(self):
+        """Restore last frame's dirty regions (or the whole screen) from the static layer."""
+        if self.full_redraw:
+            self.screen.blit(self.static_layer, (0, 0))
+        else:
+            for rect in self._previous_rects:
+                self.screen.blit(self.static_layer, rect, rect)
+
+    def present(self, rects):
+        """Push the regions drawn this frame, plus the ones they replaced, to the display."""
+        rects = [rect for rect in rects if rect is not None]
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self._previous_rects + rects)
+        self._previous_rects = rects
@@ -0,0 +1,87 @@
+import math
+import time
+
+# Fixed-timestep simulation clock: frame time is banked and spent in equal steps, so gameplay
+# is the same whatever the render or camera rate
+class FixedStepClock:
+    def __init__(self, step=1 / 60, max_steps=8):
+        self.step = step  # Seconds of game time per simulation step
+        self.max_steps = max_steps  # Steps per frame before the backlog is dropped (no spiral of death)
+        self.time = 0.0  # Simulated seconds since the loop started
+        self.steps = 0  # Simulation steps run
+        self.dropped = 0.0  # Seconds of backlog thrown away after stalls
+        self._accumulator = 0.0
+        self._last = None
+
+    def reset(self):
+        """Forget time spent outside the loop (level-complete screens) so it isn't simulated in a burst."""
+        self._accumulator = 0.0
+        self._last = None
+
+    def advance(self, frame_time=None):
+        """Bank one rendered frame's time (measured when None) and return how many steps to simulate."""
+        now = time.perf_counter()
+        if frame_time is None:
+            frame_time = now - self._last if self._last is not None else 0.0
+        self._last = now
+        self._accumulator += frame_time
+        steps = int(self._accumulator / self.step + 1e-9)  # Tolerance so 60 x (1/60) is 60 steps
+        if steps > self.max_steps:
+            self.dropped += (steps - self.max_steps) * self.step
+            self._accumulator -= (steps - self.max_steps) * self.step
+            steps = self.max_steps
+        return steps
+
+    def tick(self):
+        """Consume one step of banked time; returns the new simulated time."""
+        self._accumulator -= self.step
+        self.time += self.step
+        self.steps += 1
+        return self.time
+
+    def alpha(self):
+        """Fraction of a step between the last two simulated states, for render interpolation."""
+        return min(max(self._accumulator / self.step, 0.0), 1.0)
+
+# Rover kinematics: velocity eases toward the held direction at a fixed acceleration
+class RoverBody:
+    def __init__(self, x, y, max_speed=50.0, acceleration=400.0, bounds=None):
+        self.max_speed = max_speed  # Pixels per second
+        self.acceleration = acceleration  # Pixels per second squared, also used to brake
+        self.bounds = bounds  # (max_x, max_y) for the rover's top-left corner, None for no limit
+        self.place(x, y)
+
+    def place(self, x, y):
+        """Put the rover at rest at (x, y), with nothing to interpolate from."""
+        self.x, self.y = self.prev_x, self.prev_y = float(x), float(y)
+        self.vx = self.vy = 0.0
+
+    def step(self, dt, direction=None):
+        """Advance dt seconds while steering toward direction (a unit (dx, dy) or None to stop)."""
+        self.prev_x, self.prev_y = self.x, self.y
+        target_x, target_y = (direction[0] * self.max_speed, direction[1] * self.max_speed) if direction else (0.0, 0.0)
+        dvx, dvy = target_x - self.vx, target_y - self.vy
+        change = math.hypot(dvx, dvy)
+        max_change = self.acceleration * dt
+        if change > max_change:
+            dvx, dvy = dvx * max_change / change, dvy * max_change / change
+        self.vx += dvx
+        self.vy += dvy
+        self.x += self.vx * dt
+        self.y += self.vy * dt
+
+        # Stop against the screen edges instead of pushing into them
+        if self.bounds is not None:
+            max_x, max_y = self.bounds
+            if not 0 <= self.x <= max_x:
+                self.x, self.vx = min(max(self.x, 0.0), max_x), 0.0
+            if not 0 <= self.y <= max_y:
+                self.y, self.vy = min(max(self.y, 0.0), max_y), 0.0
+
+    def moving(self):
+        return self.vx != 0.0 or self.vy != 0.0
+
+    def position(self, alpha=1.0):
+        """Integer draw position between the previous (alpha=0) and current (alpha=1) step."""
+        return (int(round(self.prev_x + (self.x - self.prev_x) * alpha)),
+                int(round(self.prev_y + (self.y - self.prev_y) * alpha)))
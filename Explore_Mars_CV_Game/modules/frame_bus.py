@@ -0,0 +1,41 @@
+import threading
+import time
+
+from frame_timing import trace
+
+# Single owner of cap.read(): every captured frame is decoded once and shared
+class FrameBus:
+    def __init__(self, cap):
+        self.cap = cap  # OpenCV capture device
+        self.reads = 0  # Total cap.read() calls that returned a frame
+        self.rendered_frames = 0  # Frames presented by the render loop
+        self._frame = None  # Latest decoded BGR frame (full camera resolution)
+        self._capture_time = 0
+        self._lock = threading.Lock()
+
+    def read(self):
+        """Grab and decode the next camera frame and publish it to all consumers."""
+        with trace.span("cap.read"):
+            ret, frame = self.cap.read()
+        capture_time = time.time()
+        if ret:
+            with self._lock:
+                self._frame = frame
+                self._capture_time = capture_time
+                self.reads += 1
+        return ret, frame, capture_time
+
+    def latest(self):
+        """Return (frame, capture_time) of the newest published frame, or (None, 0)."""
+        with self._lock:
+            return self._frame, self._capture_time
+
+    def mark_rendered(self):
+        """Count one presented game frame (used for the reads-per-frame stat)."""
+        self.rendered_frames += 1
+
+    def reads_per_rendered_frame(self):
+        """Camera reads per presented frame; should never exceed 1."""
+        if self.rendered_frames == 0:
+            return 0.0
+        return self.reads / self.rendered_frames
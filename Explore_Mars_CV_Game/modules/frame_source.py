@@ -0,0 +1,62 @@
+import os
+import time
+
+import numpy as np
+
+# Recorded frames behind the cv2.VideoCapture interface (read/isOpened/release), for runs without a webcam
+class FileFrameSource:
+    def __init__(self, path, fps=30.0, loop=True):
+        self.path = path
+        self.fps = fps  # Reads are paced like a camera at this rate; 0 reads as fast as possible
+        self.loop = loop  # Start over at the end instead of reporting a failed read
+        self.frames_read = 0
+        self._frames = None  # .npy: (N, H, W, 3) uint8 BGR, memory-mapped
+        self._video = None  # Anything else is decoded with OpenCV
+        self._index = 0
+        self._next_read = 0
+
+        if os.path.splitext(path)[1].lower() == ".npy":
+            self._frames = np.load(path, mmap_mode="r")
+            if self._frames.ndim != 4 or self._frames.shape[-1] != 3 or self._frames.dtype != np.uint8:
+                raise ValueError(f"{path}: expected (N, H, W, 3) uint8 frames, got {self._frames.shape} {self._frames.dtype}")
+        else:
+            import cv2
+            self._video = cv2.VideoCapture(path)
+
+    def isOpened(self):
+        if self._frames is not None:
+            return len(self._frames) > 0
+        return self._video.isOpened()
+
+    def read(self):
+        """(ret, frame) like cv2.VideoCapture.read(), waiting for the next frame slot first."""
+        self._pace()
+        if self._frames is not None:
+            if self._index >= len(self._frames):
+                if not self.loop:
+                    return False, None
+                self._index = 0
+            frame = np.array(self._frames[self._index])  # Copy out of the map, like a decoded camera frame
+            self._index += 1
+        else:
+            ret, frame = self._video.read()
+            if not ret and self.loop:
+                import cv2
+                self._video.set(cv2.CAP_PROP_POS_FRAMES, 0)
+                ret, frame = self._video.read()
+            if not ret:
+                return False, None
+        self.frames_read += 1
+        return True, frame
+
+    def release(self):
+        if self._video is not None:
+            self._video.release()
+
+    def _pace(self):
+        if not self.fps:
+            return
+        now = time.perf_counter()
+        if now < self._next_read:
+            time.sleep(self._next_read - now)
+        self._next_read = max(now, self._next_read) + 1.0 / self.fps
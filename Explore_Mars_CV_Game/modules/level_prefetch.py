@@ -0,0 +1,100 @@
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+from modules.asset_manager import surface_bytes
+
+# Everything load_level() needs from disk, already decoded and scaled
+# (sounds are warmed in the AudioManager's cache, which bounds them itself)
+LoadedLevel = namedtuple("LoadedLevel", ["background", "rover", "logo", "nbytes"])
+
+# Decodes upcoming levels on a worker thread while the current level is played
+class LevelPrefetcher:
+    def __init__(self, level_configs, screen_size, memory_budget=512 * 1024 * 1024, pack=None, audio=None):
+        self.level_configs = level_configs
+        self.pack = pack  # Optional baked AssetPack, tried before decoding PNGs
+        self.audio = audio  # Optional AudioManager whose decoded-sound cache is warmed (music included) and released
+        self.screen_size = screen_size  # Backgrounds are scaled to the full screen
+        self.memory_budget = memory_budget  # Max bytes of decoded level surfaces kept around
+        self._futures = {}  # level index -> Future[LoadedLevel]
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="LevelPrefetch")
+
+    def prefetch(self, level_index):
+        """Start decoding a level in the background (no-op if queued or out of range)."""
+        if not 0 <= level_index < len(self.level_configs):
+            return
+        with self._lock:
+            if level_index not in self._futures:
+                self._futures[level_index] = self._executor.submit(self._decode, level_index)
+
+    def take(self, level_index):
+        """Hand over a prefetched level, waiting only if it is still decoding; None if never queued."""
+        with self._lock:
+            future = self._futures.pop(level_index, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except (pygame.error, OSError) as e:
+            print(f"Error: Failed to prefetch level {level_index + 1}: {e}")
+            return None
+
+    def evict(self, current_index):
+        """Drop levels that are no longer needed, then the farthest ones while over budget, with their sounds."""
+        with self._lock:
+            for level_index in [i for i in self._futures if i <= current_index]:
+                self._futures.pop(level_index).cancel()
+
+            def used_bytes():
+                return sum(f.result().nbytes for f in self._futures.values() if f.done() and f.exception() is None)
+
+            dropped = list(range(current_index))  # Levels already played
+            while self._futures and used_bytes() > self.memory_budget:
+                farthest = max(self._futures)
+                self._futures.pop(farthest).cancel()
+                dropped.append(farthest)
+            kept = [current_index, *self._futures]
+        self._release_sounds(dropped, kept)
+
+    def shutdown(self):
+        """Stop the worker (queued levels are discarded)."""
+        with self._lock:
+            self._futures.clear()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _decode(self, level_index):
+        level = self.level_configs[level_index]
+
+        background, background_bytes = self._load_surface(level["background"], self.screen_size, alpha=False)
+        rover, rover_bytes = self._load_surface(level["rover"], (120, 120))
+        logo, logo_bytes = self._load_surface(level["logo"], (120, 120))
+
+        if self.audio is not None:
+            for path in level["sounds"].values():
+                self.audio.sound(path)  # Lets register() and play_music() (crossfade) start straight away
+
+        return LoadedLevel(background, rover, logo, background_bytes + rover_bytes + logo_bytes)
+
+    def _release_sounds(self, dropped, kept):
+        """Let the AudioManager free dropped levels' sounds that no kept level shares."""
+        if self.audio is None:
+            return
+        needed = {path for i in kept if 0 <= i < len(self.level_configs) for path in self.level_configs[i]["sounds"].values()}
+        for i in dropped:
+            for path in self.level_configs[i]["sounds"].values():
+                if path not in needed:
+                    self.audio.release(path)
+
+    def _load_surface(self, path, size, alpha=True):
+        """(surface, heap bytes), the bytes being 0 for a surface mapped from the pack."""
+        if self.pack is not None:
+            surface = self.pack.get(path, size[0], size[1], alpha)
+            if surface is not None:
+                return surface, 0 if self.pack.is_mapped(alpha) else surface_bytes(surface)
+        # Same load -> convert -> smoothscale steps as AssetManager.load_image()
+        surface = pygame.image.load(path)
+        surface = surface.convert_alpha() if alpha else surface.convert()
+        surface = pygame.transform.smoothscale(surface, size)
+        return surface, surface_bytes(surface)
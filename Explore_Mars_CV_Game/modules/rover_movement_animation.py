@@ -1,23 +1,83 @@
-import random
+import numpy as np
 import pygame
-class Particle:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.life = 30
-        self.color = (139, 69, 19)  # Martian dust color
-        self.size = random.randint(3, 6)
-        self.vel_x = random.uniform(-1, 1)
-        self.vel_y = random.uniform(-1, 2)
-
-    def update(self):
-        self.x += self.vel_x
-        self.y += self.vel_y
-        self.life -= 1
+
+from frame_timing.trace import traced
+
+DUST_COLOR = (139, 69, 19)  # Martian dust color
+PARTICLE_LIFE = 0.5  # Seconds a dust particle stays alive (the old 30 frames at 60 fps)
+PARTICLE_SPEED = 60.0  # Pixels per second of the initial drift (the old 1 pixel per frame at 60 fps)
+ALPHA_BUCKETS = 8  # Pre-rendered fade steps per particle size
+
+# Pooled dust particles backed by fixed-size NumPy arrays
+class ParticleSystem:
+    def __init__(self, capacity=256, spawn_budget=5):
+        self.capacity = capacity  # Hard cap on live particles
+        self.spawn_budget = spawn_budget  # Max particles emitted per simulation step (reset by update())
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)  # Seconds left, <= 0 means the slot is free
+        self.size = np.zeros(capacity, dtype=np.int16)
+        self._rng = np.random.default_rng()
+        self._emit_carry = 0.0  # Fraction of a particle owed by emit_for()
+        self._spawned = 0  # Particles emitted since the last update(), counted against spawn_budget
+        self._sprites = {}  # (size, alpha bucket) -> pre-rendered dust surface
+
+    def emit(self, x, y, count):
+        """Spawn up to count particles at (x, y), limited by what is left of the step's budget and free slots."""
+        allowance = min(count, self.spawn_budget - self._spawned)
+        if allowance <= 0:
+            return
+        free = np.flatnonzero(self.life <= 0)[:allowance]
+        n = len(free)
+        if n == 0:
+            return
+        self._spawned += n
+        self.pos[free] = (x, y)
+        self.vel[free, 0] = self._rng.uniform(-1, 1, n) * PARTICLE_SPEED
+        self.vel[free, 1] = self._rng.uniform(-1, 2, n) * PARTICLE_SPEED
+        self.life[free] = PARTICLE_LIFE
+        self.size[free] = self._rng.integers(3, 7, n)  # 3 to 6 pixels, like the old Particle
+
+    def emit_for(self, x, y, rate, dt):
+        """Spawn rate particles per second over dt seconds, carrying the fraction over to the next call."""
+        self._emit_carry += rate * dt
+        count = int(self._emit_carry)
+        self._emit_carry -= count
+        self.emit(x, y, count)
+
+    @traced("ParticleSystem.update")
+    def update(self, dt):
+        """Advance every live particle by dt seconds in a single vectorized pass."""
+        alive = self.life > 0
+        self.pos[alive] += self.vel[alive] * dt
+        self.life[alive] -= dt
+        self._spawned = 0  # The next step's spawn budget starts here
+
+    def clear(self):
+        """Drop every live particle (a new level starts without the last one's dust)."""
+        self.life[:] = 0
 
     def draw(self, surface):
-        if self.life > 0:
-            alpha = max(0, int(255 * (self.life / 30)))
-            dust_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-            pygame.draw.circle(dust_surface, (*self.color, alpha), (self.size // 2, self.size // 2), self.size // 2)
-            surface.blit(dust_surface, (self.x, self.y))
\ No newline at end of file
+        """Blit every live particle from the sprite cache (once per rendered frame); returns the covered rects."""
+        alive = np.flatnonzero(self.life > 0)
+        if len(alive) == 0:
+            return []
+
+        buckets = np.ceil(self.life[alive] * (ALPHA_BUCKETS / PARTICLE_LIFE)).astype(np.int32) - 1
+        np.clip(buckets, 0, ALPHA_BUCKETS - 1, out=buckets)
+        positions = self.pos[alive].astype(np.int32).tolist()
+        sizes = self.size[alive].tolist()
+        blit_sequence = [
+            (self._sprite(size, bucket), position)
+            for size, bucket, position in zip(sizes, buckets.tolist(), positions)
+        ]
+        return surface.blits(blit_sequence)
+
+    def _sprite(self, size, bucket):
+        sprite = self._sprites.get((size, bucket))
+        if sprite is None:
+            alpha = int(255 * (bucket + 1) / ALPHA_BUCKETS)
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*DUST_COLOR, alpha), (size // 2, size // 2), size // 2)
+            self._sprites[(size, bucket)] = sprite
+        return sprite
@@ -0,0 +1,32 @@
+import threading
+import time
+from contextlib import contextmanager
+
+# Records how long each startup phase took and on which thread (for --profile-startup)
+class StartupProfiler:
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start  # Launch time reference
+        self.phases = []  # (name, start, end, thread name)
+        self._lock = threading.Lock()
+
+    def record(self, name, start, end):
+        with self._lock:
+            self.phases.append((name, start, end, threading.current_thread().name))
+
+    @contextmanager
+    def phase(self, name):
+        """Time the enclosed block as one startup phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def report(self):
+        """Phases in start order with their duration and offset from launch."""
+        total = time.perf_counter() - self.start
+        lines = ["Startup profile:"]
+        for name, start, end, thread in sorted(self.phases, key=lambda phase: phase[1]):
+            lines.append(f"  {name:<12} {(end - start) * 1000:8.1f} ms  (+{(start - self.start) * 1000:.0f} ms, {thread})")
+        lines.append(f"  {'total':<12} {total * 1000:8.1f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,60 @@
+from collections import OrderedDict
+
+import pygame
+
+# Font registry: SysFont lookups are slow, so each (name, size) is created once
+_fonts = {}
+
+def get_font(name, size):
+    """Return a shared pygame Font for a system font name (None for the default font)."""
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+# Rendered-text surface cache, re-rendering only when the text itself changes
+class TextCache:
+    def __init__(self, max_entries=128):
+        self.max_entries = max_entries  # LRU bound on cached surfaces
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()  # (text, font, size, color, antialias) or a background key -> Surface
+
+    def render(self, text, font_name, size, color, antialias=True):
+        """Return a surface for text, rendering it only on the first request."""
+        key = (text, font_name, size, tuple(color), antialias)
+        return self._get(key, lambda: get_font(font_name, size).render(text, antialias, color))
+
+    def background(self, text, font_name, size, padding, fill):
+        """Return a fill-colored panel the size of the rendered text plus padding on each side."""
+        def build():
+            text_width, text_height = get_font(font_name, size).size(text)
+            surface = pygame.Surface((text_width + 2 * padding, text_height + 2 * padding), pygame.SRCALPHA)
+            surface.fill(fill)
+            return surface
+
+        key = ("background", text, font_name, size, padding, tuple(fill))
+        return self._get(key, build)
+
+    def _get(self, key, build):
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)  # Mark as most recently used
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = build()
+        self._cache[key] = surface
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)  # Evict the least recently used surface
+        return surface
+
+# Shared cache used by text_configs, Button and the game loop
+text_cache = TextCache()
+
+def render_text(text, font_name, size, color, antialias=True):
+    """Cached equivalent of get_font(font_name, size).render(text, antialias, color)."""
+    return text_cache.render(text, font_name, size, color, antialias)
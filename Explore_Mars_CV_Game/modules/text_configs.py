@@ -1,18 +1,17 @@
 import pygame, sys, os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from modules.configs import *
-pygame.init()
+from modules.text_cache import render_text, text_cache
 
 # Function to display text on the screen
 def display_text(text, x, y, font_size=30):
-    font = pygame.font.SysFont(None, font_size)
-    text_surface = font.render(text, True, TEXT_COLOR)
-    screen.blit(text_surface, (x, y))
+    text_surface = render_text(text, None, font_size, TEXT_COLOR)  # Cached font and surface
+    pygame.display.get_surface().blit(text_surface, (x, y))
 
 # Function to draw the logo in the top-right corner
 def draw_logo(surface, logo_img):
     logo_width, logo_height = logo_img.get_size()  # Get the dimensions of the logo
-    logo_x = screen_width - logo_width - 20        # Position 20px from the right edge
+    logo_x = surface.get_width() - logo_width - 20  # Position 20px from the right edge
     logo_y = 20                                    # Position 20px from the top edge
 
     # Create a glow effect around the logo (optional)
@@ -23,31 +22,30 @@ def draw_logo(surface, logo_img):
 
 # Function to display text with a semi-transparent background at the center of the screen
 def display_text_with_background(surface, text, font_size=30):
-    # Set up the font and text
-    font = pygame.font.SysFont(None, font_size)
-    text_surface = font.render(text, True, TEXT_COLOR)
+    # Set up the font and text (cached until the text changes)
+    text_surface = render_text(text, None, font_size, TEXT_COLOR)
     
     # Get the width and height of the text
     text_width, text_height = text_surface.get_size()
 
     # Calculate the position to center the text
-    text_x = (screen_width - text_width) // 2
-    text_y = (screen_height - text_height) // 1.2
+    surface_width, surface_height = surface.get_size()
+    text_x = (surface_width - text_width) // 2
+    text_y = (surface_height - text_height) // 1.2
 
-    # Create a semi-transparent background for the text
+    # Semi-transparent background for the text, cached with it
     background_color = (0, 0, 0, 50)  # Black with some transparency (0-255)
-    background = pygame.Surface((text_width + 20, text_height + 20), pygame.SRCALPHA)  # Extra space for padding
-    background.fill(background_color)
+    background = text_cache.background(text, None, font_size, 10, background_color)  # 10px padding on each side
 
     # Draw the background and then the text
-    surface.blit(background, (text_x - 10, text_y - 10))  # Offset the background for padding
-    surface.blit(text_surface, (text_x, text_y))  # Place text on top of the background
+    background_rect = surface.blit(background, (text_x - 10, text_y - 10))  # Offset the background for padding
+    text_rect = surface.blit(text_surface, (text_x, text_y))  # Place text on top of the background
+    return background_rect.union(text_rect)  # Area covered, for dirty-rect rendering
 
 # Function to display guideline text with a curved background and optional image
 def display_text_with_logo_image(surface, text, image, font_size=60):
-    # Set up the font and text
-    font = pygame.font.SysFont("Impact", font_size)
-    text_surface = font.render(text, True, TEXT_COLOR)
+    # Set up the font and text (cached until the text changes)
+    text_surface = render_text(text, "Impact", font_size, TEXT_COLOR)
     
     # Get the width and height of the text
     text_width, text_height = text_surface.get_size()
@@ -63,7 +61,7 @@ def display_text_with_logo_image(surface, text, image, font_size=60):
     background_height = max(text_height, image_height) + 10  # Ensure enough space for both text and image
 
     # Calculate the position of the background to center it on the screen
-    background_x = (screen_width - background_width) // 2
+    background_x = (surface.get_width() - background_width) // 2
     background_y = 20
 
     # Create the semi-transparent background
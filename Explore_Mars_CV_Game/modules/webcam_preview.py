@@ -0,0 +1,37 @@
+import time
+
+import numpy as np
+import pygame
+
+# Webcam preview drawn from one persistent surface: each refresh is a single cv2.resize into the
+# buffer the surface wraps, so no surfaces are allocated per frame
+class WebcamPreview:
+    def __init__(self, size=(200, 150), refresh_hz=15):
+        self.size = size  # (width, height) on screen
+        self.refresh_hz = refresh_hz  # Preview updates per second, None to follow every new camera frame
+        self.refreshes = 0
+        self._buffer = np.zeros((size[1], size[0], 3), dtype=np.uint8)  # BGR, shared with the surface
+        self.surface = pygame.image.frombuffer(self._buffer, size, "BGR")  # Reads self._buffer, no copy
+        self._last_capture = None
+        self._last_refresh = -float("inf")
+
+    def update(self, frame, capture_time, now=None):
+        """Resize a new BGR camera frame into the preview if the refresh interval has passed."""
+        import cv2
+        if frame is None or capture_time == self._last_capture:
+            return False
+        if now is None:
+            now = time.perf_counter()
+        if self.refresh_hz is not None and now - self._last_refresh < 1.0 / self.refresh_hz:
+            return False
+
+        # The old flip + 90-degree rotation + surfarray (x, y) transpose cancel out, so the preview is
+        # the camera frame as captured: one resize straight into the surface's pixels
+        cv2.resize(frame, self.size, dst=self._buffer, interpolation=cv2.INTER_AREA)
+        self._last_capture = capture_time
+        self._last_refresh = now
+        self.refreshes += 1
+        return True
+
+    def draw(self, surface, position=(0, 0)):
+        return surface.blit(self.surface, position)
@@ -1,8 +1,14 @@
+import os
 import pygame
 import random
 import sys
 import time
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Shared frame_timing package
+from frame_timing import trace
+
+trace.start_from_env()  # CV_GAMES_TRACE=trace.json records a Chrome trace of the session
+
 # Initialize Pygame
 pygame.init()
 
@@ -69,6 +75,7 @@ def reset_grid():
             }
             selected.add((r, c))
 
+@trace.traced()
 def draw_grid():
     # First draw lava background
     screen.blit(lava_bg, (0, 0))
@@ -135,7 +142,8 @@ while running:
         last_cycle_time = time.time()
 
     draw_grid()
-    pygame.display.flip()
+    with trace.span("display.flip"):
+        pygame.display.flip()
     clock.tick(60)
 
 pygame.quit()
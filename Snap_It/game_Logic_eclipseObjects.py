@@ -1,8 +1,14 @@
+import os
 import pygame
 import sys
 import random
 import math
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Shared frame_timing package
+from frame_timing import trace
+
+trace.start_from_env()  # CV_GAMES_TRACE=trace.json records a Chrome trace of the session
+
 # Initialize Pygame
 pygame.init()
 
@@ -67,6 +73,7 @@ class EclipseObject:
         self.rotation_speed = random.uniform(0.1, 0.5)  # Speed of object rotation
         self.rotation_angle = 0  # Initial rotation angle
 
+    @trace.traced()
     def move(self):
         """Move the object in a circular or elliptical orbit and rotate it."""
         # Update orbit position (circular motion)
@@ -83,6 +90,7 @@ class EclipseObject:
         if self.x < 0 or self.x > SCREEN_WIDTH or self.y < 0 or self.y > SCREEN_HEIGHT:
             self.reset()  # Reset the position if it moves out of bounds
 
+    @trace.traced()
     def draw(self):
         """Draw the object on the screen with its current rotation."""
         rotated_image = pygame.transform.rotate(self.image, self.rotation_angle)  # Rotate the object
@@ -220,7 +228,8 @@ while running:
     lens_y = max(0, min(lens_y, zoomed_background.get_height() - SCREEN_HEIGHT))
 
     # Update the display
-    pygame.display.flip()
+    with trace.span("display.flip"):
+        pygame.display.flip()
 
     # Control the frame rate
     clock.tick(60)
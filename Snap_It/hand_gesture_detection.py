@@ -1,89 +1,60 @@
+import argparse
+import os
+import sys
+import time
 import cv2
-import mediapipe as mp
 import pyautogui  # Import PyAutoGUI for mouse control
 
+# Hand tracking and gesture detection are shared by all the games (repo root)
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from frame_timing import trace
+from hand_tracking import BlankFrameSource, LandmarkRecorder, close_tracker, detect_gesture, draw_landmarks, get_tracker
+
 # Define the screen dimensions (must match the game window)
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 
-# Initialize MediaPipe Hands and OpenCV
-mp_hands = mp.solutions.hands
-hands = mp_hands.Hands(min_detection_confidence=0.7, min_tracking_confidence=0.7)
-mp_drawing = mp.solutions.drawing_utils
-
-# Function to detect hand gestures based on the landmark positions
-def detect_gesture(landmarks, image_shape):
-    """Detect hand gestures based on landmark positions."""
-    h, w, _ = image_shape
-    thumb_tip = landmarks[4]   # Thumb tip
-    index_tip = landmarks[8]   # Index finger tip
-    middle_tip = landmarks[12] # Middle finger tip
-    ring_tip = landmarks[16]   # Ring finger tip
-    pinky_tip = landmarks[20]  # Pinky finger tip
-    wrist = landmarks[0]       # Wrist
-
-    # Helper: Check if finger is extended (higher than its base)
-    def is_finger_extended(tip, base_idx):
-        base = landmarks[base_idx]
-        return tip.y < base.y - 0.05  # y-coordinate check (inverted)
-
-    # Thumbs up: Thumb extended up, other fingers folded
-    if (thumb_tip.y < wrist.y - 0.1 and
-        not is_finger_extended(index_tip, 5) and
-        not is_finger_extended(middle_tip, 9)):
-        return "thumbs_up"
+def main(record_path=None, replay_path=None):
+    # Recorded landmarks stand in for MediaPipe when replaying
+    recorder = LandmarkRecorder(record_path) if record_path else None
+    tracker = get_tracker("replay" if replay_path else "mediapipe",
+                          backend_options={"path": replay_path} if replay_path else None,
+                          recorder=recorder, resize=None, flip=True, rotate=False)
 
-    # Thumbs down: Thumb extended down, other fingers folded
-    if (thumb_tip.y > wrist.y + 0.1 and
-        not is_finger_extended(index_tip, 5) and
-        not is_finger_extended(middle_tip, 9)):
-        return "thumbs_down"
-
-    # Peace sign: Index and middle fingers extended, others folded
-    if (is_finger_extended(index_tip, 5) and
-        is_finger_extended(middle_tip, 9) and
-        not is_finger_extended(ring_tip, 13) and
-        not is_finger_extended(pinky_tip, 17)):
-        return "peace_sign"
-
-    return None
-
-def main():
-    # Initialize webcam
-    cap = cv2.VideoCapture(0)
+    # Initialize webcam (not needed when replaying: the recording supplies the hands)
+    cap = BlankFrameSource(SCREEN_WIDTH, SCREEN_HEIGHT) if replay_path else cv2.VideoCapture(0)
     cap.set(cv2.CAP_PROP_FRAME_WIDTH, SCREEN_WIDTH)  # Set webcam resolution
     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, SCREEN_HEIGHT)
 
     while True:
-        ret, frame = cap.read()
+        with trace.span("cap.read"):
+            ret, frame = cap.read()
+        capture_time = time.time()
         if not ret:
             break
         
-        # Flip the frame for better display and convert to RGB
-        frame = cv2.cvtColor(cv2.flip(frame, 1), cv2.COLOR_BGR2RGB)
-
-        # Process the frame with MediaPipe
-        results = hands.process(frame)
+        # Flip the frame for better display, then track hands (the tracker also records)
+        hand_frame = tracker.process(frame, capture_time)
 
         # Convert the frame back to BGR for OpenCV display
-        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR)
+        frame = cv2.cvtColor(hand_frame.image, cv2.COLOR_RGB2BGR)
 
-        if results.multi_hand_landmarks:
-            for landmarks in results.multi_hand_landmarks:
+        if len(hand_frame):
+            for landmarks in hand_frame.landmarks:
                 # Draw hand landmarks on the frame
-                mp_drawing.draw_landmarks(frame, landmarks, mp_hands.HAND_CONNECTIONS)
+                draw_landmarks(frame, landmarks)
 
                 # Detect gestures
-                gesture = detect_gesture(landmarks.landmark, frame.shape)
+                gesture = detect_gesture(landmarks, frame.shape)
 
                 # Display detected gesture
                 if gesture:
                     cv2.putText(frame, f"Gesture: {gesture}", (50, 50), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 0, 0), 2)
 
                 # Use index finger tip to control the mouse cursor
-                index_tip = landmarks.landmark[8]  # Index finger tip
-                x = int(index_tip.x * SCREEN_WIDTH)  # Map x to screen width
-                y = int(index_tip.y * SCREEN_HEIGHT)  # Map y to screen height
+                index_tip = landmarks[8]  # Index finger tip
+                x = int(index_tip[0] * SCREEN_WIDTH)  # Map x to screen width
+                y = int(index_tip[1] * SCREEN_HEIGHT)  # Map y to screen height
 
                 pyautogui.moveTo(x, y)  # Move the cursor to the detected index tip position
 
@@ -95,8 +66,16 @@ def main():
             break
 
     # Release resources
+    if recorder is not None:
+        print(f"Recorded {recorder.close()} frames of landmarks to {record_path}")
     cap.release()
     cv2.destroyAllWindows()
+    close_tracker()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Hand gesture mouse control")
+    parser.add_argument("--record", metavar="PATH", help="save every frame's hand landmarks to this .npz (streamed to PATH.part until exit, which --replay also reads)")
+    parser.add_argument("--replay", metavar="PATH", help="use hand landmarks from a recording instead of running MediaPipe")
+    args = parser.parse_args()
+    trace.start_from_env()  # CV_GAMES_TRACE=trace.json records a Chrome trace of the session
+    main(record_path=args.record, replay_path=args.replay)
@@ -0,0 +1,5 @@
+# Frame timing shared by the CV games: per-stage timers, an on-screen overlay, per-frame logs
+# and Chrome trace export (frame_timing.trace) for finding out where a slow frame went.
+from frame_timing.hud import TimingHud
+from frame_timing.log import StageLog, read_stage_log
+from frame_timing.timer import StageTimer
@@ -0,0 +1,68 @@
+import time
+
+import numpy as np
+import pygame
+
+GRAPH_COLOR = (80, 255, 120)
+BUDGET_COLOR = (255, 90, 90)
+TEXT_COLOR = (235, 235, 235)
+PANEL_COLOR = (16, 16, 16)
+
+# Overlay with a rolling frame-time graph and p50/p95 per stage. The panel is rebuilt refresh_hz
+# times a second and blitted in between, so showing it costs one opaque blit on most frames.
+class TimingHud:
+    def __init__(self, timer, position=(10, 10), size=(340, 230), budget_ms=1000 / 60, refresh_hz=4, graph_frames=240):
+        self.timer = timer  # StageTimer to read from
+        self.position = position
+        self.size = size
+        self.budget_ms = budget_ms  # Frame budget, drawn as a reference line on the graph
+        self.refresh_hz = refresh_hz
+        self.graph_frames = graph_frames  # Most recent frames shown on the graph
+        self._font = None
+        self._panel = None
+        self._last_refresh = -float("inf")
+
+    def draw(self, surface, now=None):
+        """Blit the overlay onto surface; returns the covered rect. The time taken is charged to timer.overhead()."""
+        start = time.perf_counter()
+        if now is None:
+            now = start
+        if self._panel is None or now - self._last_refresh >= 1.0 / self.refresh_hz:
+            self._panel = self._render()
+            self._last_refresh = now
+        rect = surface.blit(self._panel, self.position)
+        self.timer.hud_time += time.perf_counter() - start
+        return rect
+
+    def _render(self):
+        if self._font is None:
+            self._font = pygame.font.SysFont("consolas,dejavusansmono,couriernew,monospace", 13)
+        width, height = self.size
+        panel = pygame.Surface(self.size)
+        if pygame.display.get_surface() is not None:
+            panel = panel.convert()  # Display pixel format: a plain copy per blit, no alpha blending
+        panel.fill(PANEL_COLOR)
+
+        # Frame-time graph, scaled so the budget line sits at mid-height until a frame goes over twice the budget
+        graph_height = height * 2 // 5
+        frame_ms = np.asarray(self.timer.samples.get("frame", ()), dtype=np.float64)[-self.graph_frames:] * 1000.0
+        scale = graph_height / max(self.budget_ms * 2, frame_ms.max() if frame_ms.size else 0.0)
+        budget_y = graph_height - self.budget_ms * scale
+        pygame.draw.line(panel, BUDGET_COLOR, (0, budget_y), (width, budget_y))
+        if frame_ms.size >= 2:
+            points = np.column_stack((np.linspace(0, width - 1, frame_ms.size), graph_height - frame_ms * scale))
+            pygame.draw.lines(panel, GRAPH_COLOR, False, points.tolist())
+
+        # Per-stage table under the graph
+        lines = [f"{'stage':<12}{'p50':>8}{'p95':>8} ms"]
+        for stage, stats in self.timer.summary().items():
+            lines.append(f"{stage[:12]:<12}{stats['p50']:>8.2f}{stats['p95']:>8.2f}")
+        lines.append(f"instrumentation {self.timer.overhead():.1%}")
+        y = graph_height + 4
+        line_height = self._font.get_linesize()
+        for line in lines:
+            if y + line_height > height:
+                break
+            panel.blit(self._font.render(line, True, TEXT_COLOR), (4, y))
+            y += line_height
+        return panel
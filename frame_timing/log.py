@@ -0,0 +1,80 @@
+import csv
+import json
+import time
+
+import numpy as np
+
+# One binary record per stage per frame; stage names are kept in a "<path>.json" sidecar
+RECORD_DTYPE = np.dtype([("frame", "<u4"), ("stage", "<u1"), ("ms", "<f4")])
+
+# Streams every frame's stage times to disk: "frame,stage,ms" CSV rows, or packed records for a .bin path.
+# Rows are buffered and written every flush_every frames so the log costs little per frame.
+class StageLog:
+    def __init__(self, path, flush_every=120):
+        self.path = path
+        self.binary = path.endswith(".bin")
+        self.flush_every = flush_every
+        self.frames = 0  # Frames written
+        self.write_time = 0.0  # Seconds spent buffering and writing, counted by StageTimer.overhead()
+        self._rows = []
+        self._stage_ids = {}  # Binary logs only: stage name -> record id
+        self._file = open(path, "wb" if self.binary else "w", newline=None if self.binary else "")
+        self._writer = None
+        if not self.binary:
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(("frame", "stage", "ms"))
+
+    def write(self, frame_index, laps):
+        """Queue one frame's [(stage, seconds), ...]."""
+        start = time.perf_counter()
+        if self.binary:
+            self._rows.extend((frame_index, self._stage_id(stage), seconds * 1000.0) for stage, seconds in laps)
+        else:
+            self._rows.extend((frame_index, stage, f"{seconds * 1000.0:.4f}") for stage, seconds in laps)
+        self.frames += 1
+        if self.frames % self.flush_every == 0:
+            self._flush()
+        self.write_time += time.perf_counter() - start
+
+    def close(self):
+        """Write what is buffered and close the file; returns the number of frames logged."""
+        if self._file.closed:
+            return self.frames
+        self._flush()
+        self._file.close()
+        if self.binary:
+            with open(self.path + ".json", "w") as sidecar:
+                json.dump({"stages": list(self._stage_ids), "dtype": RECORD_DTYPE.descr}, sidecar)
+        return self.frames
+
+    def _stage_id(self, stage):
+        stage_id = self._stage_ids.get(stage)
+        if stage_id is None:
+            stage_id = self._stage_ids[stage] = len(self._stage_ids)
+        return stage_id
+
+    def _flush(self):
+        if not self._rows:
+            return
+        if self.binary:
+            np.array(self._rows, dtype=RECORD_DTYPE).tofile(self._file)
+        else:
+            self._writer.writerows(self._rows)
+        self._rows = []
+
+def read_stage_log(path):
+    """Load a CSV or binary StageLog as {stage: (frame indices, milliseconds)} arrays."""
+    if path.endswith(".bin"):
+        with open(path + ".json") as sidecar:
+            stages = json.load(sidecar)["stages"]
+        records = np.fromfile(path, dtype=RECORD_DTYPE)
+        return {stage: (records["frame"][records["stage"] == i], records["ms"][records["stage"] == i])
+                for i, stage in enumerate(stages)}
+
+    rows = {}
+    with open(path, newline="") as f:
+        for row in csv.DictReader(f):
+            frames, ms = rows.setdefault(row["stage"], ([], []))
+            frames.append(int(row["frame"]))
+            ms.append(float(row["ms"]))
+    return {stage: (np.array(frames, dtype=np.uint32), np.array(ms, dtype=np.float32)) for stage, (frames, ms) in rows.items()}
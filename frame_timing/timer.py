@@ -0,0 +1,98 @@
+import time
+from collections import deque
+
+import numpy as np
+
+from frame_timing import trace
+
+# Per-stage frame times: call begin_frame() once per frame, then lap("stage") after each stage
+class StageTimer:
+    _lap_cost = None  # Seconds one lap() takes on this machine, measured once per process
+
+    def __init__(self, history=600, log=None):
+        self.history = history  # Frames kept per stage (bounded so a long session doesn't grow)
+        self.log = log  # Optional StageLog that receives every frame's laps
+        self.samples = {}  # stage name -> deque of seconds
+        self.stage_order = []  # Stages in the order they first ran
+        self.laps = 0  # lap() and end_frame() calls, for overhead()
+        self.total_frame_time = 0.0  # Seconds across every finished frame
+        self.frames_ended = 0
+        self.hud_time = 0.0  # Seconds spent drawing a TimingHud of this timer (it adds them itself)
+        self._frame_laps = []  # (stage, seconds) of the current frame, only kept for the log
+        self._frame_start = None
+        self._last_lap = None
+
+    def begin_frame(self):
+        self._frame_start = self._last_lap = time.perf_counter()
+
+    def lap(self, stage):
+        """Charge the time since the previous lap (or frame start) to this stage."""
+        now = time.perf_counter()
+        seconds = now - self._last_lap
+        self._add(stage, seconds)
+        if self.log is not None:
+            self._frame_laps.append((stage, seconds))
+        tracer = trace.active()
+        if tracer is not None:
+            tracer.add(stage, self._last_lap, now)  # Stages show up as trace events too
+        self._last_lap = now
+        self.laps += 1
+
+    def end_frame(self):
+        """Record the whole frame under "frame" (includes anything not lapped)."""
+        if self._frame_start is not None:
+            now = time.perf_counter()
+            seconds = now - self._frame_start
+            self._add("frame", seconds)
+            self.total_frame_time += seconds
+            self.laps += 1
+            if self.log is not None:
+                self._frame_laps.append(("frame", seconds))
+                self.log.write(self.frames_ended, self._frame_laps)
+                self._frame_laps = []
+            tracer = trace.active()
+            if tracer is not None:
+                tracer.add("frame", self._frame_start, now)
+            self.frames_ended += 1
+            self._frame_start = None
+
+    def frame_count(self):
+        return len(self.samples.get("frame", ()))
+
+    def summary(self):
+        """{stage: {"p50", "p95", "p99", "mean", "count"}} with times in milliseconds."""
+        stats = {}
+        for stage in self.stage_order:
+            ms = np.asarray(self.samples[stage], dtype=np.float64) * 1000.0
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            stats[stage] = {"p50": round(float(p50), 4), "p95": round(float(p95), 4), "p99": round(float(p99), 4),
+                            "mean": round(float(ms.mean()), 4), "count": int(ms.size)}
+        return stats
+
+    def overhead(self):
+        """Share of frame time spent timing itself: the laps (at the measured lap cost), log writes and the HUD."""
+        if self.total_frame_time <= 0:
+            return 0.0
+        spent = self.laps * self.lap_cost() + self.hud_time
+        if self.log is not None:
+            spent += self.log.write_time
+        return spent / self.total_frame_time
+
+    @classmethod
+    def lap_cost(cls, samples=5000):
+        """Seconds one lap() costs, measured on a throwaway timer the first time it is asked for."""
+        if cls._lap_cost is None:
+            probe = cls(history=samples)
+            probe.begin_frame()
+            start = time.perf_counter()
+            for _ in range(samples):
+                probe.lap("probe")
+            cls._lap_cost = (time.perf_counter() - start) / samples
+        return cls._lap_cost
+
+    def _add(self, stage, seconds):
+        samples = self.samples.get(stage)
+        if samples is None:
+            samples = self.samples[stage] = deque(maxlen=self.history)
+            self.stage_order.append(stage)
+        samples.append(seconds)
@@ -0,0 +1,131 @@
+import atexit
+import json
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+TRACE_ENV = "CV_GAMES_TRACE"  # Set to a .json path to trace a game without changing its command line
+
+# Chrome trace-event recorder; open the JSON in Perfetto (ui.perfetto.dev) or chrome://tracing.
+# Events go to a ring buffer, so a long session keeps only its most recent max_events.
+class Tracer:
+    def __init__(self, path, max_events=200_000):
+        self.path = path
+        self.max_events = max_events
+        self.events = deque(maxlen=max_events)  # (name, thread id, start, end, args) in perf_counter seconds
+        self.recorded = 0  # Events ever added, including those the ring buffer dropped
+        self._thread_names = {}  # Thread id -> name, for the per-thread tracks
+        self._origin = time.perf_counter()
+
+    def add(self, name, start, end, args=None):
+        """Record one complete event; safe to call from any thread."""
+        thread_id = threading.get_ident()
+        if thread_id not in self._thread_names:
+            self._thread_names[thread_id] = threading.current_thread().name
+        self.events.append((name, thread_id, start, end, args))
+        self.recorded += 1
+
+    def dropped(self):
+        return self.recorded - len(self.events)
+
+    def write(self):
+        """Write the buffered events as trace-event JSON; returns how many were written."""
+        pid = os.getpid()
+        trace_events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": name}}
+                        for thread_id, name in list(self._thread_names.items())]
+        events = list(self.events)
+        for name, thread_id, start, end, args in events:
+            event = {"name": name, "ph": "X", "pid": pid, "tid": thread_id,
+                     "ts": round((start - self._origin) * 1e6, 3), "dur": round((end - start) * 1e6, 3)}
+            if args:
+                event["args"] = args
+            trace_events.append(event)
+        with open(self.path, "w") as f:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms",
+                       "otherData": {"dropped_events": self.dropped()}}, f)
+        return len(events)
+
+_tracer = None  # The active Tracer, None while tracing is off
+
+def active():
+    """The active Tracer, or None; hot paths check this before doing any tracing work."""
+    return _tracer
+
+def start_trace(path, max_events=200_000):
+    """Start recording; the trace is written by stop_trace() or, failing that, at exit."""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(path, max_events)
+        atexit.register(stop_trace)
+    return _tracer
+
+def start_from_env():
+    """Start tracing if CV_GAMES_TRACE names an output file; returns the Tracer or None."""
+    path = os.environ.get(TRACE_ENV)
+    return start_trace(path) if path else None
+
+def stop_trace():
+    """Stop recording and write the trace; returns the number of events written (0 if tracing was off)."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    if tracer is None:
+        return 0
+    atexit.unregister(stop_trace)
+    return tracer.write()
+
+# Times a with-block; handed out by span() only while tracing is on
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        tracer = _tracer
+        if tracer is not None:
+            tracer.add(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+# Shared do-nothing span for when tracing is off
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NO_SPAN = _NoSpan()
+
+def span(name, **args):
+    """Trace a block: `with trace.span("cap.read"): ...`. Costs one call and a check while tracing is off."""
+    if _tracer is None:
+        return _NO_SPAN
+    return _Span(name, args or None)
+
+def traced(name=None):
+    """Decorator form of span(); the event is named after the function unless name is given."""
+    def decorate(func):
+        label = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer is None:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                tracer = _tracer
+                if tracer is not None:
+                    tracer.add(label, start, time.perf_counter())
+        return wrapper
+    return decorate
@@ -0,0 +1,19 @@
+# Hand tracking shared by the CV games: one tracker per process, pluggable backends
+# (MediaPipe, recorded replay, synthetic) and the gesture logic every game uses.
+from hand_tracking.backends import MediaPipeBackend, ReplayBackend, SyntheticBackend, create_backend
+from hand_tracking.drawing import HAND_CONNECTIONS, draw_landmarks
+from hand_tracking.frame import HandFrame
+from hand_tracking.gestures import (
+    DIRECTIONS,
+    GESTURE_LABELS,
+    GestureTracker,
+    GestureTrackers,
+    classify_gesture_codes,
+    classify_gestures,
+    detect_gesture,
+    detect_hand_gesture,
+)
+from hand_tracking.prediction import InferenceScheduler, LandmarkPredictor
+from hand_tracking.recording import BlankFrameSource, LandmarkRecorder
+from hand_tracking.roi import HandRoi
+from hand_tracking.tracker import HandTracker, close_tracker, get_tracker
@@ -0,0 +1,75 @@
+import math
+
+import numpy as np
+
+from hand_tracking.recording import ReplayHands, ReplayCategory, ReplayClassificationList, ReplayLandmarkList, ReplayResults
+
+# A backend turns an RGB image into MediaPipe-shaped results (multi_hand_landmarks / multi_handedness)
+# through process(image) and releases what it holds in close().
+
+# The real thing: one MediaPipe Hands graph (mediapipe is imported only when this is built)
+class MediaPipeBackend:
+    name = "mediapipe"
+
+    def __init__(self, min_detection_confidence=0.7, min_tracking_confidence=0.7, max_num_hands=2):
+        import mediapipe as mp
+        self._hands = mp.solutions.hands.Hands(min_detection_confidence=min_detection_confidence,
+                                               min_tracking_confidence=min_tracking_confidence,
+                                               max_num_hands=max_num_hands)
+
+    def process(self, image):
+        return self._hands.process(image)
+
+    def close(self):
+        self._hands.close()
+
+# Recorded landmarks (see hand_tracking/recording.py); the image is ignored
+ReplayBackend = ReplayHands
+
+# Scripted hand for runs without a camera model: points in each direction in turn, then holds a fist
+class SyntheticBackend:
+    name = "synthetic"
+
+    def __init__(self, frames_per_pose=45, jitter=0.002, seed=0, label="Right"):
+        self.frames_per_pose = frames_per_pose  # Frames each pose is held for
+        self.jitter = jitter  # Noise added to every landmark, like real tracking
+        self.label = label
+        self._rng = np.random.default_rng(seed)
+        self._frame = 0
+
+    def process(self, image=None):
+        pose = (self._frame // self.frames_per_pose) % 5
+        self._frame += 1
+        points = self._pose_points(pose) + self._rng.normal(0, self.jitter, (21, 3))
+        handedness = [ReplayClassificationList(ReplayCategory(1 if self.label == "Right" else 0, self.label, 1.0))]
+        return ReplayResults([ReplayLandmarkList(points)], handedness, None)
+
+    def close(self):
+        pass
+
+    def _pose_points(self, pose):
+        """21 landmarks of a hand at the frame center; poses 0-3 point the index finger around, 4 is a fist."""
+        points = np.full((21, 3), 0.5)
+        points[:, 2] = 0.0
+        points[5] = (0.5, 0.42, 0.0)  # Index finger MCP, sets the hand size
+        if pose == 4:
+            points[4] = points[8] = (0.52, 0.40, 0.0)  # Thumb tip on index tip
+            return points
+        angle = pose * math.pi / 2
+        points[8] = (0.5 + 0.2 * math.cos(angle), 0.5 + 0.2 * math.sin(angle), 0.0)  # Index finger tip
+        points[4] = (0.35, 0.5, 0.0)  # Thumb tip well away from the index tip
+        return points
+
+BACKENDS = {
+    "mediapipe": MediaPipeBackend,
+    "replay": ReplayBackend,
+    "synthetic": SyntheticBackend,
+}
+
+def create_backend(kind="mediapipe", **options):
+    """Build a backend by name ("mediapipe", "replay" with path=..., or "synthetic")."""
+    try:
+        backend_class = BACKENDS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown hand tracking backend {kind!r} (expected one of {', '.join(BACKENDS)})") from None
+    return backend_class(**options)
@@ -0,0 +1,20 @@
+import numpy as np
+
+# MediaPipe's 21-landmark hand topology (mp.solutions.hands.HAND_CONNECTIONS)
+HAND_CONNECTIONS = (
+    (0, 1), (1, 2), (2, 3), (3, 4),  # Thumb
+    (0, 5), (5, 6), (6, 7), (7, 8),  # Index finger
+    (5, 9), (9, 10), (10, 11), (11, 12),  # Middle finger
+    (9, 13), (13, 14), (14, 15), (15, 16),  # Ring finger
+    (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),  # Pinky and palm
+)
+
+def draw_landmarks(image, points, landmark_color=(0, 0, 255), connection_color=(224, 224, 224)):
+    """Draw one hand's (21, 3) normalized landmarks onto an image, in drawing_utils' default style."""
+    import cv2
+    height, width = image.shape[:2]
+    pixels = np.round(np.asarray(points)[:, :2] * (width, height)).astype(np.int32)
+    for start, end in HAND_CONNECTIONS:
+        cv2.line(image, tuple(int(v) for v in pixels[start]), tuple(int(v) for v in pixels[end]), connection_color, 2)
+    for x, y in pixels:
+        cv2.circle(image, (int(x), int(y)), 2, landmark_color, -1)
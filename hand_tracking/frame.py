@@ -0,0 +1,60 @@
+import numpy as np
+
+from hand_tracking.recording import HANDEDNESS_LABELS, ReplayCategory, ReplayClassificationList, ReplayLandmarkList, ReplayResults
+
+NUM_LANDMARKS = 21
+
+# One frame of tracking output. Landmarks are converted to a single array once, here, and every
+# gesture consumer reads that array; MediaPipe-shaped results are kept (or rebuilt) only for drawing.
+class HandFrame:
+    __slots__ = ("landmarks", "handedness", "scores", "capture_time", "image", "predicted", "_results")
+
+    def __init__(self, landmarks, handedness, scores, capture_time, image=None, predicted=False, results=None):
+        self.landmarks = landmarks  # (H, 21, 3) float32, normalized to the full tracker frame
+        self.handedness = handedness  # Tuple of "Left"/"Right" per hand, or None when the backend gives none
+        self.scores = scores  # (H,) float32 handedness confidence
+        self.capture_time = capture_time
+        self.image = image  # RGB image inference ran on (None for predicted frames)
+        self.predicted = predicted  # Extrapolated between inferences rather than inferred
+        self._results = results
+
+    @classmethod
+    def from_results(cls, results, capture_time, image=None):
+        """Convert a hands.process() result (MediaPipe or replay) to arrays."""
+        hands = results.multi_hand_landmarks or []
+        landmarks = np.array([[(lm.x, lm.y, lm.z) for lm in hand.landmark] for hand in hands], dtype=np.float32)
+        landmarks = landmarks.reshape(len(hands), NUM_LANDMARKS, 3)
+        classifications = results.multi_handedness or []
+        handedness, scores = None, np.zeros(len(hands), dtype=np.float32)
+        if hands and len(classifications) >= len(hands):
+            categories = [classifications[i].classification[0] for i in range(len(hands))]
+            handedness = tuple(category.label for category in categories)
+            scores = np.array([category.score for category in categories], dtype=np.float32)
+        return cls(landmarks, handedness, scores, capture_time, image, results=results)
+
+    def __len__(self):
+        return len(self.landmarks)
+
+    def hand_keys(self):
+        """Stable key per hand: the handedness label, made unique if two hands share one."""
+        keys = []
+        for i in range(len(self)):
+            key = self.handedness[i] if self.handedness is not None else f"hand{i}"
+            keys.append(f"{key}{i}" if key in keys else key)
+        return keys
+
+    def clear_results(self):
+        """Forget the backend's results after the landmark array was changed; results is rebuilt from the arrays."""
+        self._results = None
+
+    @property
+    def results(self):
+        """MediaPipe-shaped view (multi_hand_landmarks / multi_handedness), built on first use."""
+        if self._results is None:
+            hands = [ReplayLandmarkList(points) for points in self.landmarks]
+            handedness = None
+            if self.handedness is not None:
+                handedness = [ReplayClassificationList(ReplayCategory(HANDEDNESS_LABELS.index(label) if label in HANDEDNESS_LABELS else i, label, float(score)))
+                              for i, (label, score) in enumerate(zip(self.handedness, self.scores))]
+            self._results = ReplayResults(hands or None, handedness, self.capture_time)
+        return self._results
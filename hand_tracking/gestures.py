@@ -0,0 +1,337 @@
+import numpy as np
+import time
+
+from frame_timing.trace import traced
+
+# MediaPipe hand landmark indices (mp.solutions.hands.HandLandmark) used below
+WRIST = 0
+THUMB_TIP = 4
+INDEX_FINGER_MCP = 5
+INDEX_FINGER_TIP = 8
+
+DIRECTIONS = ("left", "right", "up", "down")  # Also the tie-break order of the smoothing vote
+GESTURE_LABELS = (None, "fist") + DIRECTIONS  # Label of each code returned by classify_gesture_codes()
+
+# Variables for hand gesture recognition
+fist_held = False
+last_fist_time = 0
+
+def _points(hand):
+    """(21, 3) array of one hand, from a landmark array or MediaPipe landmarks (list or .landmark sequence)."""
+    if hasattr(hand, "landmark"):
+        hand = hand.landmark
+    if len(hand) and hasattr(hand[0], "x"):
+        return np.array([(lm.x, lm.y, lm.z) for lm in hand], dtype=np.float32)
+    return np.asarray(hand)
+
+def _xy(hand, index):
+    """(x, y) of one landmark, from a landmark array or a MediaPipe landmark list."""
+    if hasattr(hand, "landmark"):
+        lm = hand.landmark[index]
+        return lm.x, lm.y
+    return float(hand[index][0]), float(hand[index][1])
+
+# Geometry shared by detect_hand_gesture() and GestureTracker
+def _hand_pose(hand, mirror_x=True, mirror_y=True):
+    """(fist_closed, moved, direction) for one hand; direction only counts when moved is True."""
+    # Extract key landmarks
+    wrist_x, wrist_y = _xy(hand, WRIST)
+    index_x, index_y = _xy(hand, INDEX_FINGER_TIP)
+    thumb_x, thumb_y = _xy(hand, THUMB_TIP)
+    mcp_x, mcp_y = _xy(hand, INDEX_FINGER_MCP)
+    
+    # Fist detection with adaptive threshold
+    hand_size = ((wrist_x - mcp_x) ** 2 + (wrist_y - mcp_y) ** 2) ** 0.5
+    fist_threshold = hand_size * 0.3  # Adaptive based on hand size
+    distance_thumb_index = ((thumb_x - index_x) ** 2 + (thumb_y - index_y) ** 2) ** 0.5
+    if distance_thumb_index < fist_threshold:
+        return True, False, None
+    
+    # Handle mirroring
+    if mirror_x:
+        wrist_x = 1.0 - wrist_x
+        index_x = 1.0 - index_x
+    if mirror_y:
+        wrist_y = 1.0 - wrist_y
+        index_y = 1.0 - index_y
+    
+    # Calculate direction vector
+    dx = index_x - wrist_x
+    dy = index_y - wrist_y
+    
+    # Compute angle and magnitude
+    angle = np.arctan2(dy, dx) * 180 / np.pi
+    magnitude = (dx ** 2 + dy ** 2) ** 0.5
+    
+    # Adaptive threshold for direction
+    threshold = hand_size * 0.5
+    if magnitude < threshold:
+        return False, False, None  # Ignore small movements
+    
+    # Define angle ranges for directions (corrected)
+    if -45 <= angle < 45:
+        gesture = "left"
+    elif 45 <= angle < 135:
+        gesture = "up"
+    elif 135 <= angle or angle < -135:
+        gesture = "right"
+    elif -135 <= angle < -45:
+        gesture = "down"
+    else:
+        gesture = None
+    return False, True, gesture
+
+# Hand gesture detection logic (single hand, module-level state; see GestureTracker for several hands)
+@traced()
+def detect_hand_gesture(hand_landmarks, prev_gestures, smoothing_window=5, mirror_x=True, mirror_y=True, now=None):
+    """
+    Detect hand gestures (left, right, up, down, fist) using MediaPipe hand landmarks.
+    
+    Args:
+        hand_landmarks: MediaPipe hand landmarks object or a (21, 3) landmark array.
+        prev_gestures: List of previous gestures for smoothing.
+        smoothing_window: Number of frames to average for smoothing (default: 5).
+        mirror_x: If True, flip x-axis for mirrored webcam (default: True).
+        mirror_y: If True, flip y-axis for mirrored webcam (default: True).
+        now: Timestamp of this frame for the fist hold timer (default: time.time()).
+    
+    Returns:
+        Gesture ("fist", "left", "right", "up", "down", None) or None if no clear gesture.
+    """
+    global fist_held, last_fist_time
+    if now is None:
+        now = time.time()
+    
+    closed, moved, gesture = _hand_pose(hand_landmarks, mirror_x, mirror_y)
+    if closed:
+        if not fist_held:
+            fist_held = True
+            last_fist_time = now
+        elif now - last_fist_time >= 2:
+            return "fist"
+        return None
+    else:
+        if fist_held and now - last_fist_time < 0.2:  # 200ms buffer
+            return None
+        fist_held = False
+    if not moved:
+        return None
+    
+    # Temporal smoothing
+    prev_gestures.append(gesture)
+    if len(prev_gestures) > smoothing_window:
+        prev_gestures.pop(0)
+    
+    valid_gestures = [g for g in prev_gestures if g is not None]
+    if not valid_gestures:
+        return None
+    return max(DIRECTIONS, key=valid_gestures.count)  # Ties go to the earlier direction, not set order
+
+# Gesture state of one hand: fist hold timers plus a ring buffer of direction votes with running counts
+class GestureTracker:
+    def __init__(self, smoothing_window=5, mirror_x=True, mirror_y=True, fist_hold=2.0, release_buffer=0.2):
+        self.smoothing_window = max(smoothing_window, 0)  # Votes considered; per-frame cost does not depend on it
+        self.mirror_x = mirror_x
+        self.mirror_y = mirror_y
+        self.fist_hold = fist_hold  # Seconds a fist must be held before "fist" fires
+        self.release_buffer = release_buffer  # Seconds an opened hand is still treated as a fist (debounce)
+        self.reset()
+
+    def reset(self):
+        """Forget the fist hold and all smoothing votes."""
+        self.fist_held = False
+        self.last_fist_time = 0
+        self.last_seen = None  # Timestamp of the last update()
+        self._votes = [None] * self.smoothing_window  # Ring buffer of recent directions
+        self._counts = dict.fromkeys(DIRECTIONS, 0)  # Running count of each direction in the buffer
+        self._next = 0  # Ring buffer slot the next vote goes into
+
+    def update(self, hand_landmarks, now=None):
+        """Same result as detect_hand_gesture() for this hand ((21, 3) array or landmark list), in O(1) per frame."""
+        if now is None:
+            now = time.time()
+        self.last_seen = now
+
+        closed, moved, gesture = _hand_pose(hand_landmarks, self.mirror_x, self.mirror_y)
+        if closed:
+            if not self.fist_held:
+                self.fist_held = True
+                self.last_fist_time = now
+            elif now - self.last_fist_time >= self.fist_hold:
+                return "fist"
+            return None
+        if self.fist_held and now - self.last_fist_time < self.release_buffer:
+            return None
+        self.fist_held = False
+        if not moved or not self.smoothing_window:
+            return None
+
+        # Replace the oldest vote and adjust the running counts
+        dropped = self._votes[self._next]
+        if dropped is not None:
+            self._counts[dropped] -= 1
+        self._votes[self._next] = gesture
+        if gesture is not None:
+            self._counts[gesture] += 1
+        self._next = (self._next + 1) % self.smoothing_window
+
+        best = max(DIRECTIONS, key=self._counts.__getitem__)  # Ties go to the earlier direction
+        return best if self._counts[best] else None
+
+# One GestureTracker per visible hand, keyed by MediaPipe handedness ("Left"/"Right")
+class GestureTrackers:
+    def __init__(self, forget_after=1.0, **tracker_options):
+        self.forget_after = forget_after  # Seconds a hand can be missing before its state is dropped
+        self.tracker_options = tracker_options  # Passed to each GestureTracker
+        self.trackers = {}  # hand key -> GestureTracker
+
+    @traced("detect_hand_gesture")
+    def update(self, frame, now=None):
+        """[(hand index, hand key, gesture)] for every hand in a HandFrame (timed by its capture time)."""
+        if now is None:
+            now = frame.capture_time
+        gestures = []
+        keys = frame.hand_keys()
+        for i, key in enumerate(keys):
+            tracker = self.trackers.get(key)
+            if tracker is None:
+                tracker = self.trackers[key] = GestureTracker(**self.tracker_options)
+            gestures.append((i, key, tracker.update(frame.landmarks[i], now)))
+
+        seen = set(keys)
+        for key in [k for k, t in self.trackers.items() if k not in seen and now - t.last_seen > self.forget_after]:
+            del self.trackers[key]
+        return gestures
+
+# Snap It's hand signs (thumbs up/down, peace sign)
+@traced()
+def detect_gesture(landmarks, image_shape=None):
+    """Detect hand gestures based on landmark positions ((21, 3) array or MediaPipe landmark list)."""
+    points = _points(landmarks)
+    y = points[:, 1]
+    thumb_tip, index_tip, middle_tip, ring_tip, pinky_tip, wrist = 4, 8, 12, 16, 20, 0
+
+    # Helper: Check if finger is extended (higher than its base)
+    def is_finger_extended(tip, base_idx):
+        return y[tip] < y[base_idx] - 0.05  # y-coordinate check (inverted)
+
+    # Thumbs up: Thumb extended up, other fingers folded
+    if (y[thumb_tip] < y[wrist] - 0.1 and
+        not is_finger_extended(index_tip, 5) and
+        not is_finger_extended(middle_tip, 9)):
+        return "thumbs_up"
+
+    # Thumbs down: Thumb extended down, other fingers folded
+    if (y[thumb_tip] > y[wrist] + 0.1 and
+        not is_finger_extended(index_tip, 5) and
+        not is_finger_extended(middle_tip, 9)):
+        return "thumbs_down"
+
+    # Peace sign: Index and middle fingers extended, others folded
+    if (is_finger_extended(index_tip, 5) and
+        is_finger_extended(middle_tip, 9) and
+        not is_finger_extended(ring_tip, 13) and
+        not is_finger_extended(pinky_tip, 17)):
+        return "peace_sign"
+
+    return None
+
+def classify_gesture_codes(landmarks, timestamps, smoothing_window=5, mirror_x=True, mirror_y=True):
+    """
+    Vectorized detect_hand_gesture() over a whole recording.
+
+    Args:
+        landmarks: (N, 21, 3) array of one hand's landmarks per frame.
+        timestamps: (N,) non-decreasing frame times in seconds (drives the fist hold timer).
+        smoothing_window, mirror_x, mirror_y: Same as detect_hand_gesture().
+
+    Returns:
+        (N,) int8 codes into GESTURE_LABELS, equal frame for frame to calling detect_hand_gesture()
+        on each frame in order, starting with no fist held and an empty smoothing history.
+    """
+    landmarks = np.asarray(landmarks, dtype=np.float64)
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    if landmarks.ndim != 3 or landmarks.shape[1] != 21 or landmarks.shape[2] < 2:
+        raise ValueError(f"expected (N, 21, 3) landmarks, got {landmarks.shape}")
+    if timestamps.shape != (len(landmarks),):
+        raise ValueError(f"expected {len(landmarks)} timestamps, got {timestamps.shape}")
+    if np.any(np.diff(timestamps) < 0):
+        raise ValueError("timestamps must be non-decreasing")
+
+    n = len(landmarks)
+    codes = np.zeros(n, dtype=np.int8)
+    if n == 0:
+        return codes
+
+    wrist = landmarks[:, WRIST]
+    index_tip = landmarks[:, INDEX_FINGER_TIP]
+    thumb_tip = landmarks[:, THUMB_TIP]
+    index_mcp = landmarks[:, INDEX_FINGER_MCP]
+
+    # Same arithmetic as the scalar version (pow, not sqrt) so threshold comparisons agree exactly
+    hand_size = np.power((wrist[:, 0] - index_mcp[:, 0]) ** 2 + (wrist[:, 1] - index_mcp[:, 1]) ** 2, 0.5)
+    distance_thumb_index = np.power((thumb_tip[:, 0] - index_tip[:, 0]) ** 2 + (thumb_tip[:, 1] - index_tip[:, 1]) ** 2, 0.5)
+    closed = distance_thumb_index < hand_size * 0.3
+
+    # Fist holds: one starts on a closed frame while none is active and ends on the first
+    # open frame at least 200ms later (that frame is classified as a direction again)
+    in_hold = np.zeros(n, dtype=bool)
+    hold_start_time = np.zeros(n)
+    closed_idx = np.flatnonzero(closed)
+    open_idx = np.flatnonzero(~closed)
+    open_times = timestamps[open_idx]
+    next_closed = 0
+    while next_closed < len(closed_idx):
+        start = closed_idx[next_closed]
+        start_time = timestamps[start]
+        k = int(np.searchsorted(open_times, start_time + 0.2))
+        # Settle on the exact scalar comparison, which can differ from the sum by rounding
+        while k > 0 and open_times[k - 1] - start_time >= 0.2:
+            k -= 1
+        while k < len(open_times) and open_times[k] - start_time < 0.2:
+            k += 1
+        end = open_idx[k] if k < len(open_idx) else n
+        in_hold[start:end] = True
+        hold_start_time[start:end] = start_time
+        next_closed = int(np.searchsorted(closed_idx, end))
+    codes[in_hold & closed & (timestamps - hold_start_time >= 2)] = GESTURE_LABELS.index("fist")
+
+    # Direction from wrist to index finger tip
+    wrist_x, wrist_y = wrist[:, 0], wrist[:, 1]
+    index_x, index_y = index_tip[:, 0], index_tip[:, 1]
+    if mirror_x:
+        wrist_x = 1.0 - wrist_x
+        index_x = 1.0 - index_x
+    if mirror_y:
+        wrist_y = 1.0 - wrist_y
+        index_y = 1.0 - index_y
+    dx = index_x - wrist_x
+    dy = index_y - wrist_y
+    angle = np.arctan2(dy, dx) * 180 / np.pi
+    magnitude = np.power(dx ** 2 + dy ** 2, 0.5)
+
+    # Frames that reach the smoothing step (small movements return early without voting)
+    voting = ~in_hold & ~(magnitude < hand_size * 0.5)
+    voting_idx = np.flatnonzero(voting)
+    angle = angle[voting_idx]
+    votes = np.select(
+        [(-45 <= angle) & (angle < 45), (45 <= angle) & (angle < 135), (135 <= angle) | (angle < -135), (-135 <= angle) & (angle < -45)],
+        [DIRECTIONS.index("left"), DIRECTIONS.index("up"), DIRECTIONS.index("right"), DIRECTIONS.index("down")],
+        default=-1,  # NaN angles vote None
+    )
+
+    # Sliding-window vote counts over the last smoothing_window votes, via cumulative sums
+    one_hot = np.zeros((len(votes) + 1, len(DIRECTIONS)), dtype=np.int64)
+    valid = np.flatnonzero(votes >= 0)
+    one_hot[valid + 1, votes[valid]] = 1
+    counts = np.cumsum(one_hot, axis=0)
+    upto = np.arange(1, len(votes) + 1)
+    window = counts[upto] - counts[np.maximum(upto - max(smoothing_window, 0), 0)]
+    best = np.argmax(window, axis=1)  # First maximum, i.e. DIRECTIONS order on ties
+    codes[voting_idx] = np.where(window.max(axis=1, initial=0) > 0, best + 2, 0)
+    return codes
+
+def classify_gestures(landmarks, timestamps, smoothing_window=5, mirror_x=True, mirror_y=True):
+    """Like classify_gesture_codes(), but returns an (N,) object array of labels (None, "fist", "left", ...)."""
+    codes = classify_gesture_codes(landmarks, timestamps, smoothing_window, mirror_x, mirror_y)
+    return np.array(GESTURE_LABELS, dtype=object)[codes]
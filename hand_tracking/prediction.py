@@ -0,0 +1,65 @@
+import math
+
+import numpy as np
+
+from hand_tracking.frame import HandFrame
+
+# Decides which camera frames get a MediaPipe run, spacing runs by measured inference latency
+class InferenceScheduler:
+    def __init__(self, target_fps=30.0, inference_budget=0.5, max_interval=4, smoothing=0.2):
+        self.target_fps = target_fps  # Camera frames per second we want tracking results for
+        self.inference_budget = inference_budget  # Share of each frame interval inference may use on average
+        self.max_interval = max_interval  # Never go longer than this many frames without a real result
+        self.smoothing = smoothing  # Weight of the newest latency sample in the running average
+        self.latency = None  # Average seconds per hands.process()
+        self.interval = 1  # Run inference on every interval-th frame
+        self._predicted_in_row = 0
+
+    def observe(self, latency):
+        """Feed one measured inference time and re-pick the interval."""
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self.smoothing * (latency - self.latency)
+        frame_budget = self.inference_budget / self.target_fps
+        self.interval = max(1, min(self.max_interval, math.ceil(self.latency / frame_budget)))
+
+    def should_infer(self, can_predict):
+        """True if this frame should run MediaPipe; otherwise its landmarks are predicted."""
+        if not can_predict or self._predicted_in_row + 1 >= self.interval:
+            self._predicted_in_row = 0
+            return True
+        self._predicted_in_row += 1
+        return False
+
+# Constant-velocity extrapolation of each hand's landmarks from the last real HandFrame
+class LandmarkPredictor:
+    def __init__(self, velocity_smoothing=0.5, max_extrapolation=0.25):
+        self.velocity_smoothing = velocity_smoothing  # Weight of the newest velocity (damps landmark jitter)
+        self.max_extrapolation = max_extrapolation  # Seconds past the last result we are willing to predict
+        self.frame = None  # Last real HandFrame
+        self.velocity = None  # (H, 21, 3) landmark velocity per second, matched to frame's hands
+
+    def update(self, frame):
+        """Take a real (inferred) HandFrame as the new base for predictions."""
+        velocity = np.zeros(frame.landmarks.shape, dtype=np.float64)
+        previous = self.frame
+        if previous is not None and frame.capture_time > previous.capture_time and len(previous):
+            dt = frame.capture_time - previous.capture_time
+            previous_index = {key: i for i, key in enumerate(previous.hand_keys())}  # Match hands by handedness
+            for i, key in enumerate(frame.hand_keys()):
+                j = previous_index.get(key)
+                if j is not None:
+                    measured = (frame.landmarks[i].astype(np.float64) - previous.landmarks[j]) / dt
+                    velocity[i] = self.velocity_smoothing * measured + (1 - self.velocity_smoothing) * self.velocity[j]
+        self.frame = frame
+        self.velocity = velocity
+
+    def can_predict(self, capture_time):
+        return self.frame is not None and len(self.frame) > 0 and 0 <= capture_time - self.frame.capture_time <= self.max_extrapolation
+
+    def predict(self, capture_time):
+        """HandFrame with every hand moved to capture_time."""
+        frame = self.frame
+        landmarks = (frame.landmarks + self.velocity * (capture_time - frame.capture_time)).astype(np.float32)
+        return HandFrame(landmarks, frame.handedness, frame.scores, capture_time, predicted=True)
@@ -0,0 +1,225 @@
+import os
+import struct
+import time
+
+import numpy as np
+
+# On-disk layout (.npz), one row per processed camera frame and one row per detected hand:
+#   timestamps  (F,)        float64  capture time of each frame
+#   hand_counts (F,)        uint8    hands detected in each frame
+#   landmarks   (H, 21, 3)  float32  normalized x, y, z of every hand, frames concatenated in order
+#   handedness  (H,)        uint8    0 = "Left", 1 = "Right" (MediaPipe's labels)
+#   scores      (H,)        float32  handedness confidence
+#
+# While recording, frames are appended to <path>.part in chunks: a STREAM_MAGIC + uint32 version
+# header, then per chunk uint32 frame and hand counts followed by the same five arrays' raw bytes.
+# close() turns it into the .npz; after a crash the .part file is kept and replays as it is.
+FORMAT_VERSION = 1
+NUM_LANDMARKS = 21
+HANDEDNESS_LABELS = ("Left", "Right")
+STREAM_MAGIC = b"CVLM"
+CHUNK_FRAMES = 120  # Frames buffered in memory before they are appended to disk (~4 s at 30 fps)
+_CHUNK_HEADER = struct.Struct("<II")
+
+def load_recording(path):
+    """The five arrays of a recording, from a finished .npz or a .part stream (a cut-off last chunk is dropped)."""
+    with open(path, "rb") as f:
+        stream = f.read() if f.read(len(STREAM_MAGIC)) == STREAM_MAGIC else None
+    if stream is None:
+        with np.load(path) as data:
+            version = int(data["version"]) if "version" in data else FORMAT_VERSION
+            if version != FORMAT_VERSION:
+                raise ValueError(f"{path}: unsupported landmark recording version {version}")
+            return {key: data[key] for key in ("timestamps", "hand_counts", "landmarks", "handedness", "scores")}
+
+    (version,) = struct.unpack_from("<I", stream)
+    if version != FORMAT_VERSION:
+        raise ValueError(f"{path}: unsupported landmark recording version {version}")
+    chunks = {"timestamps": [], "hand_counts": [], "landmarks": [], "handedness": [], "scores": []}
+    offset = 4
+    while offset + _CHUNK_HEADER.size <= len(stream):
+        frames, hands = _CHUNK_HEADER.unpack_from(stream, offset)
+        layout = (("timestamps", np.float64, (frames,)), ("hand_counts", np.uint8, (frames,)),
+                  ("landmarks", np.float32, (hands, NUM_LANDMARKS, 3)), ("handedness", np.uint8, (hands,)),
+                  ("scores", np.float32, (hands,)))
+        size = sum(np.dtype(dtype).itemsize * int(np.prod(shape)) for _, dtype, shape in layout)
+        if offset + _CHUNK_HEADER.size + size > len(stream):
+            break  # Written when the recording stopped
+        offset += _CHUNK_HEADER.size
+        for key, dtype, shape in layout:
+            count = int(np.prod(shape))
+            chunks[key].append(np.frombuffer(stream, dtype, count, offset).reshape(shape))
+            offset += np.dtype(dtype).itemsize * count
+    empty = {"timestamps": np.zeros(0, np.float64), "hand_counts": np.zeros(0, np.uint8),
+             "landmarks": np.zeros((0, NUM_LANDMARKS, 3), np.float32), "handedness": np.zeros(0, np.uint8),
+             "scores": np.zeros(0, np.float32)}
+    return {key: np.concatenate(arrays) if arrays else empty[key] for key, arrays in chunks.items()}
+
+# Writes every frame's MediaPipe hand landmarks to a compact .npz, streaming them to disk as it goes
+class LandmarkRecorder:
+    def __init__(self, path, chunk_frames=CHUNK_FRAMES):
+        self.path = path
+        self.stream_path = path + ".part"
+        self.chunk_frames = chunk_frames
+        self.frames_written = 0
+        self._stream = open(self.stream_path, "wb")
+        self._stream.write(STREAM_MAGIC + struct.pack("<I", FORMAT_VERSION))
+        self._clear_chunk()
+
+    def _clear_chunk(self):
+        self.timestamps = []
+        self.hand_counts = []
+        self.landmarks = []  # (H, 21, 3) float32 per frame
+        self.handedness = []
+        self.scores = []
+
+    def record(self, frame):
+        """Append one HandFrame (frames without hands are kept too)."""
+        self.timestamps.append(frame.capture_time)
+        self.hand_counts.append(len(frame))
+        if len(frame):
+            self.landmarks.append(frame.landmarks)
+            self.scores.append(frame.scores)
+            labels = frame.handedness or ("Left",) * len(frame)
+            self.handedness.append([HANDEDNESS_LABELS.index(label) if label in HANDEDNESS_LABELS else 0 for label in labels])
+        if len(self.timestamps) >= self.chunk_frames:
+            self.flush()
+
+    def flush(self):
+        """Append the buffered frames to the .part stream."""
+        if not self.timestamps:
+            return
+        landmarks = np.concatenate(self.landmarks) if self.landmarks else np.zeros((0, NUM_LANDMARKS, 3))
+        scores = np.concatenate(self.scores) if self.scores else np.zeros(0)
+        self._stream.write(_CHUNK_HEADER.pack(len(self.timestamps), len(landmarks)))
+        self._stream.write(np.asarray(self.timestamps, dtype=np.float64).tobytes())
+        self._stream.write(np.asarray(self.hand_counts, dtype=np.uint8).tobytes())
+        self._stream.write(np.ascontiguousarray(landmarks, dtype=np.float32).tobytes())
+        self._stream.write(np.array([side for sides in self.handedness for side in sides], dtype=np.uint8).tobytes())
+        self._stream.write(np.asarray(scores, dtype=np.float32).tobytes())
+        self._stream.flush()  # On disk even if the process dies before close()
+        self.frames_written += len(self.timestamps)
+        self._clear_chunk()
+
+    def frame_count(self):
+        return self.frames_written + len(self.timestamps)
+
+    def close(self):
+        """Write the recording; returns the number of frames saved."""
+        self.flush()
+        self._stream.close()
+        data = load_recording(self.stream_path)
+        np.savez_compressed(self.path, version=np.array(FORMAT_VERSION), **data)
+        os.remove(self.stream_path)
+        return self.frame_count()
+
+# Minimal stand-ins for the MediaPipe result types the games read (and drawing_utils draws)
+class ReplayLandmark:
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x, y, z):
+        self.x, self.y, self.z = x, y, z
+
+    def HasField(self, name):
+        return False  # No visibility/presence recorded, so drawing_utils draws every point
+
+class ReplayLandmarkList:
+    def __init__(self, points):
+        self.landmark = [ReplayLandmark(float(x), float(y), float(z)) for x, y, z in points]
+
+class ReplayCategory:
+    def __init__(self, index, label, score):
+        self.index, self.label, self.score = index, label, score
+
+class ReplayClassificationList:
+    def __init__(self, category):
+        self.classification = [category]
+
+class ReplayResults:
+    def __init__(self, multi_hand_landmarks, multi_handedness, capture_time):
+        self.multi_hand_landmarks = multi_hand_landmarks  # None when no hands, like MediaPipe
+        self.multi_handedness = multi_handedness
+        self.capture_time = capture_time  # Timestamp from the recording
+
+# Replay backend, a drop-in for mp.solutions.hands.Hands: process() returns the next recorded frame instead of running inference
+class ReplayHands:
+    name = "replay"
+
+    def __init__(self, path, loop=True):
+        data = load_recording(path)  # A finished .npz, or the .part stream a crashed session left
+        self.timestamps = data["timestamps"]
+        self.hand_counts = data["hand_counts"]
+        self.landmarks = data["landmarks"]
+        self.handedness = data["handedness"]
+        self.scores = data["scores"]
+        self.loop = loop  # Start over at the end; otherwise keep returning empty results
+        self.offsets = np.concatenate(([0], np.cumsum(self.hand_counts, dtype=np.int64)))  # First hand row of each frame
+        self.frames_replayed = 0
+        self._index = 0
+        self._time_offset = 0.0  # Added to the recorded times on each loop so time never runs backwards
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def process(self, image=None):
+        """Return the next recorded result; the image is ignored."""
+        if self._index >= len(self):
+            if not self.loop or len(self) == 0:
+                return ReplayResults(None, None, None)
+            self._index = 0
+            self._time_offset += self.duration()
+        results = self.frame(self._index)
+        if results.capture_time is not None:
+            results.capture_time += self._time_offset
+        self._index += 1
+        self.frames_replayed += 1
+        return results
+
+    def duration(self):
+        """Seconds from the first recorded frame to one frame past the last (how far each loop moves time on)."""
+        if len(self) < 2:
+            return 1 / 30
+        return float(self.timestamps[-1] - self.timestamps[0] + np.median(np.diff(self.timestamps)))
+
+    def frame(self, index):
+        """Recorded result of one frame, as MediaPipe would have returned it."""
+        start, end = self.offsets[index], self.offsets[index + 1]
+        if start == end:
+            return ReplayResults(None, None, float(self.timestamps[index]))
+        hands = [ReplayLandmarkList(points) for points in self.landmarks[start:end]]
+        handedness = [
+            ReplayClassificationList(ReplayCategory(int(side), HANDEDNESS_LABELS[side], float(score)))
+            for side, score in zip(self.handedness[start:end], self.scores[start:end])
+        ]
+        return ReplayResults(hands, handedness, float(self.timestamps[index]))
+
+    def close(self):
+        pass  # Same interface as Hands.close()
+
+# Black frames behind the cv2.VideoCapture interface (read/isOpened/release/set): the camera stand-in
+# for --replay, where the recorded landmarks replace inference and the webcam is not opened
+class BlankFrameSource:
+    def __init__(self, width=640, height=480, fps=30.0):
+        self.fps = fps  # Reads are paced like a camera at this rate; 0 reads as fast as possible
+        self.frames_read = 0
+        self._frame = np.zeros((height, width, 3), dtype=np.uint8)
+        self._next_read = 0
+
+    def isOpened(self):
+        return True
+
+    def read(self):
+        """(True, black BGR frame), after waiting for the next frame slot."""
+        if self.fps:
+            now = time.perf_counter()
+            if now < self._next_read:
+                time.sleep(self._next_read - now)
+            self._next_read = max(now, self._next_read) + 1.0 / self.fps
+        self.frames_read += 1
+        return True, self._frame.copy()  # Callers may draw on it
+
+    def set(self, prop, value):
+        return False  # Resolution and the like are fixed
+
+    def release(self):
+        pass
@@ -0,0 +1,56 @@
+# Region of interest for inference: a padded box around the hands found in the previous frame.
+# Coordinates are in the tracker's mirrored + rotated frame ("oriented"), where flip(1) followed
+# by a 90-degree counter-clockwise rotation is exactly a transpose of the camera frame.
+class HandRoi:
+    def __init__(self, padding=0.5, min_size=96, max_area=0.6, refresh_interval=15):
+        self.padding = padding  # Extra margin on each side, as a share of the hand box's longer side
+        self.min_size = min_size  # Smallest crop side in camera pixels
+        self.max_area = max_area  # Above this share of the frame, a full-frame pass is just as good
+        self.refresh_interval = refresh_interval  # Every this many frames a full-frame pass looks for new hands
+        self.box = None  # (x0, y0, x1, y1) normalized box of the last tracked hands, None when lost
+        self._crops = 0  # Crops since the last full-frame pass
+
+    def region(self, frame_shape):
+        """(x0, y0, x1, y1) crop in oriented pixels for the next frame, or None for full-frame detection."""
+        if self.box is None or self._crops + 1 >= self.refresh_interval:
+            self._crops = 0
+            return None  # A hand that entered outside the crop would never be found otherwise
+        width, height = frame_shape[0], frame_shape[1]  # Oriented size = transposed camera size
+        x0, y0, x1, y1 = self.box
+        side = max((x1 - x0) * width, (y1 - y0) * height)
+        side = max(side * (1 + 2 * self.padding), self.min_size)
+        if side * side > self.max_area * width * height:
+            self._crops = 0
+            return None
+        center_x, center_y = (x0 + x1) / 2 * width, (y0 + y1) / 2 * height
+        left = int(max(0, min(center_x - side / 2, width - side)))
+        top = int(max(0, min(center_y - side / 2, height - side)))
+        self._crops += 1
+        return left, top, int(min(width, left + side)), int(min(height, top + side))
+
+    def crop(self, frame, region):
+        """Oriented native-resolution patch of a camera frame for the given region."""
+        import cv2
+        left, top, right, bottom = region
+        # Oriented x is the camera row and oriented y the camera column
+        return cv2.transpose(frame[left:right, top:bottom])
+
+    def to_frame(self, frame, region, frame_shape):
+        """Rewrite a HandFrame's landmarks from crop-normalized to full-frame-normalized coordinates, in place."""
+        width, height = frame_shape[0], frame_shape[1]
+        left, top, right, bottom = region
+        scale_x, scale_y = (right - left) / width, (bottom - top) / height
+        landmarks = frame.landmarks
+        landmarks[..., 0] = left / width + landmarks[..., 0] * scale_x
+        landmarks[..., 1] = top / height + landmarks[..., 1] * scale_y
+        landmarks[..., 2] *= scale_x  # z uses the same scale as x
+        frame.clear_results()
+
+    def track(self, frame):
+        """Remember where the hands are for the next frame's crop (forget them when lost)."""
+        if frame is None or not len(frame):
+            self.box = None
+            return
+        low = frame.landmarks[..., :2].reshape(-1, 2).min(axis=0)
+        high = frame.landmarks[..., :2].reshape(-1, 2).max(axis=0)
+        self.box = (max(0.0, float(low[0])), max(0.0, float(low[1])), min(1.0, float(high[0])), min(1.0, float(high[1])))
@@ -0,0 +1,195 @@
+import threading
+import time
+
+from frame_timing import trace
+from hand_tracking.backends import create_backend
+from hand_tracking.frame import HandFrame
+from hand_tracking.prediction import LandmarkPredictor
+
+# Stand-in for a StageTimer when nobody is measuring the tracker
+class _NoTimer:
+    def begin_frame(self):
+        pass
+
+    def lap(self, stage):
+        pass
+
+    def end_frame(self):
+        pass
+
+# The one place frames become landmarks: preprocessing, inference (or prediction), ROI cropping and
+# recording. Use process() from a game loop, or start() to run it on a thread fed by a frame bus.
+class HandTracker:
+    def __init__(self, backend, recorder=None, scheduler=None, roi=None, timer=None, resize=(320, 240), flip=True, rotate=True,
+                 roi_backend=None):
+        if roi is not None and not (flip and rotate):
+            raise ValueError("ROI cropping assumes the mirrored, rotated tracker frame (flip=True, rotate=True)")
+        self.backend = backend  # MediaPipe, replay or synthetic (see hand_tracking/backends.py)
+        self.recorder = recorder  # Optional LandmarkRecorder fed every real (inferred) frame
+        self.scheduler = scheduler  # Optional InferenceScheduler; None runs inference on every frame
+        self.predictor = LandmarkPredictor() if scheduler is not None else None
+        self.roi = roi  # Optional HandRoi; None always runs on the (downscaled) full frame
+        # Graph for the crops, so its tracking state never mixes crop and full-frame geometry
+        self.roi_backend = roi_backend if roi_backend is not None else backend
+        self.timer = timer if timer is not None else _NoTimer()  # Per-stage times (StageTimer-like)
+        self.resize = resize  # Full-frame inference size, None for native resolution
+        self.flip = flip  # Mirror horizontally
+        self.rotate = rotate  # Rotate 90 degrees counter-clockwise (the Mars game's camera mounting)
+        self.inferences = 0  # Frames that ran backend.process()
+        self.roi_inferences = 0  # ...of which found the hands in the native-resolution crop
+        self.roi_misses = 0  # Crops that lost the hand and fell back to full-frame detection
+        self.extrapolations = 0  # Frames whose landmarks were predicted instead
+        self.failed = False  # Set when the frame bus stops delivering frames
+        self._recorded_offset = 0.0  # Recorded minus live time at the last replayed inference, for predicted frames
+        self._latest = None  # Only the newest HandFrame is kept
+        self._lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+    def process(self, frame, capture_time=None):
+        """Track hands in one BGR camera frame; returns a HandFrame (also available from latest())."""
+        if capture_time is None:
+            capture_time = time.time()
+        predictor_time = capture_time + self._recorded_offset  # On the recording's clock when replaying
+        predicted = self.scheduler is not None and not self.scheduler.should_infer(self.predictor.can_predict(predictor_time))
+        if predicted:
+            hand_frame = self.predictor.predict(predictor_time)
+            self.extrapolations += 1
+            self.timer.lap("prediction")
+        else:
+            inference_start = time.perf_counter()
+            hand_frame = self._infer(frame, capture_time)
+            self.inferences += 1
+            if self.scheduler is not None:
+                self.scheduler.observe(time.perf_counter() - inference_start)
+                self.predictor.update(hand_frame)
+            if self.recorder is not None:
+                self.recorder.record(hand_frame)
+
+        with self._lock:
+            self._latest = hand_frame
+        return hand_frame
+
+    def start(self, frame_bus):
+        """Run capture + process() on a daemon thread; frame_bus.read() returns (ret, frame, capture_time)."""
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, args=(frame_bus,), name="HandTracker", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the worker and wait for it so the camera and backend can be released safely."""
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def close(self):
+        self.stop()
+        self.backend.close()
+        if self.roi_backend is not self.backend:
+            self.roi_backend.close()
+
+    def extrapolation_rate(self):
+        """Share of processed frames whose landmarks were predicted rather than inferred."""
+        total = self.inferences + self.extrapolations
+        return self.extrapolations / total if total else 0.0
+
+    def latest(self):
+        """Return the newest HandFrame (or None) without blocking on the camera."""
+        with self._lock:
+            return self._latest
+
+    def _run(self, frame_bus):
+        while self._running:
+            self.timer.begin_frame()
+            ret, frame, capture_time = frame_bus.read()
+            self.timer.lap("capture")
+            if not ret:
+                print("Error: Failed to capture frame.")
+                self.failed = True
+                break
+            self.process(frame, capture_time)
+            self.timer.end_frame()
+
+    def _full_frame_rgb(self, frame):
+        import cv2  # Kept out of module import; games load it during startup
+        if self.resize is not None:
+            frame = cv2.resize(frame, self.resize)  # Downscaled copy for inference; the caller keeps the original
+        if self.flip:
+            frame = cv2.flip(frame, 1)  # Flip horizontally for mirroring
+        if self.rotate:
+            frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)  # Fix 90-degree rotation
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+
+    def _frame_from_results(self, results, capture_time, image):
+        """HandFrame for a backend result, timed by the recording when the backend replays one."""
+        recorded_time = getattr(results, "capture_time", None)
+        if recorded_time is not None:
+            self._recorded_offset = recorded_time - capture_time
+            capture_time = recorded_time  # Gesture timers then follow the recording, not the replay speed
+        return HandFrame.from_results(results, capture_time, image)
+
+    def _infer(self, frame, capture_time):
+        """Run the ROI backend on the hand crop when one is known, else (or when the hand is lost) the backend on the whole frame."""
+        import cv2
+        region = self.roi.region(frame.shape) if self.roi is not None else None
+        if region is not None:
+            crop_rgb = cv2.cvtColor(self.roi.crop(frame, region), cv2.COLOR_BGR2RGB)
+            self.timer.lap("roi_preprocess")
+            with trace.span("hands.process", roi=True):
+                results = self.roi_backend.process(crop_rgb)
+            self.timer.lap("roi_inference")
+            if results.multi_hand_landmarks:
+                hand_frame = self._frame_from_results(results, capture_time, crop_rgb)
+                self.roi.to_frame(hand_frame, region, frame.shape)
+                self.roi.track(hand_frame)
+                self.roi_inferences += 1
+                return hand_frame
+            self.roi_misses += 1
+
+        frame_rgb = self._full_frame_rgb(frame)
+        self.timer.lap("preprocess")
+        with trace.span("hands.process"):
+            results = self.backend.process(frame_rgb)
+        self.timer.lap("inference")
+        hand_frame = self._frame_from_results(results, capture_time, frame_rgb)
+        if self.roi is not None:
+            self.roi.track(hand_frame)
+        return hand_frame
+
+# Single tracker per process, shared by every gesture consumer
+_tracker = None
+_tracker_lock = threading.Lock()
+
+def get_tracker(backend="mediapipe", backend_options=None, **tracker_options):
+    """
+    Return the process-wide HandTracker, creating it on first use.
+
+    Args:
+        backend: Backend name ("mediapipe", "replay", "synthetic") or a backend object.
+        backend_options: Keyword arguments for the backend (e.g. {"path": ...} for replay).
+        **tracker_options: Keyword arguments for HandTracker.
+
+    Later calls return the same tracker and ignore their arguments, so there is only ever one
+    tracker and one inference per frame in the process. With a roi, a backend named by string
+    gets a second graph for the crops.
+    """
+    global _tracker
+    with _tracker_lock:
+        if _tracker is None:
+            if isinstance(backend, str):
+                if tracker_options.get("roi") is not None and tracker_options.get("roi_backend") is None:
+                    tracker_options["roi_backend"] = create_backend(backend, **(backend_options or {}))
+                backend = create_backend(backend, **(backend_options or {}))
+            _tracker = HandTracker(backend, **tracker_options)
+        return _tracker
+
+def close_tracker():
+    """Stop and release the process-wide tracker (the next get_tracker() builds a new one)."""
+    global _tracker
+    with _tracker_lock:
+        if _tracker is not None:
+            _tracker.close()
+            _tracker = None
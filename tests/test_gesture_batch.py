@@ -0,0 +1,47 @@
+import os
+import sys
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))  # Shared hand_tracking package
+
+import numpy as np
+import hand_tracking.gestures as hand_gestures
+from hand_tracking import GESTURE_LABELS, HandFrame, LandmarkRecorder, classify_gesture_codes, detect_hand_gesture
+from hand_tracking.recording import ReplayHands, ReplayLandmarkList
+
+def random_session(frames, seed):
+    """Random hand poses at ~30 fps with fist holds and uneven timestamps."""
+    rng = np.random.default_rng(seed)
+    landmarks = rng.random((frames, 21, 3)).astype(np.float32)
+    closed = np.repeat(rng.random(frames // 40 + 1) < 0.4, 40)[:frames]  # Fist runs of 40 frames
+    landmarks[closed, hand_gestures.THUMB_TIP] = landmarks[closed, hand_gestures.INDEX_FINGER_TIP]
+    steps = rng.choice([0.0, 1 / 30, 1 / 15, 2.0], size=frames, p=[0.05, 0.75, 0.15, 0.05])
+    return landmarks, 1000.0 + np.cumsum(steps)
+
+def scalar_gestures(landmarks, timestamps):
+    """detect_hand_gesture() frame by frame, from a fresh state."""
+    hand_gestures.fist_held = False
+    hand_gestures.last_fist_time = 0
+    prev_gestures = []
+    return [detect_hand_gesture(ReplayLandmarkList(points), prev_gestures, now=float(now))
+            for points, now in zip(landmarks, timestamps)]
+
+def batch_gestures(landmarks, timestamps):
+    return [GESTURE_LABELS[code] for code in classify_gesture_codes(landmarks, timestamps)]
+
+def test_batch_matches_scalar(tmp_path):
+    landmarks, timestamps = random_session(3000, seed=13)
+    expected = scalar_gestures(landmarks, timestamps)
+    assert set(expected) >= {None, "fist", "left", "right", "up", "down"}  # Every gesture is exercised
+    assert batch_gestures(landmarks, timestamps) == expected
+
+    # The same session saved as a --record recording and read back, as a recorded set is checked
+    path = str(tmp_path / "session.npz")
+    recorder = LandmarkRecorder(path)
+    for points, now in zip(landmarks, timestamps):
+        recorder.record(HandFrame(points[None], ("Right",), np.ones(1, dtype=np.float32), float(now)))
+    recorder.close()
+    replay = ReplayHands(path)
+    recorded = replay.landmarks[replay.offsets[:-1][replay.hand_counts > 0]]
+    recorded_times = replay.timestamps[replay.hand_counts > 0]
+    assert len(recorded) == len(landmarks)
+    assert batch_gestures(recorded, recorded_times) == scalar_gestures(recorded, recorded_times)